@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Toplantılar arası analiz deposu (SQLite, gömülü).
+
+Her çalıştırmadan sonra toplantının katılımcı bazlı özetleri, dakikalık (downsample)
+ilgi serileri ve konuşmacı özetleri tek bir veritabanına eklenir. Böylece "son 50
+toplantıda ilgi nasıl değişti" sorusu 50 evaluation.json indirip ayrıştırmak yerine
+indeksli tek bir sorgu ile cevaplanır.
+
+Kullanım:
+  python analytics_store.py ingest                      # latest_meeting.json + evaluation.json (+ meeting_engagement.json, report_timing.json)
+  python analytics_store.py trend --last 50             # tarih sırasıyla ilgi trendi (tek sorgu)
+  python analytics_store.py trend --prefix hf --participant katilimci_1 --since 2026-01-01 -o trend_report.md
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from get_latest_meeting import parse_folder_name
+
+DB_PATH = Path(os.environ.get("SENSE_ANALYTICS_DB", "analytics/sense_analytics.db"))
+EVALUATION_JSON = Path("evaluation.json")
+LATEST_MEETING_JSON = Path("latest_meeting.json")
+ENGAGEMENT_JOIN_JSON = Path("meeting_engagement.json")
+REPORT_TIMING_JSON = Path("report_timing.json")
+
+LABELS_EN = ["boredom", "confusion", "engagement", "frustration"]
+ENGAGEMENT_IDX = 2
+FRAME_INTERVAL_SEC = 0.5  # evaluation.json'da frameInterval yoksa
+SERIES_BUCKET_SEC = 60.0  # seriler dakikalık ortalamaya indirgenir
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    folder        TEXT PRIMARY KEY,
+    meeting_date  TEXT NOT NULL,
+    meeting_time  TEXT NOT NULL DEFAULT '',
+    participants  INTEGER NOT NULL,
+    duration_sec  REAL NOT NULL,
+    ingested_at   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_meetings_date ON meetings (meeting_date, meeting_time);
+
+CREATE TABLE IF NOT EXISTS participant_stats (
+    folder           TEXT NOT NULL REFERENCES meetings (folder) ON DELETE CASCADE,
+    participant      TEXT NOT NULL,
+    frame_count      INTEGER NOT NULL,
+    mean_engagement  REAL,
+    boredom          REAL,
+    confusion        REAL,
+    engagement       REAL,
+    frustration      REAL,
+    PRIMARY KEY (folder, participant)
+);
+CREATE INDEX IF NOT EXISTS idx_participant ON participant_stats (participant, folder);
+
+CREATE TABLE IF NOT EXISTS engagement_series (
+    folder           TEXT NOT NULL REFERENCES meetings (folder) ON DELETE CASCADE,
+    participant      TEXT NOT NULL,
+    bucket           INTEGER NOT NULL,
+    mean_engagement  REAL NOT NULL,
+    PRIMARY KEY (folder, participant, bucket)
+);
+
+CREATE TABLE IF NOT EXISTS speaker_stats (
+    folder           TEXT NOT NULL REFERENCES meetings (folder) ON DELETE CASCADE,
+    speaker          TEXT NOT NULL,
+    segments         INTEGER NOT NULL,
+    duration_sec     REAL NOT NULL,
+    mean_engagement  REAL,
+    PRIMARY KEY (folder, speaker)
+);
+
+-- Pipeline başlangıcından ilk (ön) ve son raporun yayınlanmasına kadar geçen süre
+CREATE TABLE IF NOT EXISTS report_timing (
+    folder               TEXT PRIMARY KEY REFERENCES meetings (folder) ON DELETE CASCADE,
+    first_report_sec     REAL,
+    final_report_sec     REAL,
+    provisional_reports  INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Trend: toplantı başına frame ağırlıklı ortalamalar. {where} sadece verilen filtrelerden
+# kurulur ("? IS NULL OR ..." kalıbı SQLite'ın indeks seçimini engeller).
+TREND_SQL = """
+SELECT m.folder, m.meeting_date, m.meeting_time,
+       COUNT(p.participant)                                         AS participants,
+       SUM(p.frame_count)                                           AS frames,
+       SUM(p.mean_engagement * p.frame_count) / SUM(p.frame_count)  AS mean_engagement,
+       SUM(p.boredom * p.frame_count) / SUM(p.frame_count)          AS boredom,
+       SUM(p.confusion * p.frame_count) / SUM(p.frame_count)        AS confusion,
+       SUM(p.engagement * p.frame_count) / SUM(p.frame_count)       AS engagement,
+       SUM(p.frustration * p.frame_count) / SUM(p.frame_count)      AS frustration,
+       r.first_report_sec, r.final_report_sec
+FROM meetings m
+JOIN participant_stats p ON p.folder = m.folder
+LEFT JOIN report_timing r ON r.folder = m.folder
+WHERE {where}
+GROUP BY m.folder
+ORDER BY m.meeting_date DESC, m.meeting_time DESC, m.folder DESC
+LIMIT :last
+"""
+TREND_FILTERS = {
+    "since": "m.meeting_date >= :since",
+    "until": "m.meeting_date <= :until",
+    # Önek aralık sorgusu olarak: LIKE 'x%' birincil anahtar indeksini kullanamaz
+    "prefix": "m.folder >= :prefix AND m.folder < :prefix || char(1114111)",
+    "participant": "p.participant = :participant",
+}
+
+
+def connect(path: Path = DB_PATH) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def participant_rows(video_name: str, data: dict, interval: float = FRAME_INTERVAL_SEC) -> tuple[tuple, list[tuple]]:
+    """Bir katılımcının özet satırı ve dakikalık seri satırları."""
+    frames = data.get("frames") or []
+    summary = data.get("summary") or {}
+    n = data.get("frameCount") or len(frames)
+    eng = [float((f.get("scores") or [0] * 4)[ENGAGEMENT_IDX]) for f in frames]
+    mean_eng = sum(eng) / len(eng) if eng else None
+    ratios = [(summary.get(label) or 0) / n if n else None for label in LABELS_EN]
+
+    per_bucket = max(1, int(SERIES_BUCKET_SEC / interval))
+    series = []
+    for b in range(0, len(eng), per_bucket):
+        chunk = eng[b: b + per_bucket]
+        series.append((b // per_bucket, sum(chunk) / len(chunk)))
+    return (video_name, n, mean_eng, *ratios), series
+
+
+def ingest(conn: sqlite3.Connection, meta: dict, eval_data: dict, join_data: dict | None = None,
+           timing: dict | None = None) -> str:
+    """Toplantıyı (varsa önce silip) ekler; aynı klasör tekrar işlenirse güncellenir."""
+    folder = (meta.get("latest_folder") or "").strip()
+    if not folder:
+        raise ValueError("latest_folder bilgisi yok")
+    parsed = parse_folder_name(folder)
+    date, hour = (parsed[0], parsed[1]) if parsed else ("", "")
+    videos = eval_data.get("videos") or {}
+    interval = eval_data.get("frameInterval") or FRAME_INTERVAL_SEC
+    max_frames = max((v.get("frameCount") or 0 for v in videos.values()), default=0)
+
+    with conn:
+        conn.execute("DELETE FROM meetings WHERE folder = ?", (folder,))
+        conn.execute(
+            "INSERT INTO meetings (folder, meeting_date, meeting_time, participants, duration_sec, ingested_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (folder, date, hour, len(videos), max_frames * interval, time.strftime("%Y-%m-%dT%H:%M:%S")),
+        )
+        for video_name, data in sorted(videos.items()):
+            row, series = participant_rows(video_name, data, interval)
+            conn.execute("INSERT INTO participant_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (folder, *row))
+            conn.executemany(
+                "INSERT INTO engagement_series VALUES (?, ?, ?, ?)",
+                [(folder, video_name, b, v) for b, v in series],
+            )
+        for speaker, sp in ((join_data or {}).get("speakers") or {}).items():
+            conn.execute(
+                "INSERT INTO speaker_stats VALUES (?, ?, ?, ?, ?)",
+                (folder, speaker, sp.get("segments") or 0, sp.get("duration_sec") or 0.0, sp.get("engagement")),
+            )
+        if timing and (timing.get("first_report_sec") is not None or timing.get("final_report_sec") is not None):
+            conn.execute(
+                "INSERT INTO report_timing VALUES (?, ?, ?, ?)",
+                (folder, timing.get("first_report_sec"), timing.get("final_report_sec"),
+                 timing.get("provisional_reports") or 0),
+            )
+    # Tablo istatistiklerini güncel tutar; tarih aralığı sorgularında indeks seçimi buna dayanır
+    conn.execute("PRAGMA optimize")
+    return folder
+
+
+def trend(conn: sqlite3.Connection, last: int = 50, since: str | None = None, until: str | None = None,
+          prefix: str | None = None, participant: str | None = None) -> list[dict]:
+    """Son `last` toplantının ilgi trendi, eskiden yeniye sıralı."""
+    params = {"since": since, "until": until, "prefix": prefix, "participant": participant}
+    clauses = ["p.frame_count > 0"] + [TREND_FILTERS[k] for k, v in params.items() if v is not None]
+    rows = conn.execute(TREND_SQL.format(where=" AND ".join(clauses)), {**params, "last": last}).fetchall()
+    return [dict(r) for r in reversed(rows)]
+
+
+def trend_markdown(rows: list[dict], filters: dict) -> str:
+    active = ", ".join(f"{k}={v}" for k, v in filters.items() if v is not None)
+    lines = [
+        "# İlgi trendi (toplantılar arası)",
+        "",
+        f"**Toplantı sayısı:** {len(rows)}" + (f"  \n**Filtre:** {active}" if active else ""),
+        "",
+        "| Tarih | Saat | Klasör | Katılımcı | Ort. ilgi skoru | Düşük ilgi | Kafa karışıklığı | İlgili / odaklı | Hayal kırıklığı "
+        "| İlk rapor (sn) |",
+        "|-------|------|--------|-----------|-----------------|------------|------------------|-----------------|-----------------"
+        "|----------------|",
+    ]
+
+    def pct(v):
+        return f"%{100 * v:.0f}" if v is not None else "—"
+
+    for r in rows:
+        eng = f"{r['mean_engagement']:.2f}" if r["mean_engagement"] is not None else "—"
+        first = f"{r['first_report_sec']:.0f}" if r["first_report_sec"] is not None else "—"
+        lines.append(
+            f"| {r['meeting_date']} | {r['meeting_time'].replace('-', ':')} | `{r['folder']}` | {r['participants']} | {eng} | "
+            f"{pct(r['boredom'])} | {pct(r['confusion'])} | {pct(r['engagement'])} | {pct(r['frustration'])} | "
+            f"{first} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def load_json(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Toplantılar arası analiz deposu (SQLite).")
+    parser.add_argument("--db", default=str(DB_PATH), help="Veritabanı yolu (SENSE_ANALYTICS_DB)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("ingest", help="Son çalıştırmanın sonuçlarını ekler")
+    t = sub.add_parser("trend", help="İlgi trendi raporu")
+    t.add_argument("--last", type=int, default=50, help="En son kaç toplantı")
+    t.add_argument("--since", help="Başlangıç tarihi (YYYY-MM-DD)")
+    t.add_argument("--until", help="Bitiş tarihi (YYYY-MM-DD)")
+    t.add_argument("--prefix", help="Klasör adı öneki")
+    t.add_argument("--participant", help="Sadece bu katılımcı (video adı)")
+    t.add_argument("--format", choices=("md", "json"), default="md")
+    t.add_argument("--output", "-o", help="Raporu dosyaya yazar")
+    args = parser.parse_args()
+
+    conn = connect(Path(args.db))
+    if args.command == "ingest":
+        eval_data = load_json(EVALUATION_JSON)
+        if not eval_data.get("videos"):
+            print("evaluation.json yok/boş; analiz deposuna eklenmedi.")
+            return 0
+        try:
+            folder = ingest(conn, load_json(LATEST_MEETING_JSON), eval_data, load_json(ENGAGEMENT_JOIN_JSON),
+                            load_json(REPORT_TIMING_JSON))
+        except ValueError as e:
+            print("HATA:", e, file=sys.stderr)
+            return 1
+        print("Analiz deposuna eklendi:", folder, "->", args.db)
+        return 0
+
+    filters = {"since": args.since, "until": args.until, "prefix": args.prefix, "participant": args.participant}
+    rows = trend(conn, last=args.last, **filters)
+    out = json.dumps(rows, ensure_ascii=False, indent=2) if args.format == "json" else trend_markdown(rows, filters)
+    if args.output:
+        Path(args.output).write_text(out, encoding="utf-8")
+        print("Trend raporu yazıldı:", args.output)
+    else:
+        print(out)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Bellek eşlemeli frame deposu (frame_store.py) ile PNG klasöründen (extract_frames.py,
+frames/<video>/frame_*.png) frame yükleme hızını karşılaştırır.
+
+- Sıralı: tüm frame'ler 224×224×3 uint8 olarak belleğe (PNG: ffmpeg ile image2 decode,
+  depo: 32'lik dilimlerin kopyası).
+- Rastgele pencere: --windows adet rastgele 32 frame'lik aralık (PNG: aralık başına
+  ffmpeg, depo: dilim kopyası).
+- Paylaşım: --workers süreç depoyu ayrı ayrı açıp tamamını okur; süreç başına özel
+  (paylaşılmayan) bellek /proc/self/smaps_rollup'tan raporlanır (Linux).
+
+PNG'den decode edilen frame'ler depodakilerle bayt bayt aynı olmalıdır; değilse betik
+1 ile çıkar. Ölçümler sıcak sayfa önbelleğiyledir (dosyalar yeni yazılmıştır).
+
+Örnek:
+  python benchmarks/bench_frame_store.py --duration 600 --windows 200 --workers 4
+"""
+import argparse
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "benchmarks"))
+
+import numpy as np  # noqa: E402
+
+import extract_frames  # noqa: E402
+import frame_store  # noqa: E402
+from fixtures import make_participant_video  # noqa: E402
+
+WINDOW = 32
+
+
+def png_frames(frames_dir: Path, start: int = 0, count: int | None = None) -> bytes:
+    """PNG'leri (frame_{start+1:04d}.png'den itibaren) ham rgb24 olarak decode eder."""
+    cmd = ["ffmpeg", "-loglevel", "error", "-start_number", str(start + 1),
+           "-i", str(frames_dir / "frame_%04d.png")]
+    if count is not None:
+        cmd += ["-frames:v", str(count)]
+    cmd += ["-f", "rawvideo", "-pix_fmt", "rgb24", "pipe:1"]
+    return subprocess.run(cmd, capture_output=True, check=True).stdout
+
+
+def private_mb() -> float | None:
+    """Bu sürecin özel (başka süreçle paylaşılmayan) belleği, MB."""
+    try:
+        text = Path("/proc/self/smaps_rollup").read_text()
+    except OSError:
+        return None
+    kb = sum(int(line.split()[1]) for line in text.splitlines()
+             if line.startswith(("Private_Clean:", "Private_Dirty:")))
+    return kb / 1024
+
+
+def read_whole_store(directory: str) -> tuple[int, float | None, float | None]:
+    """İşçi süreç: depoyu açıp tüm frame'leri okur (toplam, önce/sonra özel bellek)."""
+    before = private_mb()
+    frames = np.load(Path(directory) / frame_store.FRAMES_NAME, mmap_mode="r")
+    total = 0
+    for i in range(0, len(frames), WINDOW):
+        total += int(frames[i: i + WINDOW].sum(dtype=np.uint64))
+    return total, before, private_mb()
+
+
+def timed(fn) -> tuple[float, object]:
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frame deposu ile PNG klasöründen yükleme karşılaştırması.")
+    parser.add_argument("--duration", "-d", type=float, default=300.0, help="Test kaydı süresi (sn)")
+    parser.add_argument("--windows", type=int, default=100, help=f"Rastgele {WINDOW} frame'lik pencere sayısı")
+    parser.add_argument("--workers", type=int, default=2, help="Depoyu paylaşan süreç sayısı")
+    args = parser.parse_args()
+    if not shutil.which("ffmpeg"):
+        print("HATA: ffmpeg bulunamadı.", file=sys.stderr)
+        return 1
+
+    with tempfile.TemporaryDirectory(prefix="sense-store-") as tmp:
+        tmp = Path(tmp)
+        video = tmp / "katilimci_1.webm"
+        make_participant_video(video, args.duration, seed=1)
+        extract_frames.OUTPUT_DIR = tmp / "frames"
+        t_png_write, png_dir = timed(lambda: extract_frames.extract_from_video(video))
+        t_store_write, store = timed(lambda: frame_store.build(video, root=tmp / "store"))
+        if png_dir is None or store is None:
+            print("HATA: frame çıkarılamadı.", file=sys.stderr)
+            return 1
+        n = len(store)
+        png_mb = sum(p.stat().st_size for p in png_dir.glob("frame_*.png")) / 1e6
+        store_mb = (store.directory / frame_store.FRAMES_NAME).stat().st_size / 1e6
+
+        t_png, raw = timed(lambda: png_frames(png_dir))
+        t_store, copy = timed(lambda: np.concatenate([np.array(store.slice(i, i + WINDOW))
+                                                      for i in range(0, n, WINDOW)]))
+        if raw != copy.tobytes():
+            print(f"HATA: PNG'den decode edilen frame'ler depodakilerden farklı "
+                  f"({len(raw) // extract_frames.FRAME_BYTES} / {n} frame)", file=sys.stderr)
+            return 1
+
+        rnd = random.Random(0)
+        starts = [rnd.randrange(0, max(1, n - WINDOW)) for _ in range(args.windows)]
+        t_png_rand, _ = timed(lambda: [png_frames(png_dir, s, WINDOW) for s in starts])
+        t_store_rand, _ = timed(lambda: [np.array(store.slice(s, s + WINDOW)) for s in starts])
+
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            t_shared, shared = timed(lambda: list(pool.map(read_whole_store,
+                                                           [str(store.directory)] * args.workers)))
+        expected = int(copy.sum(dtype=np.uint64))
+        if any(total != expected for total, _, _ in shared):
+            print("HATA: işçi süreçler depodan farklı veri okudu.", file=sys.stderr)
+            return 1
+
+    rand_frames = args.windows * WINDOW
+    print(f"{args.duration:g} sn kayıt, {n} frame | PNG {png_mb:.0f} MB, depo {store_mb:.0f} MB")
+    print(f"Yazma:            PNG {t_png_write:7.2f} sn | depo {t_store_write:7.2f} sn")
+    print(f"Sıralı yükleme:   PNG {n / t_png:9,.0f} frame/sn | depo {n / t_store:9,.0f} frame/sn "
+          f"(×{t_png / t_store:,.1f})")
+    print(f"Rastgele {args.windows}×{WINDOW}: PNG {rand_frames / t_png_rand:9,.0f} frame/sn | "
+          f"depo {rand_frames / t_store_rand:9,.0f} frame/sn (×{t_png_rand / t_store_rand:,.1f})")
+    extra = [after - before for _, before, after in shared if before is not None and after is not None]
+    mem = f", süreç başına ek özel bellek en çok {max(extra):.1f} MB (depo {store_mb:.0f} MB)" if extra else ""
+    print(f"Paylaşım:         {args.workers} süreç tüm depoyu {t_shared:.2f} sn'de okudu{mem}")
+    print("PNG'den decode edilen frame'ler depodakilerle bayt bayt aynı.")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
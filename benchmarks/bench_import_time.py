@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Python giriş noktalarının (her pipeline adımı ayrı süreç) import süresini ölçer.
+
+Her modül için `python -X importtime -c "import <modül>"` çalıştırılır; modülün
+kümülatif import süresi (en iyi N tekrar) adım başına bütçe ile karşılaştırılır.
+Bütçeler mutlak ms değil, aynı makinede `python -c pass` süresinin katlarıdır
+(taban çizgisi); böylece yavaş ve hızlı makinede aynı oran kontrol edilir.
+Ayrıca modül seviyesinde ağır bir bağımlılık (torch, whisperx, huggingface_hub, ...)
+yüklenip yüklenmediğine bakılır: bunlar sadece ihtiyaç duyan kod yolunda, fonksiyon
+içinde yüklenmelidir. Bütçe aşımı veya izinsiz ağır import varsa 1 ile çıkar;
+--heavy-only ile sadece ağır import kontrolü uygulanır.
+
+Örnek:
+  python benchmarks/bench_import_time.py --repeat 5
+  python benchmarks/bench_import_time.py --heavy-only      # süre bütçesi uygulanmaz
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "benchmarks"))
+
+from bench_pipeline import RESULTS_DIR, git_commit  # noqa: E402
+
+# Modül seviyesinde yüklenmemesi gereken paketler
+HEAVY_MODULES = ("torch", "whisperx", "omegaconf", "pyannote", "huggingface_hub", "numpy", "dotenv")
+
+# giriş noktası -> (import bütçesi: `python -c pass` süresinin katı, izin verilen ağır paketler)
+ENTRY_POINTS = {
+    "get_latest_meeting": (4, ()),
+    "download_meeting": (3, ()),
+    "transcribe_meeting": (6, ()),
+    "extract_frames": (5, ()),
+    "stream_pipeline": (6, ()),
+    "engagement_join": (3, ()),
+    "generate_report": (6, ()),
+    "generate_report_html": (6, ()),
+    "upload_report_to_hf": (3, ()),
+    "analytics_store": (4, ()),
+    "quantize_model": (3, ()),
+    "media_manifest": (4, ()),
+    "evaluation_log": (3, ()),
+    "progressive_report": (6, ()),
+    "scheduler": (5, ()),
+    "vad": (25, ("numpy",)),  # VAD zaten numpy ile çalışır
+    "frame_store": (25, ("numpy",)),  # depo numpy memmap; stream_pipeline sadece --frame-store ile yükler
+}
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """`-X importtime` çıktısı -> {modül: kümülatif µs}."""
+    out = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _, rest = line.partition(":")
+        _self_us, cumulative, name = (part.strip() for part in rest.split("|"))
+        out[name] = int(cumulative)
+    return out
+
+
+def baseline_ms(repeat: int) -> float:
+    """Taban çizgisi: `python -X importtime -c pass` süreç süresi (en iyi N tekrar)."""
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"],
+                       cwd=REPO_ROOT, capture_output=True, env=env)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def measure(module: str) -> dict:
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    t0 = time.perf_counter()
+    r = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                       cwd=REPO_ROOT, capture_output=True, text=True, env=env)
+    wall = time.perf_counter() - t0
+    if r.returncode != 0:
+        return {"error": (r.stderr.strip().splitlines() or ["?"])[-1]}
+    times = parse_importtime(r.stderr)
+    heavy = sorted({name.split(".")[0] for name in times} & set(HEAVY_MODULES))
+    return {"import_ms": times.get(module, 0) / 1000, "process_ms": wall * 1000, "heavy": heavy}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Giriş noktalarının import süresi ve bütçe kontrolü.")
+    parser.add_argument("--repeat", "-r", type=int, default=5, help="Tekrar sayısı (en iyi sonuç alınır)")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Bütçeleri bu katsayıyla çarp")
+    parser.add_argument("--heavy-only", action="store_true",
+                        help="Süre bütçesini raporla ama uygulama; sadece ağır import kontrolü")
+    parser.add_argument("--output", "-o", help="Sonuç JSON yolu (varsayılan: bench_results/import-time-<commit>.json)")
+    args = parser.parse_args()
+
+    results, problems = {}, []
+    base = baseline_ms(args.repeat)
+    print(f"Taban çizgisi (python -c pass): {base:.1f} ms\n")
+    print(f"{'Giriş noktası':<22} {'import ms':>10} {'süreç ms':>9} {'bütçe':>7}  ağır importlar")
+    for module, (budget, allowed) in ENTRY_POINTS.items():
+        runs = [measure(module) for _ in range(max(1, args.repeat))]
+        if "error" in runs[0]:
+            problems.append(f"{module}: import hatası: {runs[0]['error']}")
+            continue
+        best = min(runs, key=lambda x: x["import_ms"])
+        best["process_ms"] = min(x["process_ms"] for x in runs)
+        best["budget_ms"] = budget * args.budget_scale * base
+        results[module] = best
+        print(f"{module:<22} {best['import_ms']:>10.1f} {best['process_ms']:>9.1f} {best['budget_ms']:>7.0f}  "
+              f"{', '.join(best['heavy']) or '-'}")
+        if best["import_ms"] > best["budget_ms"] and not args.heavy_only:
+            problems.append(f"{module}: import {best['import_ms']:.1f} ms > bütçe {best['budget_ms']:.0f} ms "
+                            f"({budget * args.budget_scale:g} × taban)")
+        extra = [m for m in best["heavy"] if m not in allowed]
+        if extra:
+            problems.append(f"{module}: modül seviyesinde ağır import: {', '.join(extra)}")
+
+    commit = git_commit()
+    out_path = Path(args.output) if args.output else RESULTS_DIR / f"import-time-{commit}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps({
+        "benchmark": "import_time",
+        "commit": commit,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "params": {"repeat": args.repeat, "budget_scale": args.budget_scale, "heavy_only": args.heavy_only},
+        "baseline_ms": base,
+        "host": {"platform": platform.platform(), "python": platform.python_version(), "cpu_count": os.cpu_count()},
+        "entry_points": results,
+    }, ensure_ascii=False, indent=2), encoding="utf-8")
+    print("\nSonuç yazıldı:", out_path)
+
+    if problems:
+        for p in problems:
+            print("HATA:", p, file=sys.stderr)
+        return 1
+    print("Modül seviyesinde ağır import yok." if args.heavy_only
+          else "Tüm giriş noktaları bütçe içinde, modül seviyesinde ağır import yok.")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+engagement_join.py benchmark'ı: sentetik uzun toplantı (varsayılan 3 saat, 6 katılımcı,
+0.5 sn frame aralığı, ~6 sn'lik konuşma segmentleri) üzerinde indeksli birleştirme ile
+segment başına tüm frame'leri tarayan naif birleştirmeyi karşılaştırır.
+
+Naif yöntem O(segment × frame) olduğundan sadece ilk --naive-segments segmentte
+çalıştırılır; toplam süre doğrusal olarak tahmin edilir ve sonuçlar o segmentlerde
+indeksli yöntemle karşılaştırılır.
+
+Örnek:
+  python benchmarks/bench_join.py --hours 3 --participants 6
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from engagement_join import ENGAGEMENT_IDX, FRAME_INTERVAL_SEC, LABELS_EN, join  # noqa: E402
+
+
+def synthetic_meeting(hours: float, participants: int, seed: int = 0) -> tuple[dict, dict]:
+    rnd = random.Random(seed)
+    n_frames = int(hours * 3600 / FRAME_INTERVAL_SEC)
+    videos = {}
+    for p in range(participants):
+        frames = []
+        for i in range(n_frames):
+            scores = [rnd.random() for _ in LABELS_EN]
+            k = max(range(len(scores)), key=scores.__getitem__)
+            frames.append({"frame": f"frame_{i + 1:04d}.png", "scores": scores, "dominant": LABELS_EN[k], "level": k})
+        videos[f"katilimci_{p + 1}"] = {"frameCount": n_frames, "frames": frames}
+    segments = []
+    t = 0.0
+    while t < hours * 3600:
+        dur = rnd.uniform(1.5, 12.0)
+        segments.append({"start": round(t, 2), "end": round(min(t + dur, hours * 3600), 2),
+                         "speaker": f"SPEAKER_{rnd.randrange(4):02d}", "text": "..."})
+        t += dur + rnd.uniform(0.0, 2.0)
+    return {"videos": videos}, {"segments": segments}
+
+
+def naive_segment(eval_data: dict, seg: dict) -> tuple[int, float]:
+    """Segment için tüm katılımcıların tüm frame'lerini tarar."""
+    n, total = 0, 0.0
+    for v in eval_data["videos"].values():
+        for i, f in enumerate(v["frames"]):
+            t = i * FRAME_INTERVAL_SEC
+            if seg["start"] <= t < seg["end"]:
+                n += 1
+                total += f["scores"][ENGAGEMENT_IDX]
+    return n, total / n if n else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transkript-ilgi birleştirme benchmark'ı.")
+    parser.add_argument("--hours", type=float, default=3.0)
+    parser.add_argument("--participants", "-n", type=int, default=6)
+    parser.add_argument("--naive-segments", type=int, default=20, help="Naif yöntemin ölçüleceği segment sayısı")
+    args = parser.parse_args()
+
+    print("Sentetik toplantı üretiliyor...")
+    eval_data, transcript = synthetic_meeting(args.hours, args.participants)
+    n_frames = sum(v["frameCount"] for v in eval_data["videos"].values())
+    n_segments = len(transcript["segments"])
+    print(f"{args.hours:g} saat, {args.participants} katılımcı, {n_frames} frame, {n_segments} segment")
+
+    t0 = time.perf_counter()
+    result = join(eval_data, transcript)
+    t_indexed = time.perf_counter() - t0
+
+    sample = transcript["segments"][: args.naive_segments]
+    t0 = time.perf_counter()
+    naive = [naive_segment(eval_data, s) for s in sample]
+    t_naive_sample = time.perf_counter() - t0
+    t_naive_est = t_naive_sample / max(1, len(sample)) * n_segments
+
+    mismatches = 0
+    for (n, mean), seg in zip(naive, result["segments"]):
+        if n != seg["frames"] or (mean is not None and abs(mean - seg["engagement"]) > 1e-3):
+            mismatches += 1
+
+    print(f"İndeksli birleştirme:  {t_indexed:8.3f} sn  ({n_segments / t_indexed:,.0f} segment/sn)")
+    print(f"Naif (tahmini):        {t_naive_est:8.1f} sn  ({len(sample)} segmentten doğrusal tahmin)")
+    print(f"Hızlanma:              ×{t_naive_est / t_indexed:,.0f}")
+    if mismatches:
+        print(f"HATA: {mismatches}/{len(sample)} segmentte naif sonuçla uyuşmazlık", file=sys.stderr)
+        return 1
+    print(f"İlk {len(sample)} segment naif sonuçla aynı.")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
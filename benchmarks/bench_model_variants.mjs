@@ -0,0 +1,161 @@
+/**
+ * DAiSEE model varyantlarını (float32 / float16 / uint8 ağırlık) karşılaştırır:
+ * - doğruluk paritesi: float32'ye göre dominant etiket uyumu, ortalama / en büyük |Δskor|
+ * - hız: model yükleme süresi, ilk tahmin (ısınma) ve frame/sn
+ *
+ * Fixture frame'leri: extract_frames.py çıktısı (frames/<video>/frame_*.png), örn.
+ *   python benchmarks/fixtures.py -n 2 -d 120 && python extract_frames.py
+ *   python quantize_model.py --dtype float16 && python quantize_model.py --dtype uint8
+ *   node benchmarks/bench_model_variants.mjs --frames frames --limit 500
+ */
+import fs from "fs";
+import path from "path";
+import { execSync } from "child_process";
+import { fileURLToPath } from "url";
+import { LABELS, loadImageAsTensor, loadModel, modelDir, scoreInput } from "../evaluate_frames.mjs";
+
+const REPO_ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..");
+const RESULTS_DIR = path.join(REPO_ROOT, "bench_results");
+
+function parseArgs(argv) {
+  const args = { frames: "frames", limit: 0, variants: ["float32", "float16", "uint8"], output: null };
+  for (let i = 0; i < argv.length; i++) {
+    const a = argv[i];
+    if (a === "--frames") args.frames = argv[++i];
+    else if (a === "--limit") args.limit = parseInt(argv[++i], 10);
+    else if (a === "--variants") args.variants = argv[++i].split(",");
+    else if (a === "--output" || a === "-o") args.output = argv[++i];
+  }
+  return args;
+}
+
+function listFrames(root, limit) {
+  const files = [];
+  for (const d of fs.readdirSync(root, { withFileTypes: true })) {
+    if (!d.isDirectory()) continue;
+    for (const f of fs.readdirSync(path.join(root, d.name)).sort()) {
+      if (f.endsWith(".png")) files.push(path.join(root, d.name, f));
+    }
+  }
+  return limit > 0 ? files.slice(0, limit) : files;
+}
+
+function dirBytes(dir) {
+  return fs.readdirSync(dir).reduce((n, f) => n + fs.statSync(path.join(dir, f)).size, 0);
+}
+
+function gitCommit() {
+  try {
+    return execSync("git rev-parse --short HEAD", { cwd: REPO_ROOT }).toString().trim();
+  } catch {
+    return "unknown";
+  }
+}
+
+async function runVariant(variant, files) {
+  let t = performance.now();
+  const model = await loadModel(variant);
+  const loadMs = performance.now() - t;
+
+  // İlk tahmin (graph hazırlama / ısınma) ayrı ölçülür
+  t = performance.now();
+  const first = await scoreInput(model, await loadImageAsTensor(files[0]), path.basename(files[0]));
+  const warmupMs = performance.now() - t;
+
+  const scores = [first];
+  t = performance.now();
+  for (const file of files.slice(1)) {
+    scores.push(await scoreInput(model, await loadImageAsTensor(file), path.basename(file)));
+  }
+  const sec = (performance.now() - t) / 1000;
+  model.dispose();
+  return {
+    variant,
+    sizeMB: +(dirBytes(modelDir(variant)) / 1e6).toFixed(2),
+    loadMs: +loadMs.toFixed(1),
+    warmupMs: +warmupMs.toFixed(1),
+    framesPerSec: sec > 0 ? +((files.length - 1) / sec).toFixed(2) : 0,
+    scores,
+  };
+}
+
+function parity(base, other) {
+  let agree = 0, sumAbs = 0, maxAbs = 0;
+  const perLabel = LABELS.map(() => 0);
+  for (let i = 0; i < base.length; i++) {
+    if (base[i].dominant === other[i].dominant) agree++;
+    base[i].scores.forEach((v, k) => {
+      const d = Math.abs(v - other[i].scores[k]);
+      perLabel[k] += d;
+      sumAbs += d;
+      maxAbs = Math.max(maxAbs, d);
+    });
+  }
+  const n = base.length;
+  return {
+    dominantAgreement: +(agree / n).toFixed(4),
+    meanAbsDelta: +(sumAbs / (n * LABELS.length)).toExponential(3),
+    maxAbsDelta: +maxAbs.toExponential(3),
+    meanAbsDeltaPerLabel: Object.fromEntries(LABELS.map((l, k) => [l, +(perLabel[k] / n).toExponential(3)])),
+  };
+}
+
+async function main() {
+  const args = parseArgs(process.argv.slice(2));
+  if (!fs.existsSync(args.frames)) {
+    console.error("Frame klasörü yok:", args.frames, "(önce extract_frames.py çalıştırın)");
+    process.exit(1);
+  }
+  const files = listFrames(args.frames, args.limit);
+  if (files.length < 2) {
+    console.error("En az 2 frame gerekli:", args.frames);
+    process.exit(1);
+  }
+  const variants = args.variants.filter((v) => {
+    const ok = fs.existsSync(path.join(modelDir(v), "model.json"));
+    if (!ok) console.error(`Atlandı (${v} yok; quantize_model.py --dtype ${v}):`, modelDir(v));
+    return ok;
+  });
+  if (!variants.includes("float32")) {
+    console.error("float32 referans modeli gerekli.");
+    process.exit(1);
+  }
+
+  const runs = {};
+  for (const v of variants) {
+    console.error(`${v}: ${files.length} frame değerlendiriliyor...`);
+    runs[v] = await runVariant(v, files);
+  }
+
+  const report = {
+    benchmark: "model-variants",
+    commit: gitCommit(),
+    createdAt: new Date().toISOString(),
+    frames: files.length,
+    variants: variants.map((v) => {
+      const { scores, ...m } = runs[v];
+      return v === "float32" ? m : { ...m, parity: parity(runs.float32.scores, scores) };
+    }),
+  };
+
+  console.log(`\n${files.length} frame, referans: float32`);
+  console.log("Varyant    Boyut(MB)  Yükleme(ms)  Isınma(ms)  frame/sn  Dominant uyumu  Ort.|Δ|     Maks.|Δ|");
+  for (const r of report.variants) {
+    const p = r.parity || { dominantAgreement: 1, meanAbsDelta: 0, maxAbsDelta: 0 };
+    console.log(
+      `${r.variant.padEnd(10)} ${String(r.sizeMB).padStart(9)} ${String(r.loadMs).padStart(12)} ${String(r.warmupMs).padStart(11)} ` +
+      `${String(r.framesPerSec).padStart(9)} ${(100 * p.dominantAgreement).toFixed(2).padStart(14)}% ` +
+      `${String(p.meanAbsDelta).padStart(10)} ${String(p.maxAbsDelta).padStart(11)}`,
+    );
+  }
+
+  const out = args.output || path.join(RESULTS_DIR, `model-variants-${report.commit}.json`);
+  fs.mkdirSync(path.dirname(out), { recursive: true });
+  fs.writeFileSync(out, JSON.stringify(report, null, 2), "utf-8");
+  console.log("\nSonuç yazıldı:", out);
+}
+
+main().catch((err) => {
+  console.error(err);
+  process.exit(1);
+});
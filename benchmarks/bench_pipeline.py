@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Uçtan uca pipeline benchmark'ı (HF token ve gerçek toplantı gerekmez).
+
+Sentetik toplantı fixture'ı (benchmarks/fixtures.py) üzerinde sırasıyla
+extract_frames.py, evaluate_frames.mjs, generate_report.py ve generate_report_html.py
+çalıştırılır; her adım için süre, frame/sn, toplantı-saniyesi/duvar-saniyesi ve
+tepe bellek (maxrss) ölçülür.
+
+Sonuç JSON'u commit, parametreler ve makine bilgisi ile yazılır; --compare ile
+başka bir commit'in sonucu ile karşılaştırılabilir.
+
+--progressive: değerlendirme sırasında ön rapor yerelde üretilir (yükleme yok) ve
+ilk raporun süresi (time_to_first_report_sec) son raporunkiyle birlikte ölçülür.
+
+Örnek:
+  python benchmarks/bench_pipeline.py -n 3 -d 120 --repeat 3
+  python benchmarks/bench_pipeline.py --mode stream --compare bench_results/pipeline-batch-abc1234.json
+  python benchmarks/bench_pipeline.py --mode stream --progressive
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "benchmarks"))
+
+from fixtures import cached_meeting, latest_meeting_meta  # noqa: E402
+
+CACHE_DIR = REPO_ROOT / ".bench_cache"
+RESULTS_DIR = REPO_ROOT / "bench_results"
+
+# (adım adı, komut) — komutlar çalışma dizininde (cwd) çalıştırılır
+STAGES = [
+    ("extract_frames", [sys.executable, str(REPO_ROOT / "extract_frames.py")]),
+    ("evaluate_frames", ["node", str(REPO_ROOT / "evaluate_frames.mjs")]),
+    ("generate_report", [sys.executable, str(REPO_ROOT / "generate_report.py")]),
+    ("generate_report_html", [sys.executable, str(REPO_ROOT / "generate_report_html.py")]),
+]
+# --mode stream: frame çıkarma + değerlendirme tek adımda (stream_pipeline.py)
+STREAM_STAGES = [
+    ("stream_pipeline", [sys.executable, str(REPO_ROOT / "stream_pipeline.py")]),
+    *STAGES[2:],
+]
+PROVISIONAL_STAGE = ("progressive_report", [sys.executable, str(REPO_ROOT / "progressive_report.py"), "--no-upload"])
+
+
+def progressive_stages(stages: list) -> list:
+    """Ön rapor: stream modunda stream_pipeline içinde, batch modunda değerlendirmeden hemen sonra."""
+    out = []
+    for name, cmd in stages:
+        out.append((name, [*cmd, "--progressive", "--no-upload"] if name == "stream_pipeline" else cmd))
+        if name == "evaluate_frames":
+            out.append(PROVISIONAL_STAGE)
+    return out
+
+
+def git_commit() -> str:
+    r = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True)
+    commit = r.stdout.strip() or "unknown"
+    dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_ROOT,
+                           capture_output=True, text=True).stdout.strip()
+    return f"{commit}-dirty" if dirty else commit
+
+
+def ffmpeg_version() -> str:
+    r = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True)
+    return r.stdout.splitlines()[0] if r.stdout else "unknown"
+
+
+def run_stage(cmd: list[str], cwd: Path) -> dict:
+    """Adımı çalıştırır; duvar süresi ve çocuk sürecin tepe belleğini (wait4 rusage) döner."""
+    # Çıktılar pipe yerine geçici dosyaya: pipe dolarsa wait4 kilitlenir
+    with tempfile.TemporaryFile() as log:
+        start = time.perf_counter()
+        proc = subprocess.Popen(cmd, cwd=cwd, stdout=log, stderr=subprocess.STDOUT)
+        # wait4 sadece bu sürecin rusage'ını verir (önceki adımlar karışmaz)
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        log.seek(0)
+        output = log.read().decode("utf-8", errors="replace")
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} başarısız ({proc.returncode}):\n{output[-800:]}")
+    # Linux'ta ru_maxrss KB cinsindendir (macOS'ta byte)
+    peak_kb = usage.ru_maxrss if sys.platform != "darwin" else usage.ru_maxrss // 1024
+    return {"wall_sec": wall, "peak_rss_mb": round(peak_kb / 1024, 1)}
+
+
+def count_frames(workdir: Path) -> int:
+    frames_dir = workdir / "frames"
+    if frames_dir.exists():
+        return sum(1 for _ in frames_dir.rglob("frame_*.png"))
+    evaluation = workdir / "evaluation.json"
+    if evaluation.exists():
+        videos = json.loads(evaluation.read_text(encoding="utf-8")).get("videos") or {}
+        return sum(v.get("frameCount") or 0 for v in videos.values())
+    return 0
+
+
+def prepare_workdir(workdir: Path, meeting_data: Path) -> None:
+    for name in ("meeting_data", "frames", "evaluation.json", "evaluation.ndjson", "report_timing.json"):
+        p = workdir / name
+        if p.is_symlink() or p.is_file():
+            p.unlink()
+        elif p.exists():
+            shutil.rmtree(p)
+    (workdir / "meeting_data").symlink_to(meeting_data, target_is_directory=True)
+    (workdir / "latest_meeting.json").write_text(json.dumps(latest_meeting_meta(), ensure_ascii=False), encoding="utf-8")
+
+
+def run_once(workdir: Path, meeting_data: Path, participants: int, duration: float, stages: list) -> dict:
+    prepare_workdir(workdir, meeting_data)
+    media_sec = participants * duration
+    out = {}
+    # Ön rapor süresi (report_timing.json) ilk adımın başından ölçülür
+    os.environ["SENSE_PIPELINE_STARTED"] = str(time.time())
+    for name, cmd in stages:
+        m = run_stage(cmd, workdir)
+        if name in ("extract_frames", "stream_pipeline"):
+            frames = count_frames(workdir)
+            m["frames"] = frames
+            m["frames_per_sec"] = round(frames / m["wall_sec"], 2) if m["wall_sec"] else 0.0
+        elif name == "evaluate_frames":
+            frames = out["extract_frames"]["frames"]
+            m["frames"] = frames
+            m["frames_per_sec"] = round(frames / m["wall_sec"], 2) if m["wall_sec"] else 0.0
+        # Toplantı-saniyesi / duvar-saniyesi: tüm katılımcıların kayıt süresi toplamı üzerinden
+        m["media_sec_per_wall_sec"] = round(media_sec / m["wall_sec"], 2) if m["wall_sec"] else 0.0
+        m["wall_sec"] = round(m["wall_sec"], 3)
+        out[name] = m
+    total = sum(out[n]["wall_sec"] for n, _ in stages)
+    out["total"] = {
+        "wall_sec": round(total, 3),
+        "meeting_sec_per_wall_sec": round(duration / total, 2) if total else 0.0,
+        "media_sec_per_wall_sec": round(media_sec / total, 2) if total else 0.0,
+        "peak_rss_mb": max(out[n]["peak_rss_mb"] for n, _ in stages),
+    }
+    timing = workdir / "report_timing.json"
+    if timing.exists():
+        out["total"]["time_to_first_report_sec"] = json.loads(timing.read_text(encoding="utf-8")).get("first_report_sec")
+        out["total"]["time_to_final_report_sec"] = round(total, 3)
+    return out
+
+
+def aggregate(runs: list[dict]) -> dict:
+    """Tekrarlı ölçümlerin medyanı (sayısal alanlar)."""
+    agg = {}
+    for stage in runs[0]:
+        agg[stage] = {}
+        for key, value in runs[0][stage].items():
+            if isinstance(value, (int, float)):
+                agg[stage][key] = round(statistics.median(r[stage][key] for r in runs), 3)
+    return agg
+
+
+def print_table(result: dict, baseline: dict | None = None) -> None:
+    print(f"\nCommit: {result['commit']}  ({result['params']['participants']} katılımcı × {result['params']['duration_sec']:g} sn, "
+          f"{result['params']['mode']} modu, {result['params']['repeat']} tekrar, medyan)")
+    header = f"{'Adım':<22}{'Süre (sn)':>11}{'frame/sn':>10}{'medya-sn/sn':>13}{'Tepe RSS (MB)':>15}"
+    if baseline:
+        header += f"{'Δ süre':>10}"
+    print(header)
+    for stage, m in result["metrics"].items():
+        line = (f"{stage:<22}{m.get('wall_sec', 0):>11.2f}{m.get('frames_per_sec', 0) or 0:>10.1f}"
+                f"{m.get('media_sec_per_wall_sec', 0):>13.2f}{m.get('peak_rss_mb', 0):>15.1f}")
+        if baseline:
+            old = (baseline.get("metrics") or {}).get(stage, {}).get("wall_sec")
+            if old:
+                line += f"{100 * (m['wall_sec'] - old) / old:>+9.1f}%"
+        print(line)
+    total = result["metrics"].get("total") or {}
+    if total.get("time_to_first_report_sec") is not None:
+        print(f"İlk (ön) rapor: {total['time_to_first_report_sec']:.2f} sn, son rapor: {total['time_to_final_report_sec']:.2f} sn")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik toplantı üzerinde uçtan uca pipeline benchmark'ı.")
+    parser.add_argument("--participants", "-n", type=int, default=2, help="Katılımcı (ekran kaydı) sayısı")
+    parser.add_argument("--duration", "-d", type=float, default=60.0, help="Kayıt süresi (sn)")
+    parser.add_argument("--repeat", "-r", type=int, default=1, help="Tekrar sayısı (medyan raporlanır)")
+    parser.add_argument("--mode", choices=("batch", "stream"), default="batch",
+                        help="batch: extract_frames + evaluate_frames sırayla; stream: stream_pipeline.py")
+    parser.add_argument("--progressive", action="store_true", help="Ön rapor üret ve ilk rapor süresini ölç")
+    parser.add_argument("--workdir", help="Çalışma dizini (varsayılan: geçici dizin)")
+    parser.add_argument("--output", "-o", help="Sonuç JSON yolu (varsayılan: bench_results/pipeline-<mod>-<commit>.json)")
+    parser.add_argument("--compare", metavar="FILE", help="Karşılaştırılacak önceki sonuç JSON'u")
+    args = parser.parse_args()
+
+    for tool in ("ffmpeg", "node"):
+        if not shutil.which(tool):
+            print(f"HATA: {tool} bulunamadı.", file=sys.stderr)
+            return 1
+
+    print("Fixture hazırlanıyor...")
+    meeting_data = cached_meeting(CACHE_DIR, args.participants, args.duration)
+
+    tmp = None
+    if args.workdir:
+        workdir = Path(args.workdir).resolve()
+        workdir.mkdir(parents=True, exist_ok=True)
+    else:
+        tmp = tempfile.TemporaryDirectory(prefix="sense-bench-")
+        workdir = Path(tmp.name)
+
+    runs = []
+    try:
+        for i in range(args.repeat):
+            print(f"Çalıştırma {i + 1}/{args.repeat}...")
+            stages = STREAM_STAGES if args.mode == "stream" else STAGES
+            if args.progressive:
+                stages = progressive_stages(stages)
+            runs.append(run_once(workdir, meeting_data, args.participants, args.duration, stages))
+    finally:
+        if tmp:
+            tmp.cleanup()
+
+    commit = git_commit()
+    result = {
+        "benchmark": "pipeline",
+        "commit": commit,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "params": {"participants": args.participants, "duration_sec": args.duration, "mode": args.mode,
+                   "repeat": args.repeat, "progressive": args.progressive},
+        "host": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "ffmpeg": ffmpeg_version(),
+        },
+        "metrics": aggregate(runs),
+        "runs": runs,
+    }
+    out_path = Path(args.output) if args.output else RESULTS_DIR / f"pipeline-{args.mode}-{commit}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        same = ("participants", "duration_sec")
+        if any((baseline.get("params") or {}).get(k) != result["params"][k] for k in same):
+            print("UYARI: karşılaştırılan sonuç farklı parametrelerle üretilmiş:", baseline.get("params"), file=sys.stderr)
+    print_table(result, baseline)
+    print("\nSonuç yazıldı:", out_path)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Zaman aralıklarına bölünmüş paralel decode (extract_frames.plan_segments) ile tek
+geçişli decode'u karşılaştırır: süre, frame sayısı ve frame başına içerik (md5).
+
+Frame indeksi zaman damgasını belirler (indeks × FRAME_INTERVAL); testsrc2 deseni
+zamanı görüntüye yazdığı için aynı indeksteki md5 eşitliği aynı zaman damgası demektir.
+Sınırda tekrar eden / kaybolan frame varsa sayı veya md5 farkı olarak görünür ve
+betik 1 ile çıkar. Sabit (CFR) ve ekran kaydı benzeri seyrek (VFR) kayıtlar denenir.
+
+Aynı karşılaştırma (compare) tests/test_split_decode.py'de 60 sn / 4 aralıkla CI'da çalışır.
+
+Örnek:
+  python benchmarks/bench_split_decode.py --duration 300 --segments 4
+"""
+import argparse
+import hashlib
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "benchmarks"))
+
+import extract_frames  # noqa: E402
+from fixtures import make_participant_video  # noqa: E402
+
+
+def frame_digests(frames_dir: Path) -> dict[int, str]:
+    out = {}
+    for p in frames_dir.glob("frame_*.png"):
+        out[int(p.stem.split("_")[1])] = hashlib.md5(p.read_bytes()).hexdigest()
+    return out
+
+
+def decode(video: Path, out_root: Path, segments: int) -> tuple[float, dict[int, str]]:
+    extract_frames.OUTPUT_DIR = out_root
+    start = time.perf_counter()
+    out = extract_frames.extract_from_video(video, segments=segments)
+    wall = time.perf_counter() - start
+    return wall, frame_digests(out) if out else {}
+
+
+def compare(name: str, single: dict[int, str], split: dict[int, str]) -> list[str]:
+    problems = []
+    if len(single) != len(split):
+        problems.append(f"{name}: frame sayısı farklı (tek geçiş {len(single)}, bölünmüş {len(split)})")
+    expected = list(range(1, len(single) + 1))
+    if sorted(split) != list(range(1, len(split) + 1)):
+        missing = sorted(set(expected) - set(split))[:5]
+        problems.append(f"{name}: bölünmüş decode indeksleri sürekli değil (eksik örnek: {missing})")
+    diff = [i for i in expected if i in split and split[i] != single[i]]
+    if diff:
+        t = ", ".join(f"{(i - 1) * extract_frames.FRAME_INTERVAL:g}s" for i in diff[:5])
+        problems.append(f"{name}: {len(diff)} frame içeriği farklı (ilk zamanlar: {t})")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bölünmüş paralel decode ile tek geçişli decode karşılaştırması.")
+    parser.add_argument("--duration", "-d", type=float, default=180.0, help="Test kaydı süresi (sn)")
+    parser.add_argument("--segments", "-s", type=int, default=extract_frames.SPLIT_SEGMENTS)
+    args = parser.parse_args()
+    if not shutil.which("ffmpeg"):
+        print("HATA: ffmpeg bulunamadı.", file=sys.stderr)
+        return 1
+    # Kısa test kayıtlarında da bölünsün
+    extract_frames.SPLIT_MIN_DURATION = 0.0
+
+    problems = []
+    with tempfile.TemporaryDirectory(prefix="sense-split-") as tmp:
+        tmp = Path(tmp)
+        for name, sparse in (("cfr", False), ("vfr", True)):
+            video = tmp / f"{name}.webm"
+            make_participant_video(video, args.duration, seed=1, sparse=sparse)
+            t_single, single = decode(video, tmp / "single", segments=1)
+            t_split, split = decode(video, tmp / "split", segments=args.segments)
+            plan = extract_frames.plan_segments(extract_frames.probe_duration(video), args.segments)
+            print(f"{name}: {len(single)} frame | tek geçiş {t_single:.2f} sn | "
+                  f"{len(plan)} aralık {t_split:.2f} sn | hızlanma ×{t_single / t_split:.2f}")
+            problems += compare(name, single, split)
+
+    if problems:
+        for p in problems:
+            print("HATA:", p, file=sys.stderr)
+        return 1
+    print("Frame sayıları, indeksler ve içerikler tek geçişli decode ile aynı.")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Uzak kayıttan akış halinde decode (media_input, download_meeting.py --stream) ile
+önce tamamını indirip sonra decode etmeyi karşılaştırır.
+
+HF yerine yerel bir HTTP sunucusu kullanılır; hub davranışı taklit edilir:
+  /resolve/<ad>  token ister (Authorization: Bearer), imzalı /cdn/<ad>?sig=... adresine 302
+  /cdn/<ad>      Range destekler, bant genişliği --rate ile sınırlı, Authorization başlığını reddeder
+Ölçülenler: ilk frame'e kadar geçen süre, toplam frame decode süresi, 16 kHz WAV çıkarma
+süresi. Akıştan gelen ham frame'ler ve WAV, yerel dosyadan gelenlerle bayt bayt aynı
+olmalıdır; değilse betik 1 ile çıkar.
+
+Örnek:
+  python benchmarks/bench_stream_input.py --duration 120 --rate 8
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "benchmarks"))
+
+from bench_pipeline import RESULTS_DIR, git_commit  # noqa: E402
+from extract_frames import iter_raw_frames  # noqa: E402
+from fixtures import make_meeting_audio, make_participant_video  # noqa: E402
+from media_input import RemoteMedia  # noqa: E402
+from transcribe_meeting import webm_to_wav_16k  # noqa: E402
+
+TOKEN = "bench-token"
+CHUNK = 64 * 1024
+
+
+def make_handler(root: Path, rate_bytes: float):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_HEAD(self):
+            self.handle_request(send_body=False)
+
+        def do_GET(self):
+            self.handle_request(send_body=True)
+
+        def handle_request(self, send_body: bool):
+            kind, _, rest = self.path.lstrip("/").partition("/")
+            name = rest.split("?")[0]
+            path = root / name
+            if not path.is_file():
+                self.send_error(404)
+            elif kind == "resolve":
+                if self.headers.get("Authorization") != f"Bearer {TOKEN}":
+                    self.send_error(401)
+                    return
+                self.send_response(302)
+                self.send_header("Location", f"/cdn/{name}?sig=bench")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            elif kind == "cdn":
+                if self.headers.get("Authorization"):
+                    self.send_error(400, "Only one auth mechanism allowed")
+                    return
+                self.send_file(path, send_body)
+            else:
+                self.send_error(404)
+
+        def send_file(self, path: Path, send_body: bool):
+            size = path.stat().st_size
+            start, end = 0, size - 1
+            rng = self.headers.get("Range")
+            if rng and rng.startswith("bytes="):
+                a, _, b = rng[6:].partition("-")
+                start = int(a) if a else max(0, size - int(b))
+                end = int(b) if a and b else size - 1
+                if start >= size:
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.end_headers()
+                    return
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            else:
+                self.send_response(200)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Type", "video/webm")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.end_headers()
+            if not send_body:
+                return
+            t0 = time.perf_counter()
+            sent = 0
+            with open(path, "rb") as f:
+                f.seek(start)
+                while sent < end - start + 1:
+                    data = f.read(min(CHUNK, end - start + 1 - sent))
+                    if not data:
+                        break
+                    try:
+                        self.wfile.write(data)
+                    except (BrokenPipeError, ConnectionResetError):
+                        return
+                    sent += len(data)
+                    # Bant genişliği sınırı (istek başına)
+                    ahead = sent / rate_bytes - (time.perf_counter() - t0)
+                    if ahead > 0:
+                        time.sleep(ahead)
+
+    return Handler
+
+
+def decode_frames(source) -> tuple[float, float, int, str]:
+    """(ilk frame sn, toplam sn, frame sayısı, md5)."""
+    t0 = time.perf_counter()
+    first = None
+    n = 0
+    h = hashlib.md5()
+    for _, count, data in iter_raw_frames(source, 1):
+        if first is None:
+            first = time.perf_counter() - t0
+        n += count
+        h.update(data)
+    return first or 0.0, time.perf_counter() - t0, n, h.hexdigest()
+
+
+def download(url: str, dst: Path) -> float:
+    t0 = time.perf_counter()
+    with urllib.request.urlopen(url) as r, open(dst, "wb") as f:
+        shutil.copyfileobj(r, f)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uzak kayıttan akış halinde decode vs. önce indirme.")
+    parser.add_argument("--duration", "-d", type=float, default=120.0, help="Test kaydı süresi (sn)")
+    parser.add_argument("--rate", type=float, default=8.0, help="Sunucu bant genişliği (MB/sn)")
+    parser.add_argument("--output", "-o", help="Sonuç JSON yolu (varsayılan: bench_results/stream-input-<commit>.json)")
+    args = parser.parse_args()
+    if not shutil.which("ffmpeg"):
+        print("HATA: ffmpeg bulunamadı.", file=sys.stderr)
+        return 1
+
+    problems, metrics = [], {}
+    with tempfile.TemporaryDirectory(prefix="sense-stream-") as tmp:
+        tmp = Path(tmp)
+        served = tmp / "hub"
+        served.mkdir()
+        make_participant_video(served / "katilimci_1.webm", args.duration, seed=1)
+        make_meeting_audio(served / "toplanti_sesi.webm", args.duration)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(served, args.rate * 1e6))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        os.environ["SENSEAI"] = TOKEN
+        try:
+            for name, kind in (("katilimci_1.webm", "video"), ("toplanti_sesi.webm", "audio")):
+                size = (served / name).stat().st_size
+                local = tmp / name
+                dl = download(f"{base}/cdn/{name}", local)
+                remote = RemoteMedia(name, f"{base}/resolve/{name}", size)
+                if kind == "video":
+                    l_first, l_total, l_n, l_md5 = decode_frames(local)
+                    r_first, r_total, r_n, r_md5 = decode_frames(remote)
+                    m = {
+                        "bytes": size,
+                        "download_sec": round(dl, 3),
+                        "download_first_frame_sec": round(dl + l_first, 3),
+                        "download_total_sec": round(dl + l_total, 3),
+                        "stream_first_frame_sec": round(r_first, 3),
+                        "stream_total_sec": round(r_total, 3),
+                        "frames": r_n,
+                    }
+                    print(f"video {size / 1e6:.1f} MB @ {args.rate:g} MB/sn, {r_n} frame")
+                    print(f"  önce indir: ilk frame {m['download_first_frame_sec']:.2f} sn, toplam {m['download_total_sec']:.2f} sn")
+                    print(f"  akış:       ilk frame {r_first:.2f} sn, toplam {r_total:.2f} sn")
+                    if (l_n, l_md5) != (r_n, r_md5):
+                        problems.append(f"video: akıştan gelen frame'ler farklı ({l_n} / {r_n} frame)")
+                else:
+                    t0 = time.perf_counter()
+                    ok_local = webm_to_wav_16k(local, tmp / "local.wav")
+                    l_total = time.perf_counter() - t0
+                    t0 = time.perf_counter()
+                    ok_remote = webm_to_wav_16k(remote, tmp / "remote.wav")
+                    r_total = time.perf_counter() - t0
+                    m = {
+                        "bytes": size,
+                        "download_sec": round(dl, 3),
+                        "download_total_sec": round(dl + l_total, 3),
+                        "stream_total_sec": round(r_total, 3),
+                    }
+                    print(f"ses {size / 1e6:.1f} MB: önce indir + WAV {dl + l_total:.2f} sn, akış WAV {r_total:.2f} sn")
+                    same = ok_local and ok_remote and (tmp / "local.wav").read_bytes() == (tmp / "remote.wav").read_bytes()
+                    if not same:
+                        problems.append("ses: akıştan çıkarılan WAV yerel dosyadakiyle aynı değil")
+                metrics[kind] = m
+        finally:
+            server.shutdown()
+
+    commit = git_commit()
+    out_path = Path(args.output) if args.output else RESULTS_DIR / f"stream-input-{commit}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps({
+        "benchmark": "stream_input",
+        "commit": commit,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "params": {"duration_sec": args.duration, "rate_mb_s": args.rate},
+        "host": {"platform": platform.platform(), "python": platform.python_version(), "cpu_count": os.cpu_count()},
+        "metrics": metrics,
+    }, ensure_ascii=False, indent=2), encoding="utf-8")
+    print("\nSonuç yazıldı:", out_path)
+
+    if problems:
+        for p in problems:
+            print("HATA:", p, file=sys.stderr)
+        return 1
+    print("Akıştan gelen frame'ler ve ses, yerel dosyadan gelenlerle aynı.")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark için sentetik toplantı klasörü üretir (ffmpeg test kaynakları ile).
+Yapı, download_meeting.py'nin indirdiği düzenle aynıdır:
+meeting_data/Toplantı Kayıtları/<klasör>/katilimci_N.webm, toplanti_sesi.webm, notlar.txt
+
+Aynı parametrelerle üretilen fixture'lar bit düzeyinde aynı olmasa da içerik olarak
+deterministiktir (testsrc2 + sabit ses deseni); commit'ler arası karşılaştırma için
+fixture'lar önbellekte tutulur ve parametre anahtarıyla yeniden kullanılır.
+"""
+import argparse
+import hashlib
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+MEETINGS_FOLDER = "Toplantı Kayıtları"
+DEFAULT_FOLDER_NAME = "bench_2026-01-01_10-00"
+VIDEO_SIZE = "1280x720"
+VIDEO_RATE = 15
+# Konuşma / sessizlik deseni: her 20 sn'nin ilk 12 sn'si "konuşma" (modüleli ton), kalan 8 sn sessiz
+AUDIO_EXPR = "if(lt(mod(t\\,20)\\,12)\\,0.3*sin(2*PI*220*t)*(0.6+0.4*sin(2*PI*3*t))\\,0)"
+
+
+def fixture_key(participants: int, duration: float) -> str:
+    raw = json.dumps({"p": participants, "d": duration, "size": VIDEO_SIZE, "rate": VIDEO_RATE, "audio": AUDIO_EXPR})
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def _run_ffmpeg(args: list[str]) -> None:
+    cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error", *args]
+    r = subprocess.run(cmd, capture_output=True, text=True)
+    if r.returncode != 0:
+        raise RuntimeError(f"ffmpeg başarısız: {' '.join(cmd)}\n{r.stderr[-800:]}")
+
+
+def make_participant_video(path: Path, duration: float, seed: int, sparse: bool = False) -> None:
+    """
+    Katılımcı ekran kaydı: hareketli test deseni (VP8, ses yok).
+    sparse=True: tarayıcı ekran kaydı gibi değişken frame hızı (ekran durağanken saniyelerce frame yok).
+    """
+    vf = f"hue=h={(seed * 67) % 360}"
+    extra = []
+    if sparse:
+        vf += f",select='lt(mod(t\\,9)\\,1)+gt(random({seed})\\,0.93)'"
+        extra = ["-fps_mode", "vfr"]
+    _run_ffmpeg([
+        "-f", "lavfi", "-i", f"testsrc2=size={VIDEO_SIZE}:rate={VIDEO_RATE}:duration={duration}",
+        "-vf", vf, *extra,
+        "-c:v", "libvpx", "-deadline", "realtime", "-cpu-used", "8", "-b:v", "600k",
+        "-an", str(path),
+    ])
+
+
+def make_meeting_audio(path: Path, duration: float) -> None:
+    """Toplantı ses kaydı: konuşma/sessizlik desenli ton (Opus, video yok)."""
+    _run_ffmpeg([
+        "-f", "lavfi", "-i", f"aevalsrc={AUDIO_EXPR}:s=48000:d={duration}",
+        "-c:a", "libopus", "-b:a", "48k",
+        "-vn", str(path),
+    ])
+
+
+def make_meeting(meeting_data: Path, participants: int, duration: float,
+                 folder_name: str = DEFAULT_FOLDER_NAME) -> Path:
+    """meeting_data/ altında sentetik toplantı klasörü oluşturur. Dönen path toplantı klasörü."""
+    folder = meeting_data / MEETINGS_FOLDER / folder_name
+    folder.mkdir(parents=True, exist_ok=True)
+    for i in range(participants):
+        make_participant_video(folder / f"katilimci_{i + 1}.webm", duration, seed=i)
+    make_meeting_audio(folder / "toplanti_sesi.webm", duration)
+    (folder / "notlar.txt").write_text(
+        f"Sentetik benchmark toplantısı: {participants} katılımcı, {duration:g} sn.\n",
+        encoding="utf-8",
+    )
+    return folder
+
+
+def cached_meeting(cache_dir: Path, participants: int, duration: float) -> Path:
+    """Önbellekteki fixture'ın meeting_data kökünü döner; yoksa üretir."""
+    root = cache_dir / fixture_key(participants, duration) / "meeting_data"
+    done = root.parent / ".done"
+    if done.exists():
+        return root
+    if root.exists():
+        shutil.rmtree(root)
+    make_meeting(root, participants, duration)
+    done.write_text("ok", encoding="utf-8")
+    return root
+
+
+def latest_meeting_meta(folder_name: str = DEFAULT_FOLDER_NAME) -> dict:
+    """Fixture için latest_meeting.json içeriği (get_latest_meeting.py çıktısı ile aynı şema)."""
+    return {
+        "latest_folder": folder_name,
+        "base_path": f"datasets/Caner7/Sense-AI/{MEETINGS_FOLDER}/{folder_name}",
+        "repo_id": "Caner7/Sense-AI",
+        "files": [],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik toplantı fixture'ı üretir.")
+    parser.add_argument("--output", "-o", default="meeting_data", help="meeting_data kök dizini")
+    parser.add_argument("--participants", "-n", type=int, default=2)
+    parser.add_argument("--duration", "-d", type=float, default=60.0, help="Kayıt süresi (sn)")
+    args = parser.parse_args()
+    if not shutil.which("ffmpeg"):
+        print("HATA: ffmpeg bulunamadı.", file=sys.stderr)
+        return 1
+    folder = make_meeting(Path(args.output), args.participants, args.duration)
+    print("Fixture üretildi:", folder)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
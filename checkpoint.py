@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Pipeline adımları için tamamlanma manifestleri, rapor zamanlaması ve çalıştırma planı.
+
+Her adım bittiğinde .pipeline_state/<latest_folder>/<adım>.json yazılır: girdi ve
+çıktı dosyalarının sha256 özetleri (+ boyut/mtime; değişmemiş dosya tekrar
+hashlenmez) ve adımın anahtarı (ör. model varyantı). run_pipeline.py --resume bir
+adımı, çıktıları kayıttaki gibi duruyor ve mevcut girdileri değişmemişse atlar.
+
+Yarıda kalan değerlendirme ayrı bir kayıt tutmaz: stream_pipeline.py ve evaluate_frames.mjs
+--resume ile evaluation.ndjson'a (evaluation_log.py) eklenerek devam eder.
+
+report_timing.json: pipeline başlangıcından (run_pipeline.py, SENSE_PIPELINE_STARTED)
+ilk ön raporun ve son raporun yayınlanmasına kadar geçen süre.
+
+run_plan.json: scheduler.py'nin süre bütçesine göre seçtiği ayarlar (frame aralığı,
+Whisper modeli, işçi sayıları); adımlar planned() ile okur.
+
+<adım>.timing.json: run_pipeline.py bir adımı çalıştırırken yolunu SENSE_STAGE_TIMING ile
+verir; adım kendi ölçtüğü iş süresini (ör. ön rapor yayını hariç) record_work_time() ile
+yazar, verim duvar saati yerine bununla hesaplanır.
+
+Tek başına: python checkpoint.py [latest_folder]  -> adımların durumu
+"""
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+STATE_ROOT = Path(".pipeline_state")
+LATEST_MEETING_JSON = Path("latest_meeting.json")
+REPORT_TIMING_JSON = Path("report_timing.json")
+PIPELINE_STARTED_ENV = "SENSE_PIPELINE_STARTED"  # epoch sn; alt süreçler devralır
+RUN_PLAN_JSON = Path("run_plan.json")
+STAGE_TIMING_ENV = "SENSE_STAGE_TIMING"  # run_pipeline: adımın iş süresi kaydının yolu
+HASH_CHUNK = 1024 * 1024
+
+
+def state_dir(folder: str) -> Path:
+    return STATE_ROOT / folder
+
+
+def latest_folder() -> str | None:
+    if not LATEST_MEETING_JSON.exists():
+        return None
+    data = json.loads(LATEST_MEETING_JSON.read_text(encoding="utf-8"))
+    return (data.get("latest_folder") or "").strip() or None
+
+
+def planned(key: str, default):
+    """
+    run_plan.json'daki (scheduler.py) seçim. Plan yoksa, alan eksikse veya plan başka
+    bir toplantıya (latest_folder) aitse default döner.
+    """
+    if not RUN_PLAN_JSON.exists():
+        return default
+    try:
+        plan = json.loads(RUN_PLAN_JSON.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return default
+    folder = latest_folder()
+    if plan.get("folder") and folder and plan["folder"] != folder:
+        return default
+    value = plan.get(key)
+    return default if value is None else value
+
+
+def expand(paths: list[str]) -> list[str]:
+    """Dosya, klasör (içindeki tüm dosyalar) veya glob kalıbı -> sıralı dosya listesi."""
+    out = set()
+    for p in paths:
+        if any(c in p for c in "*?["):
+            out.update(f for f in glob.glob(p, recursive=True) if os.path.isfile(f))
+        elif os.path.isdir(p):
+            out.update(str(f) for f in Path(p).rglob("*") if f.is_file())
+        elif os.path.isfile(p):
+            out.add(p)
+    return sorted(out)
+
+
+def file_entry(path: str, previous: dict | None = None) -> dict:
+    """{sha256, size, mtime_ns}; boyut ve mtime önceki kayıtla aynıysa özet yeniden hesaplanmaz."""
+    st = os.stat(path)
+    if previous and previous.get("size") == st.st_size and previous.get("mtime_ns") == st.st_mtime_ns:
+        return previous
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK):
+            h.update(chunk)
+    return {"sha256": h.hexdigest(), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def snapshot(paths: list[str], previous: dict | None = None) -> dict:
+    previous = previous or {}
+    return {p: file_entry(p, previous.get(p)) for p in expand(paths)}
+
+
+def manifest_path(folder: str, stage: str) -> Path:
+    return state_dir(folder) / f"{stage}.json"
+
+
+def load_manifest(folder: str, stage: str) -> dict | None:
+    path = manifest_path(folder, stage)
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_atomic(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def write_manifest(folder: str, stage: str, inputs: list[str], outputs: list[str],
+                   key: dict | None = None, wall_sec: float | None = None, refetchable: bool = False) -> dict:
+    previous = load_manifest(folder, stage) or {}
+    manifest = {
+        "stage": stage,
+        "folder": folder,
+        "completed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "wall_sec": round(wall_sec, 2) if wall_sec is not None else None,
+        "key": key or {},
+        "refetchable": refetchable,
+        "input_patterns": inputs,
+        "output_patterns": outputs,
+        "inputs": snapshot(inputs, previous.get("inputs")),
+        "outputs": snapshot(outputs, previous.get("outputs")),
+    }
+    write_json_atomic(manifest_path(folder, stage), manifest)
+    return manifest
+
+
+def check_manifest(folder: str, stage: str, inputs: list[str], outputs: list[str],
+                   key: dict | None = None, refetchable: bool = False) -> tuple[bool, str]:
+    """
+    (tamam mı, sebep). Çıktılar kayıttaki özetlerle birebir durmalı; girdiler yerelde
+    varsa değişmemiş olmalı (yoksa — ör. önbellekten dönülmüş çalıştırmada indirilmemiş
+    kayıtlar — adım yine tamam sayılır, sadece tekrar çalışması gerekirse eksiktir).
+    refetchable: çıktıların yerelde olmaması da kabul edilir (indirme adımı gibi, gerekince tekrar üretilir).
+    """
+    m = load_manifest(folder, stage)
+    if not m:
+        return False, "manifest yok"
+    # Anahtar JSON'dan okunduğu biçimle karşılaştırılır (tuple -> liste)
+    if m.get("key", {}) != json.loads(json.dumps(key or {})) or m.get("input_patterns") != inputs or m.get("output_patterns") != outputs:
+        return False, "adım tanımı / anahtar değişti"
+    current = snapshot(outputs, m["outputs"])
+    if set(current) - set(m["outputs"]) or (set(current) != set(m["outputs"]) and not refetchable):
+        return False, "çıktı eksik"
+    changed = [p for p, e in current.items() if e["sha256"] != m["outputs"][p]["sha256"]]
+    if changed:
+        return False, f"çıktı değişti: {changed[0]}"
+    present = snapshot(inputs, m["inputs"])
+    changed = [p for p, e in present.items() if p not in m["inputs"] or e["sha256"] != m["inputs"][p]["sha256"]]
+    if changed:
+        return False, f"girdi değişti: {changed[0]}"
+    return True, "tamam"
+
+
+def inputs_missing(folder: str, stage: str, inputs: list[str]) -> bool:
+    """Adımın tekrar çalışması için gereken girdilerden yerelde olmayan var mı?"""
+    m = load_manifest(folder, stage)
+    recorded = set((m or {}).get("inputs") or {})
+    present = set(expand(inputs))
+    if recorded:
+        return bool(recorded - present)
+    return not present and bool(inputs)
+
+
+# --- adım iş süresi ---
+
+def timing_path(folder: str, stage: str) -> Path:
+    return state_dir(folder) / f"{stage}.timing.json"
+
+
+def record_work_time(seconds: float) -> None:
+    """Adımın kendi ölçtüğü iş süresi; sadece run_pipeline altında (SENSE_STAGE_TIMING varsa) yazılır."""
+    path = os.environ.get(STAGE_TIMING_ENV)
+    if path:
+        write_json_atomic(Path(path), {"work_sec": round(seconds, 3)})
+
+
+def pop_work_time(path: Path) -> float | None:
+    """record_work_time kaydını okuyup siler; adım yazmadıysa None (duvar saati kullanılır)."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    path.unlink(missing_ok=True)
+    return data.get("work_sec")
+
+
+# --- rapor zamanlaması ---
+
+def record_report_time(kind: str, participants: int | None = None) -> dict | None:
+    """
+    kind="provisional": ilk ön rapor (süre bir kez yazılır, sayaç artar); "final": son rapor.
+    Pipeline başlangıcı bilinmiyorsa (SENSE_PIPELINE_STARTED yok) kaydedilmez.
+    """
+    started = os.environ.get(PIPELINE_STARTED_ENV)
+    if not started:
+        return None
+    started = float(started)
+    data = {}
+    if REPORT_TIMING_JSON.exists():
+        try:
+            data = json.loads(REPORT_TIMING_JSON.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+    if data.get("started_epoch") != started:  # önceki çalıştırmanın kaydı
+        data = {"started_epoch": started,
+                "pipeline_started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started))}
+    elapsed = round(time.time() - started, 2)
+    if kind == "provisional":
+        if "first_report_sec" not in data:
+            data["first_report_sec"] = elapsed
+            data["first_report_participants"] = participants
+        data["provisional_reports"] = data.get("provisional_reports", 0) + 1
+    else:
+        data.setdefault("first_report_sec", elapsed)
+        data["final_report_sec"] = elapsed
+    write_json_atomic(REPORT_TIMING_JSON, data)
+    return data
+
+
+def main():
+    folder = sys.argv[1] if len(sys.argv) > 1 else latest_folder()
+    if not folder:
+        print("Kullanım: python checkpoint.py [latest_folder]  (varsayılan: latest_meeting.json)", file=sys.stderr)
+        return 1
+    d = state_dir(folder)
+    if not d.exists():
+        print("Kayıtlı durum yok:", d)
+        return 0
+    for path in sorted(d.glob("*.json")):
+        m = json.loads(path.read_text(encoding="utf-8"))
+        if "stage" not in m:  # adım manifesti değil (ör. media_manifest.json yoklama önbelleği)
+            continue
+        ok, reason = check_manifest(folder, m["stage"], m["input_patterns"], m["output_patterns"], m.get("key"),
+                                    m.get("refetchable", False))
+        print(f"  {m['stage']:<16} {m['completed_at']}  {reason}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -2,12 +2,18 @@
 """
 latest_meeting.json'daki dosyaları HF'den indirir.
 Sadece .webm (ekran kayıtları) ve .txt dosyalarını indirir.
+huggingface_hub sadece indirilecek dosya varsa yüklenir.
+
+--stream: .webm'ler indirilmez; HF URL'leri meeting_data/remote_sources.json'a yazılır
+ve frame çıkarma / ses çıkarma ffmpeg ile doğrudan HF'den (HTTP Range) okur
+(media_input.py). .txt notları yine indirilir.
 """
+import argparse
 import json
 import os
 from pathlib import Path
 
-from huggingface_hub import hf_hub_download
+from media_input import REMOTE_SOURCES_JSON, RemoteMedia, write_remote_sources
 
 REPO_ID = "Caner7/Sense-AI"
 
@@ -27,6 +33,11 @@ def path_in_repo(base_path: str, file_name: str) -> str:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="En son toplantının .webm / .txt dosyalarını HF'den indirir.")
+    parser.add_argument("--stream", action="store_true",
+                        help=".webm'leri indirme; ffmpeg doğrudan HF'den okusun (remote_sources.json)")
+    args = parser.parse_args()
+
     meeting_json = Path("latest_meeting.json")
     if not meeting_json.exists():
         print("HATA: latest_meeting.json bulunamadı. Önce get_latest_meeting.py çalıştırın.")
@@ -34,13 +45,30 @@ def main():
     data = json.loads(meeting_json.read_text(encoding="utf-8"))
     base_path = data.get("base_path") or ""
     files = data.get("files") or []
+    names = [n for n in (f.get("name") or "" for f in files) if n.endswith((".webm", ".txt"))]
+    if not names:
+        print("İndirilecek .webm / .txt dosyası yok.")
+        return 0
+
+    from huggingface_hub import hf_hub_download, hf_hub_url
+
     out_dir = Path("meeting_data")
     out_dir.mkdir(exist_ok=True)
     token = get_token()
-    for f in files:
-        name = f.get("name") or ""
-        if not (name.endswith(".webm") or name.endswith(".txt")):
-            continue
+    if args.stream:
+        sizes = {f.get("name"): f.get("size") for f in files}
+        remote = [
+            RemoteMedia(name, hf_hub_url(REPO_ID, path_in_repo(base_path, name), repo_type="dataset"), sizes.get(name))
+            for name in names if name.endswith(".webm")
+        ]
+        write_remote_sources(remote)
+        for r in remote:
+            print("Akış kaynağı:", r.name)
+        print("Yazıldı:", REMOTE_SOURCES_JSON)
+        names = [n for n in names if not n.endswith(".webm")]
+    else:
+        REMOTE_SOURCES_JSON.unlink(missing_ok=True)
+    for name in names:
         try:
             rel = path_in_repo(base_path, name)
             path = hf_hub_download(
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Transkript segmentleri (meeting_transcript.json) ile DAiSEE frame skorlarını
+(evaluation.json) zaman üzerinden birleştirir: her konuşma segmenti sırasında
+katılımcıların ilgisi ve konuşmacı bazlı ilgi özetleri.
+
+Segment başına tüm frame'leri taramak yerine: frame zaman damgaları sıralı, ilgi
+skorları ve dominant etiket sayıları önek toplamları (prefix sum) olarak tutulur;
+sıralı segment başlangıç/bitişleri üzerinde iki işaretçi ile her segmentin frame
+aralığı bulunur. Toplam maliyet O(S log S + F) (S segment, F frame; katılımcı başına).
+
+Çıktı: meeting_engagement.json
+"""
+import json
+from itertools import accumulate
+from pathlib import Path
+
+EVALUATION_JSON = Path("evaluation.json")
+TRANSCRIPT_JSON = Path("meeting_transcript.json")
+OUTPUT_JSON = Path("meeting_engagement.json")
+
+# DAiSEE: scores dizisi [boredom, confusion, engagement, frustration]
+LABELS_EN = ["boredom", "confusion", "engagement", "frustration"]
+ENGAGEMENT_IDX = 2
+FRAME_INTERVAL_SEC = 0.5  # evaluation.json'da frameInterval yoksa
+
+
+class ParticipantIndex:
+    """Bir katılımcının sıralı frame zamanları + ilgi skoru ve dominant etiket önek toplamları."""
+
+    def __init__(self, frames: list[dict], interval: float = FRAME_INTERVAL_SEC):
+        # Frame i, [i*Δ, (i+1)*Δ) aralığını temsil eder (fps=2, t=0 ızgarası)
+        self.times = [i * interval for i in range(len(frames))]
+        eng = []
+        dominant = {label: [] for label in LABELS_EN}
+        for f in frames:
+            scores = f.get("scores") or []
+            eng.append(float(scores[ENGAGEMENT_IDX]) if len(scores) > ENGAGEMENT_IDX else 0.0)
+            for label in LABELS_EN:
+                dominant[label].append(1 if f.get("dominant") == label else 0)
+        self.eng_prefix = [0.0, *accumulate(eng)]
+        self.dominant_prefix = {label: [0, *accumulate(v)] for label, v in dominant.items()}
+
+    def aggregate(self, lo: int, hi: int) -> dict | None:
+        """[lo, hi) frame aralığının özeti; aralık boşsa None."""
+        n = hi - lo
+        if n <= 0:
+            return None
+        counts = {label: p[hi] - p[lo] for label, p in self.dominant_prefix.items()}
+        return {
+            "frames": n,
+            "engagement_sum": self.eng_prefix[hi] - self.eng_prefix[lo],
+            "dominant_counts": counts,
+        }
+
+
+def frame_ranges(times: list[float], segments: list[dict]) -> list[tuple[int, int]]:
+    """
+    Her segment için [start, end) içindeki frame indeks aralığı (lo, hi).
+    Başlangıçlar ve bitişler ayrı ayrı sıralanıp iki işaretçiyle taranır: O(S log S + F)
+    (transkript genelde zamana göre sıralı olduğundan Timsort pratikte doğrusala yakın geçer).
+    """
+    n = len(times)
+    bounds = {}
+    for key in ("start", "end"):
+        pos = [0] * len(segments)
+        j = 0
+        for i in sorted(range(len(segments)), key=lambda i: segments[i][key]):
+            t = segments[i][key]
+            while j < n and times[j] < t:
+                j += 1
+            pos[i] = j
+        bounds[key] = pos
+    return [(lo, max(lo, hi)) for lo, hi in zip(bounds["start"], bounds["end"])]
+
+
+def _finish(acc: dict) -> dict:
+    frames = acc["frames"]
+    counts = acc["dominant_counts"]
+    return {
+        "frames": frames,
+        "engagement": round(acc["engagement_sum"] / frames, 4) if frames else None,
+        "distribution": {k: round(v / frames, 4) for k, v in counts.items()} if frames else {},
+        "dominant": max(counts, key=counts.get) if frames else None,
+    }
+
+
+def _merge(into: dict, agg: dict) -> None:
+    into["frames"] += agg["frames"]
+    into["engagement_sum"] += agg["engagement_sum"]
+    for k, v in agg["dominant_counts"].items():
+        into["dominant_counts"][k] += v
+
+
+def _empty() -> dict:
+    return {"frames": 0, "engagement_sum": 0.0, "dominant_counts": {label: 0 for label in LABELS_EN}}
+
+
+def join(eval_data: dict, transcript: dict, interval: float = FRAME_INTERVAL_SEC) -> dict:
+    """Segment bazlı ve konuşmacı bazlı ilgi özetleri."""
+    videos = eval_data.get("videos") or {}
+    segments = [s for s in transcript.get("segments") or [] if s.get("end", 0) > s.get("start", 0)]
+    indexes = {name: ParticipantIndex(v.get("frames") or [], interval) for name, v in sorted(videos.items())}
+    ranges = {name: frame_ranges(idx.times, segments) for name, idx in indexes.items()}
+
+    out_segments = []
+    speakers: dict[str, dict] = {}
+    for i, seg in enumerate(segments):
+        total = _empty()
+        participants = {}
+        for name, idx in indexes.items():
+            agg = idx.aggregate(*ranges[name][i])
+            if agg:
+                participants[name] = _finish(agg)
+                _merge(total, agg)
+        speaker = seg.get("speaker") or "SPEAKER_00"
+        sp = speakers.setdefault(speaker, {"segments": 0, "duration_sec": 0.0, **_empty()})
+        sp["segments"] += 1
+        sp["duration_sec"] += seg["end"] - seg["start"]
+        _merge(sp, total)
+        out_segments.append({
+            "start": seg["start"],
+            "end": seg["end"],
+            "speaker": speaker,
+            "text": seg.get("text", ""),
+            **_finish(total),
+            "participants": participants,
+        })
+
+    return {
+        "frame_interval_sec": interval,
+        "segments": out_segments,
+        "speakers": {
+            name: {"segments": sp["segments"], "duration_sec": round(sp["duration_sec"], 2), **_finish(sp)}
+            for name, sp in sorted(speakers.items())
+        },
+    }
+
+
+def load_json(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main():
+    eval_data = load_json(EVALUATION_JSON)
+    transcript = load_json(TRANSCRIPT_JSON)
+    if not (eval_data.get("videos") and transcript.get("segments")):
+        print("evaluation.json veya meeting_transcript.json yok/boş; eşleştirme atlanıyor.")
+        return 0
+    data = join(eval_data, transcript, eval_data.get("frameInterval") or FRAME_INTERVAL_SEC)
+    OUTPUT_JSON.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"Yazıldı: {OUTPUT_JSON} ({len(data['segments'])} segment, {len(data['speakers'])} konuşmacı)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,23 +1,44 @@
 /**
  * frames/ altındaki frame PNG'lerini DAiSEE modeli ile değerlendirir.
- * Çıktı: evaluation.json (video bazında frame skorları; 4 sınıf: engagement seviyeleri)
+ * Çıktı: evaluation.ndjson (her LOG_BATCH_FRAMES frame'de bir satır eklenir; biçim
+ * evaluation_log.py'de) ve bitince ondan akış halinde sıkıştırılan evaluation.json
+ * (video bazında frame skorları; 4 sınıf: engagement seviyeleri). Skorlar bellekte
+ * birikmez; süreç çökerse puanlanan frame'ler kayıtta kalır.
+ *
+ * --worker: stream_pipeline.py için çıkarım işçisi. stdin'den ham RGB frame
+ * batch'leri okur, her batch için stdout'a tek satır JSON sonuç yazar.
+ *
+ * DAISEE_VARIANT=float16|uint8: quantize_model.py ile üretilen düşük hassasiyetli
+ * ağırlık varyantını (daisee_<variant>/) kullanır. Varsayılan: float32 (daisee/).
+ *
+ * --resume: mevcut evaluation.ndjson aynı model varyantına ve frame aralığına aitse her video
+ * kayıttaki son puanlanan frame'den devam eder (frame adları klasördekilerle uyuşmayan video baştan).
+ *
+ * Frame aralığı (sn) extract_frames.py'nin yazdığı frames/sampling.json'dan okunur
+ * (yoksa 0.5); evaluation.json'a "frameInterval" olarak geçer.
  */
 import fs from "fs";
 import path from "path";
-import { fileURLToPath } from "url";
+import { fileURLToPath, pathToFileURL } from "url";
 import * as tf from "@tensorflow/tfjs-node";
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
-const MODEL_DIR = path.join(__dirname, "daisee");
-const FRAMES_DIR = path.join(__dirname, "frames");
-const OUTPUT_JSON = path.join(__dirname, "evaluation.json");
+const MODEL_VARIANTS = ["float32", "float16", "uint8"];
+// frames/ ve evaluation.json, Python adımlarında olduğu gibi çalışma dizinine göredir
+const FRAMES_DIR = path.resolve("frames");
+const OUTPUT_JSON = path.resolve("evaluation.json");
+const OUTPUT_NDJSON = path.resolve("evaluation.ndjson");
+const SAMPLING_JSON = path.join(FRAMES_DIR, "sampling.json");
+const DEFAULT_FRAME_INTERVAL = 0.5;
 
 // DAiSEE: 4 çıktı (örn. boredom, confusion, engagement, frustration seviyeleri 0-3)
-const LABELS = ["boredom", "confusion", "engagement", "frustration"];
+export const LABELS = ["boredom", "confusion", "engagement", "frustration"];
+const WIDTH = 224, HEIGHT = 224;
+const FRAME_BYTES = WIDTH * HEIGHT * 3;
+const LOG_BATCH_FRAMES = 32;
+const READ_CHUNK = 1 << 20;
 
-async function loadImageAsTensor(imagePath) {
-  const buf = fs.readFileSync(imagePath);
-  const tensor = tf.node.decodeImage(buf, 3);
+function toModelInput(tensor) {
   const resized = tf.image.resizeBilinear(tensor, [224, 224]);
   tensor.dispose();
   const normalized = resized.div(255.0);
@@ -27,6 +48,26 @@ async function loadImageAsTensor(imagePath) {
   return batched;
 }
 
+export async function loadImageAsTensor(imagePath) {
+  const buf = fs.readFileSync(imagePath);
+  return toModelInput(tf.node.decodeImage(buf, 3));
+}
+
+function rawFrameAsTensor(bytes) {
+  // decodeImage ile aynı dtype (int32) -> PNG yolu ile birebir aynı girdi
+  return toModelInput(tf.tensor3d(Int32Array.from(bytes), [HEIGHT, WIDTH, 3], "int32"));
+}
+
+function frameName(index) {
+  // ffmpeg frame_%04d.png ile aynı ad (1'den başlar)
+  return `frame_${String(index + 1).padStart(4, "0")}.png`;
+}
+
+function frameNumber(file) {
+  const m = file.match(/(\d+)\.png$/);
+  return m ? parseInt(m[1], 10) : 0;
+}
+
 function argmax(arr) {
   let max = arr[0], idx = 0;
   for (let i = 1; i < arr.length; i++) {
@@ -35,62 +76,308 @@ function argmax(arr) {
   return idx;
 }
 
-async function main() {
-  const modelPath = path.join(MODEL_DIR, "model.json");
+export function modelDir(variant = process.env.DAISEE_VARIANT || "float32") {
+  if (!MODEL_VARIANTS.includes(variant)) {
+    throw new Error(`Bilinmeyen model varyantı: ${variant} (${MODEL_VARIANTS.join(", ")})`);
+  }
+  return path.join(__dirname, variant === "float32" ? "daisee" : `daisee_${variant}`);
+}
+
+export async function loadModel(variant) {
+  const dir = modelDir(variant);
+  const modelPath = path.join(dir, "model.json");
   if (!fs.existsSync(modelPath)) {
-    console.error("Model bulunamadı:", modelPath);
+    const hint = path.basename(dir) === "daisee" ? "" : "(quantize_model.py ile üretin)";
+    console.error("Model bulunamadı:", modelPath, hint);
     process.exit(1);
   }
-  const model = await tf.loadGraphModel(`file://${modelPath}`);
-  const inputName = Object.keys(model.inputs)[0] || "inputs";
-  const results = { videos: {} };
+  return tf.loadGraphModel(`file://${modelPath}`);
+}
+
+export async function scoreInput(model, input, file) {
+  const out = model.predict(input);
+  input.dispose();
+  const arr = (await out.dataSync());
+  out.dispose();
+  const pred = Array.from(arr);
+  const classIdx = argmax(pred);
+  return {
+    frame: file,
+    scores: pred,
+    dominant: LABELS[classIdx],
+    level: classIdx,
+  };
+}
+
+async function runWorker() {
+  // Protokol: her batch = bir JSON başlık satırı {"video","start","count"} + count * FRAME_BYTES ham RGB.
+  // Yanıt: batch başına tek satır {"video","start","frames":[...]}. Loglar stderr'e gider.
+  const model = await loadModel();
+  // Gelen parçalar biriktirilir, batch tamamlanınca bir kez birleştirilir (her parçada tüm batch kopyalanmaz)
+  const chunks = [];
+  let buffered = 0;
+  let header = null;
+  const newlineAt = () => {
+    let offset = 0;
+    for (const c of chunks) {
+      const i = c.indexOf(10);
+      if (i >= 0) return offset + i;
+      offset += c.length;
+    }
+    return -1;
+  };
+  const take = (n) => {
+    // İlk n bayt: yalnızca gereken parçalar kopyalanır, kalan kısım görünüm olarak kuyrukta kalır
+    let k = 0, len = 0;
+    while (len < n) len += chunks[k++].length;
+    const joined = k === 1 ? chunks[0] : Buffer.concat(chunks.slice(0, k), len);
+    chunks.splice(0, k, ...(len > n ? [joined.subarray(n)] : []));
+    buffered -= n;
+    return joined.subarray(0, n);
+  };
+  for await (const chunk of process.stdin) {
+    chunks.push(chunk);
+    buffered += chunk.length;
+    for (;;) {
+      if (!header) {
+        const nl = newlineAt();
+        if (nl < 0) break;
+        header = JSON.parse(take(nl + 1).subarray(0, nl).toString("utf-8"));
+      }
+      const size = header.count * FRAME_BYTES;
+      if (buffered < size) break;
+      const batch = take(size);
+      const frames = [];
+      for (let i = 0; i < header.count; i++) {
+        const bytes = batch.subarray(i * FRAME_BYTES, (i + 1) * FRAME_BYTES);
+        frames.push(await scoreInput(model, rawFrameAsTensor(bytes), frameName(header.start + i)));
+      }
+      process.stdout.write(JSON.stringify({ video: header.video, start: header.start, frames }) + "\n");
+      header = null;
+    }
+  }
+}
+
+// --- evaluation.ndjson (evaluation_log.py ile aynı satır biçimi) ---
+
+class EvaluationLog {
+  constructor(file, variant, frameInterval, append) {
+    this.fd = fs.openSync(file, append ? "a" : "w");
+    if (!append) {
+      this.write({
+        type: "header", variant, labels: LABELS, frameInterval, created_at: new Date().toISOString().slice(0, 19),
+      });
+    }
+  }
+
+  write(record) {
+    fs.writeSync(this.fd, JSON.stringify(record) + "\n");
+  }
+
+  batch(video, start, frames) {
+    if (frames.length) this.write({ type: "batch", video, start, frames });
+  }
+
+  close(complete = true) {
+    if (complete) this.write({ type: "end" });
+    fs.closeSync(this.fd);
+  }
+}
+
+function* logLines(file) {
+  // Tam satırlar (bayt konumu + içerik); yarım kalan son satır atlanır
+  const fd = fs.openSync(file, "r");
+  try {
+    const chunk = Buffer.alloc(READ_CHUNK);
+    let pending = Buffer.alloc(0), offset = 0, n;
+    while ((n = fs.readSync(fd, chunk, 0, READ_CHUNK, null)) > 0) {
+      pending = Buffer.concat([pending, chunk.subarray(0, n)]);
+      let nl;
+      while ((nl = pending.indexOf(10)) >= 0) {
+        yield { offset, line: pending.subarray(0, nl) };
+        offset += nl + 1;
+        pending = pending.subarray(nl + 1);
+      }
+    }
+  } finally {
+    fs.closeSync(fd);
+  }
+}
+
+function scanLog(file) {
+  // { header, videos: ad -> {batches, frameCount, summary}, complete, end: geçerli son bayt }
+  const out = { header: {}, videos: new Map(), complete: false, end: 0 };
+  const entry = (name) => {
+    if (!out.videos.has(name)) out.videos.set(name, { batches: [], frameCount: null, summary: null });
+    return out.videos.get(name);
+  };
+  for (const { offset, line } of logLines(file)) {
+    let rec;
+    try {
+      rec = JSON.parse(line.toString("utf-8"));
+    } catch {
+      break;
+    }
+    out.end = offset + line.length + 1;
+    out.complete = rec.type === "end";
+    if (rec.type === "header") out.header = rec;
+    else if (rec.type === "reset") out.videos.set(rec.video, { batches: [], frameCount: null, summary: null });
+    else if (rec.type === "batch") entry(rec.video).batches.push({ start: rec.start, count: rec.frames.length, offset, length: line.length });
+    else if (rec.type === "video") Object.assign(entry(rec.video), { frameCount: rec.frameCount, summary: rec.summary });
+  }
+  return out;
+}
+
+function* logFrames(file, video) {
+  // Videonun frame'leri sırayla; ilk boşlukta durur
+  const fd = fs.openSync(file, "r");
+  try {
+    let next = 0;
+    for (const b of [...video.batches].sort((x, y) => x.start - y.start)) {
+      if (b.start > next) return;
+      if (b.start + b.count <= next) continue;
+      const buf = Buffer.alloc(b.length);
+      fs.readSync(fd, buf, 0, b.length, b.offset);
+      yield* JSON.parse(buf.toString("utf-8")).frames.slice(next - b.start);
+      next = b.start + b.count;
+    }
+  } finally {
+    fs.closeSync(fd);
+  }
+}
+
+function summarize(frames) {
+  let count = 0;
+  const summary = {};
+  for (const f of frames) {
+    count++;
+    summary[f.dominant] = (summary[f.dominant] || 0) + 1;
+  }
+  return { count, summary };
+}
+
+function indented(value, level) {
+  return JSON.stringify(value, null, 2).replace(/\n/g, "\n" + "  ".repeat(level));
+}
+
+export function compactLog(file = OUTPUT_NDJSON, out = OUTPUT_JSON) {
+  // evaluation.json'u JSON.stringify(results, null, 2) biçiminde video video yazar
+  const { header, videos } = scanLog(file);
+  const tmp = `${out}.tmp`;
+  const fd = fs.openSync(tmp, "w");
+  const names = [...videos.keys()].sort();
+  if (!names.length) {
+    fs.writeSync(fd, '{\n  "videos": {}');
+  } else {
+    fs.writeSync(fd, '{\n  "videos": {');
+    names.forEach((name, i) => {
+      const v = videos.get(name);
+      const { count, summary } = v.summary ? { count: v.frameCount, summary: v.summary } : summarize(logFrames(file, v));
+      fs.writeSync(fd, `${i ? "," : ""}\n    ${JSON.stringify(name)}: {\n      "frameCount": ${count},\n      "frames": `);
+      if (!count) {
+        fs.writeSync(fd, "[]");
+      } else {
+        let sep = "[";
+        for (const f of logFrames(file, v)) {
+          fs.writeSync(fd, `${sep}\n        ${indented(f, 4)}`);
+          sep = ",";
+        }
+        fs.writeSync(fd, "\n      ]");
+      }
+      fs.writeSync(fd, `,\n      "summary": ${indented(summary, 3)}\n    }`);
+    });
+    fs.writeSync(fd, "\n  }");
+  }
+  fs.writeSync(fd, `,\n  "frameInterval": ${JSON.stringify(header.frameInterval ?? DEFAULT_FRAME_INTERVAL)}\n}`);
+  fs.closeSync(fd);
+  fs.renameSync(tmp, out);
+}
+
+function frameInterval() {
+  if (!fs.existsSync(SAMPLING_JSON)) return DEFAULT_FRAME_INTERVAL;
+  return JSON.parse(fs.readFileSync(SAMPLING_JSON, "utf-8")).frameInterval ?? DEFAULT_FRAME_INTERVAL;
+}
+
+function resumeState(variant, interval) {
+  // Önceki kayıttan devam edilebilecek videolar: ad -> {frames: frame adları, summary, done}
+  if (!fs.existsSync(OUTPUT_NDJSON)) return null;
+  const log = scanLog(OUTPUT_NDJSON);
+  if (log.header.variant !== variant || (log.header.frameInterval ?? DEFAULT_FRAME_INTERVAL) !== interval) return null;
+  fs.truncateSync(OUTPUT_NDJSON, log.end);
+  const state = new Map();
+  for (const [name, v] of log.videos) {
+    const names = [];
+    const counts = {};
+    for (const f of logFrames(OUTPUT_NDJSON, v)) {
+      names.push(f.frame);
+      counts[f.dominant] = (counts[f.dominant] || 0) + 1;
+    }
+    state.set(name, { frames: names, summary: counts, done: v.summary !== null });
+  }
+  return state;
+}
+
+async function main() {
+  if (process.argv.includes("--worker")) {
+    return runWorker();
+  }
+  const variant = process.env.DAISEE_VARIANT || "float32";
+  const interval = frameInterval();
+  const previous = process.argv.includes("--resume") ? resumeState(variant, interval) : null;
+  const log = new EvaluationLog(OUTPUT_NDJSON, variant, interval, previous !== null);
 
   if (!fs.existsSync(FRAMES_DIR)) {
-    fs.writeFileSync(OUTPUT_JSON, JSON.stringify({ videos: {} }, null, 2));
+    log.close();
+    compactLog();
     console.log("frames/ yok, boş evaluation yazıldı.");
     return;
   }
+  const model = await loadModel();
   const videoDirs = fs.readdirSync(FRAMES_DIR, { withFileTypes: true })
     .filter((d) => d.isDirectory())
-    .map((d) => d.name);
+    .map((d) => d.name)
+    .sort();
 
   for (const videoName of videoDirs) {
     const dir = path.join(FRAMES_DIR, videoName);
+    // Sayısal sıralama: 9999'dan sonra frame_10000.png sözlük sırasında araya girmesin
     const files = fs.readdirSync(dir)
       .filter((f) => f.endsWith(".png"))
-      .sort();
-    const scores = [];
-    for (const file of files) {
-      const imgPath = path.join(dir, file);
-      const input = await loadImageAsTensor(imgPath);
-      const out = model.predict(input);
-      input.dispose();
-      const arr = (await out.dataSync());
-      out.dispose();
-      const pred = Array.from(arr);
-      const classIdx = argmax(pred);
-      scores.push({
-        frame: file,
-        scores: pred,
-        dominant: LABELS[classIdx],
-        level: classIdx,
-      });
+      .sort((a, b) => frameNumber(a) - frameNumber(b));
+    // Kayıttaki önek bu klasörün ilk frame'leriyle aynıysa kaldığı yerden devam
+    const prev = previous?.get(videoName);
+    const resumable = prev && prev.frames.length <= files.length && prev.frames.every((f, i) => f === files[i]);
+    if (prev && !resumable) log.write({ type: "reset", video: videoName });
+    if (resumable && prev.done && prev.frames.length === files.length) continue;
+    let count = resumable ? prev.frames.length : 0;
+    const summary = resumable ? prev.summary : {};
+    if (count) console.log(`Devam: ${videoName} (${count} frame önceden puanlanmış)`);
+    let batch = [], batchStart = count;
+    for (const file of files.slice(count)) {
+      const input = await loadImageAsTensor(path.join(dir, file));
+      const s = await scoreInput(model, input, file);
+      summary[s.dominant] = (summary[s.dominant] || 0) + 1;
+      batch.push(s);
+      count++;
+      if (batch.length >= LOG_BATCH_FRAMES) {
+        log.batch(videoName, batchStart, batch);
+        batch = [];
+        batchStart = count;
+      }
     }
-    results.videos[videoName] = {
-      frameCount: scores.length,
-      frames: scores,
-      summary: scores.reduce((acc, s) => {
-        acc[s.dominant] = (acc[s.dominant] || 0) + 1;
-        return acc;
-      }, {}),
-    };
+    log.batch(videoName, batchStart, batch);
+    log.write({ type: "video", video: videoName, frameCount: count, summary });
   }
 
-  fs.writeFileSync(OUTPUT_JSON, JSON.stringify(results, null, 2), "utf-8");
-  console.log("Değerlendirme yazıldı:", OUTPUT_JSON);
+  log.close();
+  compactLog();
+  console.log("Değerlendirme yazıldı:", OUTPUT_NDJSON, "->", OUTPUT_JSON);
 }
 
-main().catch((err) => {
-  console.error(err);
-  process.exit(1);
-});
+// Sadece doğrudan çalıştırıldığında (benchmark'lar fonksiyonları import eder)
+if (import.meta.url === pathToFileURL(process.argv[1]).href) {
+  main().catch((err) => {
+    console.error(err);
+    process.exit(1);
+  });
+}
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Değerlendirme sonuçlarının artımlı kaydı (evaluation.ndjson) ve evaluation.json'a sıkıştırma.
+
+evaluate_frames.mjs ve stream_pipeline.py sonuçları sonda tek bir JSON olarak yazmak
+yerine, her batch puanlandıkça bu dosyaya bir satır ekler. Bellek toplantı uzunluğuyla
+büyümez; süreç çökerse o ana kadar puanlanan frame'ler diskte kalır (yarım kalan son
+satır okurken yok sayılır). Yarıda kalan kayda --resume ile devam edilir (sonuna eklenir).
+
+Satır türleri (her satır tek JSON nesnesi):
+  {"type": "header", "variant": ..., "labels": [...], "frameInterval": sn, "created_at": ...}   ilk satır
+      stream_pipeline.py ayrıca "sources": {ad: kaynak dosya boyutu} yazar (devam kontrolü için)
+  {"type": "batch", "video": ad, "start": i, "frames": [...]}             i. frame'den başlayan batch
+  {"type": "video", "video": ad, "frameCount": n, "summary": {...}}       video bitti
+  {"type": "reset", "video": ad, "bytes": boyut}                          adın önceki kayıtları geçersiz
+  {"type": "end"}                                                         değerlendirme tamamlandı
+
+Batch'ler sıra dışı gelebilir (paralel decode aralıkları); okuyucu her video için
+baştan boşluksuz frame önekini kullanır.
+
+compact(): evaluation.json'u (json.dumps(..., indent=2) ile aynı biçim) video video,
+batch batch akış halinde yazar; bellekte sadece satır konumları tutulur.
+read_evaluation(): raporlar için evaluation.json yerine NDJSON'u video başına okur (kayıt
+tamamlanmamışsa uyarır; ön rapor dışında daha yeni bir evaluation.json varsa onu kullanır).
+resume(): stream_pipeline.py --resume için yarım kaydın video başına puanlanmış öneki.
+
+Tek başına: python evaluation_log.py [-i evaluation.ndjson] [-o evaluation.json]  -> sıkıştırma
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+
+NDJSON_PATH = Path("evaluation.ndjson")
+EVALUATION_JSON = Path("evaluation.json")
+LABELS = ["boredom", "confusion", "engagement", "frustration"]
+DEFAULT_FRAME_INTERVAL = 0.5  # frameInterval alanı olmayan (eski) kayıtlar
+
+
+class EvaluationLogWriter:
+    """Satır ekleyici; her satır yazıldığı anda diske aktarılır. Thread'ler arasında paylaşılabilir."""
+
+    def __init__(self, path: Path = NDJSON_PATH, variant: str | None = None,
+                 frame_interval: float = DEFAULT_FRAME_INTERVAL, sources: dict[str, int] | None = None,
+                 append: bool = False):
+        self.path = path
+        self.lock = threading.Lock()
+        self.f = open(path, "a" if append else "w", encoding="utf-8")
+        if not append:  # devam: başlık önceki çalıştırmanın (resume() ile eşleşmesi kontrol edildi)
+            self._write({"type": "header", "variant": variant, "labels": LABELS, "frameInterval": frame_interval,
+                         **({"sources": sources} if sources is not None else {}),
+                         "created_at": time.strftime("%Y-%m-%dT%H:%M:%S")})
+
+    def _write(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self.lock:
+            self.f.write(line)
+            self.f.flush()
+
+    def batch(self, video: str, start: int, frames: list[dict]) -> None:
+        if frames:
+            self._write({"type": "batch", "video": video, "start": start, "frames": frames})
+
+    def reset(self, video: str, size: int | None = None) -> None:
+        self._write({"type": "reset", "video": video, "bytes": size})
+
+    def video_done(self, video: str, frame_count: int, summary: dict) -> None:
+        self._write({"type": "video", "video": video, "frameCount": frame_count, "summary": summary})
+
+    def close(self, complete: bool = True) -> None:
+        if complete:
+            self._write({"type": "end"})
+        self.f.close()
+
+
+class _VideoIndex:
+    """Bir videonun NDJSON'daki batch satırları (start, frame sayısı, bayt konumu, uzunluk)."""
+
+    def __init__(self):
+        self.batches: list[tuple[int, int, int, int]] = []
+        self.frame_count: int | None = None  # "video" satırı geldiyse
+        self.summary: dict | None = None
+        self.source_bytes: int | None = None  # "reset" satırındaki kaynak boyutu
+
+
+def scan(path: Path) -> tuple[dict, dict[str, _VideoIndex], bool]:
+    """(header, video adı -> indeks, tamamlandı mı). Frame'ler bellekte tutulmaz."""
+    return _scan(path)[:3]
+
+
+def _scan(path: Path) -> tuple[dict, dict[str, _VideoIndex], bool, int]:
+    """scan() + son tam satırın bittiği bayt konumu (devamda dosya buradan kesilir)."""
+    header, videos, complete = {}, {}, False
+    offset = end = 0
+    with open(path, "rb") as f:
+        for line in f:
+            start_offset, offset = offset, offset + len(line)
+            if not line.endswith(b"\n"):
+                break  # yarım kalan son satır
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                break
+            end = offset
+            kind = rec.get("type")
+            complete = kind == "end"  # --resume ile sonuna eklenmiş kayıtta sadece son "end" geçerli
+            if kind == "header":
+                header = rec
+            elif kind == "reset":
+                videos[rec["video"]] = _VideoIndex()
+                videos[rec["video"]].source_bytes = rec.get("bytes")
+            elif kind == "batch":
+                idx = videos.setdefault(rec["video"], _VideoIndex())
+                idx.batches.append((rec["start"], len(rec["frames"]), start_offset, len(line)))
+            elif kind == "video":
+                idx = videos.setdefault(rec["video"], _VideoIndex())
+                idx.frame_count, idx.summary = rec["frameCount"], rec["summary"]
+    return header, videos, complete, end
+
+
+def iter_frames(path: Path, idx: _VideoIndex) -> Iterator[dict]:
+    """Videonun frame'leri sırayla; ilk boşlukta durur (sıra dışı gelmiş sonraki batch'ler atlanır)."""
+    next_index = 0
+    with open(path, "rb") as f:
+        for start, count, offset, length in sorted(idx.batches):
+            if start > next_index:
+                return
+            if start + count <= next_index:
+                continue
+            f.seek(offset)
+            frames = json.loads(f.read(length))["frames"]
+            yield from frames[next_index - start:]
+            next_index = start + count
+
+
+def summarize(frames) -> tuple[int, dict]:
+    """(frame sayısı, dominant etiket sayıları — evaluate_frames.mjs ile aynı, ilk görülme sırasıyla)."""
+    n, summary = 0, {}
+    for fr in frames:
+        n += 1
+        summary[fr["dominant"]] = summary.get(fr["dominant"], 0) + 1
+    return n, summary
+
+
+class EvaluationVideos(Mapping):
+    """evaluation.json'daki "videos" gibi davranır; her video erişildiğinde NDJSON'dan okunur."""
+
+    def __init__(self, path: Path, videos: dict[str, _VideoIndex], frames: bool = True):
+        self.path = path
+        self.index = videos
+        self.with_frames = frames
+
+    def __getitem__(self, name: str) -> dict:
+        idx = self.index[name]
+        if self.with_frames:
+            frames = list(iter_frames(self.path, idx))
+            count, summary = summarize(frames)
+            return {"frameCount": count, "frames": frames, "summary": summary}
+        if idx.summary is not None:
+            return {"frameCount": idx.frame_count, "summary": idx.summary}
+        count, summary = summarize(iter_frames(self.path, idx))
+        return {"frameCount": count, "summary": summary}
+
+    def __iter__(self):
+        return iter(sorted(self.index))
+
+    def finished(self) -> list[str]:
+        """"video" satırı yazılmış (puanlaması bitmiş) videolar."""
+        return sorted(n for n, idx in self.index.items() if idx.summary is not None)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+def read_evaluation(frames: bool = True, path: Path = NDJSON_PATH, json_path: Path = EVALUATION_JSON,
+                    partial: bool = False) -> dict:
+    """
+    {"videos": {...}, "frameInterval": sn, ...}: NDJSON varsa video başına tembel okunan eşleme (frames=False ise
+    sadece frameCount + summary), yoksa evaluation.json'un tamamı. İkisi de yoksa {}.
+    NDJSON tamamlanmamışsa (değerlendirme yarıda kaldı / sürüyor) ve partial=False ise uyarılır; kayıttan daha
+    yeni bir evaluation.json varsa o kullanılır. partial=True (ön rapor): yarım kayıt beklenir, uyarı yok.
+    """
+    if path.exists():
+        header, videos, complete = scan(path)
+        if not complete and not partial:
+            if json_path.exists() and json_path.stat().st_mtime >= path.stat().st_mtime:
+                print(f"UYARI: {path} tamamlanmamış; daha yeni {json_path} kullanılıyor.", file=sys.stderr)
+                return json.loads(json_path.read_text(encoding="utf-8"))
+            print(f"UYARI: {path} tamamlanmamış (değerlendirme yarıda kalmış); sonuçlar sadece o ana kadar "
+                  "puanlanan frame'leri içerir.", file=sys.stderr)
+        return {"videos": EvaluationVideos(path, videos, frames), "variant": header.get("variant"),
+                "frameInterval": header.get("frameInterval", DEFAULT_FRAME_INTERVAL), "complete": complete}
+    if json_path.exists():
+        return json.loads(json_path.read_text(encoding="utf-8"))
+    return {}
+
+
+def resume(path: Path, variant: str, frame_interval: float,
+           sources: dict[str, int]) -> dict[str, tuple[int, dict]] | None:
+    """
+    Yarıda kalan kayıttan devam (evaluate_frames.mjs --resume'un stream_pipeline.py karşılığı). Kayıt yoksa,
+    tamamlanmışsa veya başka bir model varyantına / frame aralığına aitse None (yeni kayıt açılır). Aksi halde
+    yarım son satır kesilir ve kaynak dosya boyutu kayıttakiyle aynı kalan her video için baştan boşluksuz
+    puanlanmış önek (frame sayısı, özet) döner; frame'ler belleğe alınmaz. Diğer videolar baştan puanlanır
+    (çağıran "reset" satırı ekler).
+    """
+    if not path.exists():
+        return None
+    header, videos, complete, end = _scan(path)
+    if complete or not header or header.get("variant") != variant \
+            or header.get("frameInterval", DEFAULT_FRAME_INTERVAL) != frame_interval:
+        return None
+    os.truncate(path, end)
+    recorded = header.get("sources") or {}
+    out = {}
+    for name, idx in videos.items():
+        size = idx.source_bytes if idx.source_bytes is not None else recorded.get(name)
+        if name in sources and size is not None and size == sources[name]:
+            out[name] = summarize(iter_frames(path, idx))
+    return out
+
+
+def _indented(value, level: int) -> str:
+    """json.dumps(indent=2) çıktısının iç içe `level` seviyedeki parçası."""
+    return json.dumps(value, ensure_ascii=False, indent=2).replace("\n", "\n" + "  " * level)
+
+
+def compact(path: Path = NDJSON_PATH, out: Path = EVALUATION_JSON) -> int:
+    """NDJSON -> evaluation.json (videolar isim sırasıyla + frameInterval, json.dumps(indent=2) ile aynı). Video sayısını döner."""
+    header, videos, _ = scan(path)
+    interval = header.get("frameInterval", DEFAULT_FRAME_INTERVAL)
+    tmp = out.with_name(out.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        if not videos:
+            f.write('{\n  "videos": {}')
+        else:
+            f.write('{\n  "videos": {')
+            for i, name in enumerate(sorted(videos)):
+                f.write(("," if i else "") + f"\n    {_indented(name, 0)}: {{\n      \"frameCount\": ")
+                idx = videos[name]
+                if idx.summary is not None:
+                    n, summary = idx.frame_count, idx.summary
+                else:  # video yarım kaldı: frameCount frame'lerden önce yazıldığı için önce sayılır
+                    n, summary = summarize(iter_frames(path, idx))
+                f.write(f"{n},\n      \"frames\": ")
+                if not n:
+                    f.write("[]")
+                else:
+                    f.write("[")
+                    sep = ""
+                    for fr in iter_frames(path, idx):
+                        f.write(f"{sep}\n        {_indented(fr, 4)}")
+                        sep = ","
+                    f.write("\n      ]")
+                f.write(f",\n      \"summary\": {_indented(summary, 3)}\n    }}")
+            f.write("\n  }")
+        f.write(f',\n  "frameInterval": {_indented(interval, 1)}\n}}')
+    os.replace(tmp, out)
+    return len(videos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="evaluation.ndjson -> evaluation.json (akış halinde sıkıştırma).")
+    parser.add_argument("--input", "-i", default=str(NDJSON_PATH))
+    parser.add_argument("--output", "-o", default=str(EVALUATION_JSON))
+    args = parser.parse_args()
+    path = Path(args.input)
+    if not path.exists():
+        print(f"{path} bulunamadı.")
+        return 1
+    n = compact(path, Path(args.output))
+    print(f"Sıkıştırıldı: {path} -> {args.output} ({n} video)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
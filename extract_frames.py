@@ -3,52 +3,207 @@
 meeting_data/ içindeki .webm dosyalarından 0.5 saniye aralıklarla frame çıkarır.
 Her frame 224x224 (DAiSEE model girişi) olarak kaydedilir.
 Çıktı: frames/<video_adı>/frame_0000.png, frame_0001.png, ...
+Aralık run_plan.json'dan (scheduler.py, süre bütçesi) değişebilir; kullanılan aralık
+frames/sampling.json'a yazılır, evaluate_frames.mjs oradan okur.
+
+Uzun kayıtlar (SPLIT_MIN_DURATION üstü) zaman aralıklarına bölünüp paralel ffmpeg
+süreçleriyle decode edilir; her aralık kendi frame indeksinden numaralandığı için
+çıktı tek geçişli decode ile aynı (aynı sayıda, aynı sırada, aynı içerikte) frame'lerdir.
+
+Kayıtlar yerel dosya ya da (download_meeting.py --stream) HF üzerindeki URL olabilir;
+ffmpeg girdisi media_input.input_args ile kurulur. Hangi kaydın görüntü içerdiği dosya
+adından değil konteyner başlığından belirlenir (media_manifest.py); en uzun kayıt önce işlenir.
 """
+import json
+import math
+import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-FRAME_INTERVAL = 0.5  # saniye
+from checkpoint import planned
+from media_input import input_args, is_remote
+from media_manifest import video_infos
+
+FRAME_INTERVAL = planned("frame_interval", 0.5)  # saniye (varsayılan 0.5; scheduler.py planı)
 WIDTH, HEIGHT = 224, 224
 INPUT_DIR = Path("meeting_data")
 OUTPUT_DIR = Path("frames")
-# Sadece ses içeren .webm'leri atla (video track yok, frame çıkarılamaz)
-AUDIO_ONLY_NAME_HINTS = ("ses", "audio", "sound", "toplanti_sesi", "meeting_audio")
+SAMPLING_JSON = OUTPUT_DIR / "sampling.json"
+# fps=1/FRAME_INTERVAL (0.5 s => 2 frame/saniye); en-boy oranı korunur, kenarlar doldurulur.
+# start_time=0: frame ızgarası ilk paketin zamanına değil t=0'a sabitlenir (bölünmüş decode ile aynı ızgara)
+SCALE_FILTER = (
+    f"scale={WIDTH}:{HEIGHT}:force_original_aspect_ratio=decrease,"
+    f"pad={WIDTH}:{HEIGHT}:(ow-iw)/2:(oh-ih)/2"
+)
+VIDEO_FILTER = f"fps={1 / FRAME_INTERVAL:g}:start_time=0,{SCALE_FILTER}"
+FRAME_BYTES = WIDTH * HEIGHT * 3  # rgb24 ham frame boyutu
+# Bu süreden kısa videolar tek ffmpeg süreciyle decode edilir
+SPLIT_MIN_DURATION = 600.0  # saniye
+SPLIT_SEGMENTS = max(1, min(8, os.cpu_count() or 1))
 
 
-def extract_from_video(video_path: Path) -> Path | None:
-    """Bir .webm'den frame çıkar. Dönen path frame klasörü."""
-    out_sub = OUTPUT_DIR / video_path.stem
-    out_sub.mkdir(parents=True, exist_ok=True)
+def find_video_webms() -> list:
+    """
+    meeting_data altındaki (veya remote_sources.json'daki) görüntü akışı olan kayıtlar,
+    en uzundan kısaya (media_manifest; sadece ses içeren .webm'ler hariç).
+    """
+    return [i.source for i in video_infos(INPUT_DIR)]
+
+
+def probe_duration(video_path) -> float | None:
+    """
+    Video süresi (sn). Önce konteyner başlığı (ffprobe); tarayıcı MediaRecorder kayıtlarında
+    süre başlıkta olmadığından, yoksa decode etmeden paketleri okuyarak (-c copy) bulunur.
+    Uzak kayıtta tüm dosyayı aktaracağı için bu tarama yapılmaz; adres çözülemezse de None
+    (tek geçişli decode).
+    """
+    try:
+        args = input_args(video_path)
+    except OSError as e:
+        print(f"Uzak kayıt açılamadı ({video_path.name}):", e, file=sys.stderr)
+        return None
+    try:
+        r = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", *args],
+            capture_output=True, text=True,
+        )
+        return float(r.stdout.strip())
+    except (FileNotFoundError, ValueError):
+        pass
+    if is_remote(video_path):
+        return None
+    r = subprocess.run(
+        ["ffmpeg", "-hide_banner", *args, "-map", "0:v:0", "-c", "copy", "-f", "null", "-"],
+        capture_output=True, text=True,
+    )
+    times = re.findall(r"time=(\d+):(\d+):(\d+(?:\.\d+)?)", r.stderr)
+    if not times:
+        return None
+    h, m, s = times[-1]
+    return int(h) * 3600 + int(m) * 60 + float(s)
+
+
+def plan_segments(duration: float | None, segments: int = SPLIT_SEGMENTS) -> list[tuple[int, int | None]]:
+    """
+    Decode aralıkları: (başlangıç frame indeksi, frame sayısı). Son aralığın sayısı None'dır
+    (dosya sonuna kadar). Sınırlar FRAME_INTERVAL ızgarasına denk gelir.
+    """
+    if not duration or duration < SPLIT_MIN_DURATION or segments <= 1:
+        return [(0, None)]
+    total = int(duration / FRAME_INTERVAL)
+    per = math.ceil(total / segments)
+    starts = list(range(0, total, per))
+    return [(s, per) for s in starts[:-1]] + [(starts[-1], None)]
+
+
+def decode_args(video_path, start_index: int = 0, count: int | None = None) -> list[str]:
+    """
+    Bir aralığı decode eden ffmpeg girdi + filtre argümanları.
+    Aralık başlangıcında, sınırdan önceki son frame'in (ekran kayıtlarında saniyelerce
+    tekrarlanabilir) tek geçişle aynı seçilmesi için: keyframe'e hızlı seek
+    (-noaccurate_seek), mutlak zaman damgaları (-copyts -start_at_zero), t=0 ızgarasında
+    fps ve ızgaradan sonra trim. Uzak adres çözülemezse OSError (media_input.input_args).
+    """
+    if start_index == 0 and count is None:
+        return [*input_args(video_path), "-vf", VIDEO_FILTER]
+    start_sec = start_index * FRAME_INTERVAL
+    args = [
+        "-noaccurate_seek", "-copyts", "-start_at_zero", "-ss", f"{start_sec:g}",
+        *input_args(video_path),
+        "-vf", f"fps={1 / FRAME_INTERVAL:g}:start_time=0,trim=start={start_sec:g},{SCALE_FILTER}",
+    ]
+    if count is not None:
+        args += ["-frames:v", str(count)]
+    return args
+
+
+def _extract_segment(video_path, out_sub: Path, start_index: int, count: int | None) -> None:
     # ffmpeg: -i input -vf fps=2,scale=224:224 -q:v 1 frame_%04d.png
-    # fps=2 => 2 frame/saniye = 0.5s aralık
+    try:
+        args = decode_args(video_path, start_index, count)
+    except OSError as e:
+        print(f"Uzak kayıt açılamadı ({video_path.name}, frame {start_index}'den):", e, file=sys.stderr)
+        return
     cmd = [
         "ffmpeg",
-        "-i", str(video_path),
-        "-vf", f"fps=2,scale={WIDTH}:{HEIGHT}:force_original_aspect_ratio=decrease,pad={WIDTH}:{HEIGHT}:(ow-iw)/2:(oh-ih)/2",
+        *args,
         "-q:v", "1",
+        "-start_number", str(start_index + 1),
         str(out_sub / "frame_%04d.png"),
     ]
     r = subprocess.run(cmd, capture_output=True, text=True)
     if r.returncode != 0 and "Output file is empty" not in r.stderr:
         print("ffmpeg uyarı/hata:", r.stderr[-500:] if r.stderr else r.stdout, file=sys.stderr)
+
+
+def extract_from_video(video_path, segments: int = SPLIT_SEGMENTS, duration: float | None = None) -> Path | None:
+    """
+    Bir .webm'den frame çıkar (uzunsa zaman aralıklarına bölünüp paralel). Dönen path frame klasörü.
+    duration: manifestten bilinen süre (yoksa probe_duration ile bulunur).
+    """
+    out_sub = OUTPUT_DIR / video_path.stem
+    out_sub.mkdir(parents=True, exist_ok=True)
+    if segments > 1:
+        plan = plan_segments(duration or probe_duration(video_path), segments)
+    else:
+        plan = [(0, None)]
+    if len(plan) > 1:
+        print(f"  {len(plan)} aralıkta paralel decode")
+    with ThreadPoolExecutor(max_workers=len(plan)) as pool:
+        list(pool.map(lambda seg: _extract_segment(video_path, out_sub, *seg), plan))
     if not list(out_sub.glob("frame_*.png")):
         return None
     return out_sub
 
 
+def iter_raw_frames(video_path, batch_frames: int, start_index: int = 0, count: int | None = None):
+    """
+    Frame'leri PNG yazmadan ham rgb24 olarak akıtır (extract_from_video ile aynı filtre).
+    (başlangıç indeksi, frame sayısı, bytes) üçlüleri üretir; son batch kısa olabilir.
+    start_index/count ile yalnızca bir aralık (plan_segments) decode edilir. Uzak adres
+    çözülemezse OSError (stream_pipeline hatayı pipeline hatası olarak raporlar; kayıt devam ettirilebilir).
+    """
+    cmd = [
+        "ffmpeg", "-loglevel", "error",
+        *decode_args(video_path, start_index, count),
+        "-f", "rawvideo", "-pix_fmt", "rgb24",
+        "pipe:1",
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    index = start_index
+    try:
+        while True:
+            data = proc.stdout.read(FRAME_BYTES * batch_frames)
+            n = len(data) // FRAME_BYTES
+            if n:
+                yield index, n, data[: n * FRAME_BYTES]
+                index += n
+            if len(data) < FRAME_BYTES * batch_frames:
+                break
+    finally:
+        proc.stdout.close()
+        stderr = proc.stderr.read().decode("utf-8", errors="replace")
+        proc.stderr.close()
+        if proc.wait() != 0 and index == start_index:
+            print("ffmpeg uyarı/hata:", stderr[-500:], file=sys.stderr)
+
+
 def main():
     INPUT_DIR.mkdir(exist_ok=True)
     OUTPUT_DIR.mkdir(exist_ok=True)
-    webms = list(INPUT_DIR.rglob("*.webm"))
-    # Sadece video içerenleri al (ses .webm atlansın)
-    video_webms = [v for v in webms if not any(h in v.name.lower() for h in AUDIO_ONLY_NAME_HINTS)]
-    if not video_webms:
-        print("meeting_data altında (ses dışı) .webm bulunamadı.")
+    SAMPLING_JSON.write_text(json.dumps({"frameInterval": FRAME_INTERVAL}), encoding="utf-8")
+    # Sadece görüntü akışı olanları al (ses .webm atlansın), en uzun önce
+    infos = video_infos(INPUT_DIR)
+    if not infos:
+        print("meeting_data altında görüntü içeren .webm bulunamadı.")
         return 0
-    for v in video_webms:
-        print("Frame çıkarılıyor:", v.name)
-        extract_from_video(v)
+    for info in infos:
+        frames = f", ~{info.expected_frames} frame" if info.expected_frames else ""
+        print(f"Frame çıkarılıyor: {info.name}{frames} ({FRAME_INTERVAL:g} sn aralık)")
+        extract_from_video(info.source, duration=info.duration)
     print("Frame çıkarma tamamlandı:", OUTPUT_DIR)
     return 0
 
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Katılımcı başına bellek eşlemeli frame deposu (opsiyonel).
+
+Yeni bir eşik, model varyantı veya yüz kırpma denemesi gibi her yeniden analiz,
+.webm'i tekrar decode etmeyi ya da frames/<video>/ altındaki binlerce PNG'yi tek tek
+okumayı gerektiriyordu. Depo her katılımcının decode edilmiş 224×224 frame'lerini bir
+kez, tek ve bitişik bir uint8 dizisine yazar:
+
+  frame_store/<video>/frames.npy   (N, 224, 224, 3) uint8, np.load(..., mmap_mode="r") ile açılır
+  frame_store/<video>/index.json   kaynak (ad + boyut), frameInterval, frame sayısı
+
+Frame i'nin zamanı i × frameInterval'dır (extract_frames ile aynı t=0 ızgarası; frame adı
+frame_{i+1:04d}.png). FrameStore.between() bir zaman aralığını, slice() bir indeks
+aralığını kopyasız (memmap görünümü) döner. Aynı dosyayı açan süreçler sayfa önbelleğini
+paylaşır; işçi başına bellek kopyası oluşmaz.
+
+Depo yazılırken veri .tmp dosyasına konumuna göre (pwrite) yazılır; paralel decode
+aralıkları sırasız gelebilir. Başlık (frame sayısı) sonda yazılır ve dosya yerine taşınır:
+frames.npy varsa tamdır. Kaynak kayıt, boyutu veya frame aralığı değişmişse depo geçersiz sayılır.
+
+stream_pipeline.py --frame-store: depo varsa frame'ler oradan okunur (decode yok), yoksa
+decode edilirken depo da yazılır.
+
+Tek başına: python frame_store.py [--force]  -> tüm katılımcılar için depoyu yazar
+"""
+import argparse
+import json
+import os
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from checkpoint import write_json_atomic
+from extract_frames import (
+    FRAME_BYTES,
+    FRAME_INTERVAL,
+    HEIGHT,
+    SPLIT_SEGMENTS,
+    WIDTH,
+    iter_raw_frames,
+    plan_segments,
+    probe_duration,
+)
+from media_input import source_size
+from media_manifest import video_infos
+
+STORE_DIR = Path("frame_store")
+FRAMES_NAME = "frames.npy"
+INDEX_NAME = "index.json"
+HEADER_BYTES = 128  # .npy v1.0 başlığı bu boyuta doldurulur; veri 128. bayttan başlar
+BUILD_BATCH_FRAMES = 64
+
+
+def _npy_header(count: int) -> bytes:
+    """(count, 224, 224, 3) uint8 için tam HEADER_BYTES uzunluğunda .npy v1.0 başlığı."""
+    header = repr({"descr": "|u1", "fortran_order": False, "shape": (count, HEIGHT, WIDTH, 3)}).encode("latin1")
+    header += b" " * (HEADER_BYTES - 10 - len(header) - 1) + b"\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header
+
+
+def source_key(source) -> dict:
+    return {"name": source.name, "size": source_size(source)}
+
+
+class FrameStore:
+    """Bir katılımcının deposu: frames (N, 224, 224, 3) uint8 memmap + zaman indeksi."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.index = json.loads((directory / INDEX_NAME).read_text(encoding="utf-8"))
+        self.frames = np.load(directory / FRAMES_NAME, mmap_mode="r")
+        self.interval = self.index["frameInterval"]
+        self.timestamps = np.arange(len(self.frames)) * self.interval
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def slice(self, start: int, stop: int | None = None) -> np.ndarray:
+        """[start, stop) frame'leri; kopyasız görünüm."""
+        return self.frames[start:stop]
+
+    def range_for(self, start_sec: float, end_sec: float) -> tuple[int, int]:
+        """Zamanı [start_sec, end_sec) içinde kalan frame'lerin indeks aralığı (engagement_join ile aynı kural)."""
+        lo, hi = np.searchsorted(self.timestamps, [start_sec, end_sec], side="left")
+        return int(lo), int(max(lo, hi))
+
+    def between(self, start_sec: float, end_sec: float) -> np.ndarray:
+        return self.slice(*self.range_for(start_sec, end_sec))
+
+    def batches(self, batch_frames: int, start: int = 0, count: int | None = None):
+        """extract_frames.iter_raw_frames gibi (başlangıç, sayı, ham rgb24) üretir; veri memmap görünümüdür."""
+        stop = len(self) if count is None else min(len(self), start + count)
+        for i in range(start, stop, batch_frames):
+            chunk = self.frames[i: min(stop, i + batch_frames)]
+            yield i, len(chunk), chunk
+
+
+def open_store(source, root: Path = STORE_DIR, interval: float = FRAME_INTERVAL) -> FrameStore | None:
+    """Kaynak kayda ve frame aralığına uyan tam depo; yoksa / eskiyse None."""
+    directory = root / source.stem
+    if not (directory / FRAMES_NAME).exists() or not (directory / INDEX_NAME).exists():
+        return None
+    try:
+        store = FrameStore(directory)
+    except (OSError, ValueError, KeyError):
+        return None
+    if store.index.get("source") != source_key(source) or store.interval != interval \
+            or store.index.get("count") != len(store):
+        return None
+    return store
+
+
+class FrameStoreWriter:
+    """Decode edilen batch'leri konumlarına yazar (thread'ler arası paylaşılabilir); close() depoyu açar."""
+
+    def __init__(self, source, root: Path = STORE_DIR, interval: float = FRAME_INTERVAL):
+        self.directory = root / source.stem
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.tmp = self.directory / (FRAMES_NAME + ".tmp")
+        self.fd = os.open(self.tmp, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        self.key = source_key(source)
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.written = 0
+        self.end = 0
+
+    def write(self, start: int, data) -> None:
+        os.pwrite(self.fd, data, HEADER_BYTES + start * FRAME_BYTES)
+        n = len(data) // FRAME_BYTES
+        with self.lock:
+            self.written += n
+            self.end = max(self.end, start + n)
+
+    def abort(self) -> None:
+        os.close(self.fd)
+        self.tmp.unlink(missing_ok=True)
+
+    def close(self) -> FrameStore | None:
+        """Başlığı yazıp depoyu yerine taşır. Frame'ler baştan boşluksuz değilse yazılmaz (None)."""
+        if not self.end or self.written != self.end:
+            self.abort()
+            return None
+        os.pwrite(self.fd, _npy_header(self.end), 0)
+        os.close(self.fd)
+        (self.directory / INDEX_NAME).unlink(missing_ok=True)
+        os.replace(self.tmp, self.directory / FRAMES_NAME)
+        write_json_atomic(self.directory / INDEX_NAME, {
+            "source": self.key,
+            "frameInterval": self.interval,
+            "count": self.end,
+            "shape": [self.end, HEIGHT, WIDTH, 3],
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        })
+        return FrameStore(self.directory)
+
+
+def build(source, duration: float | None = None, segments: int = SPLIT_SEGMENTS,
+          root: Path = STORE_DIR) -> FrameStore | None:
+    """Kaydı (uzunsa aralıklara bölüp paralel) decode ederek depoyu yazar."""
+    plan = plan_segments(duration or probe_duration(source), segments) if segments > 1 else [(0, None)]
+    writer = FrameStoreWriter(source, root)
+
+    def run(seg):
+        for start, _, data in iter_raw_frames(source, BUILD_BATCH_FRAMES, *seg):
+            writer.write(start, data)
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(plan)) as pool:
+            list(pool.map(run, plan))
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Katılımcı frame'lerini bellek eşlemeli depoya (frame_store/) yazar.")
+    parser.add_argument("--root", default=str(STORE_DIR))
+    parser.add_argument("--force", action="store_true", help="Güncel depoları da yeniden yaz")
+    parser.add_argument("--segments", type=int, default=SPLIT_SEGMENTS, help="Uzun kayıtlarda paralel decode aralığı")
+    args = parser.parse_args()
+    root = Path(args.root)
+    infos = video_infos()
+    if not infos:
+        print("meeting_data altında görüntü içeren .webm bulunamadı.")
+        return 0
+    for info in infos:
+        store = None if args.force else open_store(info.source, root)
+        if store:
+            print(f"Güncel: {info.source.stem} ({len(store)} frame)")
+            continue
+        t0 = time.perf_counter()
+        store = build(info.source, info.duration, args.segments, root)
+        if store is None:
+            print(f"UYARI: {info.name} için frame çıkarılamadı.")
+            continue
+        size_mb = (store.directory / FRAMES_NAME).stat().st_size / 1e6
+        print(f"Yazıldı: {store.directory} ({len(store)} frame, {size_mb:.0f} MB, "
+              f"{time.perf_counter() - t0:.1f} sn)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
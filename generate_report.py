@@ -7,10 +7,15 @@ kaç kişi varsa o kadar katılımcı bölümü + toplu özet ile tek rapor üre
 import json
 from pathlib import Path
 
+from evaluation_log import NDJSON_PATH, read_evaluation
+from speakers import speaker_label
+
 MEETING_DATA = Path("meeting_data")
 EVALUATION_JSON = Path("evaluation.json")
 LATEST_MEETING_JSON = Path("latest_meeting.json")
+ENGAGEMENT_JOIN_JSON = Path("meeting_engagement.json")
 REPORT_PATH = Path("meeting_report.md")
+FRAME_INTERVAL_SEC = 0.5  # evaluation.json'da frameInterval yoksa
 
 # DAiSEE etiketleri (Türkçe)
 LABELS_TR = {
@@ -30,9 +35,11 @@ def load_txt_content() -> str:
 
 
 def load_evaluation() -> dict:
-    if not EVALUATION_JSON.exists():
-        return {}
-    return json.loads(EVALUATION_JSON.read_text(encoding="utf-8"))
+    """
+    Video başına frameCount + summary. evaluation.ndjson varsa satır satır okunur
+    (frame'ler belleğe alınmaz); yoksa evaluation.json.
+    """
+    return read_evaluation(frames=False, path=NDJSON_PATH, json_path=EVALUATION_JSON)
 
 
 def load_meeting_meta() -> dict:
@@ -42,7 +49,34 @@ def load_meeting_meta() -> dict:
     return json.loads(LATEST_MEETING_JSON.read_text(encoding="utf-8"))
 
 
-def participant_section(video_name: str, data: dict, index: int) -> str:
+def load_engagement_join() -> dict:
+    """engagement_join.py çıktısı (transkript segmenti ↔ ilgi); yoksa boş."""
+    if not ENGAGEMENT_JOIN_JSON.exists():
+        return {}
+    return json.loads(ENGAGEMENT_JOIN_JSON.read_text(encoding="utf-8"))
+
+
+def speaker_engagement_section(join_data: dict) -> str:
+    """Her konuşmacı konuşurken katılımcıların ortalama ilgisi."""
+    speakers = join_data.get("speakers") or {}
+    if not speakers:
+        return "*Transkript veya ekran kaydı analizi olmadığından konuşmacı bazlı ilgi hesaplanamadı.*"
+    rows = []
+    for speaker, sp in speakers.items():
+        eng = sp.get("engagement")
+        eng_str = f"{eng:.2f}" if eng is not None else "—"
+        dominant = LABELS_TR.get(sp.get("dominant"), "—")
+        rows.append(f"| {speaker_label(speaker)} | {sp['duration_sec']:.0f} sn | {sp['segments']} | {eng_str} | {dominant} |")
+    table = "\n".join(rows)
+    return f"""Konuşmacı konuşurken tüm katılımcıların frame'leri üzerinden:
+
+| Konuşmacı | Konuşma süresi | Segment | Ort. ilgi skoru | Baskın durum |
+|-----------|----------------|---------|-----------------|--------------|
+{table}
+"""
+
+
+def participant_section(video_name: str, data: dict, index: int, interval: float = FRAME_INTERVAL_SEC) -> str:
     """Tek katılımcı için Markdown bölümü."""
     summary = data.get("summary") or {}
     total = data.get("frameCount") or 0
@@ -54,7 +88,7 @@ def participant_section(video_name: str, data: dict, index: int) -> str:
         rows.append(f"| {label_tr} | %{pct:.0f} |")
     table = "\n".join(rows)
     return f"""### Katılımcı {index + 1}: `{video_name}`
-- **Toplam frame:** {total} (0.5 s aralıklarla)
+- **Toplam frame:** {total} ({interval:g} s aralıklarla)
 - **DAiSEE dağılımı:**
 
 | Durum | Oran |
@@ -98,6 +132,7 @@ def main():
     txt_content = load_txt_content()
     eval_data = load_evaluation()
     videos = eval_data.get("videos") or {}
+    interval = eval_data.get("frameInterval") or FRAME_INTERVAL_SEC
 
     # Katılımcı sayısı = analiz edilen ekran kaydı sayısı (dinamik)
     num_participants = len(videos)
@@ -111,15 +146,16 @@ def main():
     # Katılımcı bazlı bölümler (toplantıda kaç kişi varsa o kadar bölüm)
     participant_sections = []
     for i, (video_name, data) in enumerate(sorted(videos.items())):
-        participant_sections.append(participant_section(video_name, data, i))
+        participant_sections.append(participant_section(video_name, data, i, interval))
     participants_md = "\n".join(participant_sections) if participant_sections else "*Bu toplantıda analiz edilen ekran kaydı bulunmuyor.*"
     combined_md = combined_summary(eval_data)
+    speakers_md = speaker_engagement_section(load_engagement_join())
 
     report = f"""# Toplantı analiz raporu
 
 **Toplantı klasörü:** `{latest_folder}`  
 **Katılımcı sayısı:** {participant_label} (ekran kaydı sayısına göre dinamik)  
-**Analiz:** Her katılımcının ekran kaydı 0.5 s aralıklarla frame'lere bölündü; DAiSEE modeli ile değerlendirildi.
+**Analiz:** Her katılımcının ekran kaydı {interval:g} s aralıklarla frame'lere bölündü; DAiSEE modeli ile değerlendirildi.
 
 ---
 
@@ -135,6 +171,12 @@ def main():
 
 ---
 
+## Konuşmacı bazlı ilgi
+
+{speakers_md}
+
+---
+
 ## Toplantı metni / özet
 
 {txt_content or '(Metin dosyası bulunamadı veya boş.)'}
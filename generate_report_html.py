@@ -4,11 +4,16 @@ evaluation.json'daki frame bazlı veriyi kullanarak grafikli, görsel zengin
 tek sayfa HTML raporu üretir: kim ne kadar aktif, kim ne zaman etkisiz, zaman serisi grafikleri.
 """
 import json
+import math
 from pathlib import Path
 
+from evaluation_log import NDJSON_PATH, read_evaluation
+from speakers import speaker_label
+
 MEETING_DATA = Path("meeting_data")
 EVALUATION_JSON = Path("evaluation.json")
 LATEST_MEETING_JSON = Path("latest_meeting.json")
+ENGAGEMENT_JOIN_JSON = Path("meeting_engagement.json")
 REPORT_HTML_PATH = Path("meeting_report.html")
 
 # DAiSEE: scores dizisi [boredom, confusion, engagement, frustration]
@@ -20,10 +25,12 @@ LABELS_TR = {
     "frustration": "Hayal kırıklığı",
 }
 ENGAGEMENT_IDX = 2
-FRAME_INTERVAL_SEC = 0.5
-# Etkisiz say: engagement skoru bu eşiğin altında veya dominant değilse, 4+ ardışık frame
+FRAME_INTERVAL_SEC = 0.5  # evaluation.json'da frameInterval yoksa
+# Etkisiz say: engagement skoru bu eşiğin altında veya dominant değilse, en az 2 sn (0.5 sn aralıkta 4 frame)
+# ve her aralıkta en az 2 ardışık frame (2 sn aralıkta tek düşük frame dönem sayılmaz)
 LOW_ENGAGEMENT_THRESHOLD = 0.3
-MIN_INEFFECTIVE_FRAMES = 4
+MIN_INEFFECTIVE_SEC = 2.0
+MIN_INEFFECTIVE_FRAMES = 2
 
 
 def load_txt_content() -> str:
@@ -33,10 +40,12 @@ def load_txt_content() -> str:
     return "\n\n".join(parts) if parts else ""
 
 
-def load_evaluation() -> dict:
-    if not EVALUATION_JSON.exists():
-        return {}
-    return json.loads(EVALUATION_JSON.read_text(encoding="utf-8"))
+def load_evaluation(partial: bool = False) -> dict:
+    """
+    evaluation.ndjson varsa videolar erişildikçe tek tek okunur (bkz. evaluation_log); yoksa evaluation.json.
+    partial=True: değerlendirme sürerken (ön rapor) yarım kayıt uyarısız okunur.
+    """
+    return read_evaluation(frames=True, path=NDJSON_PATH, json_path=EVALUATION_JSON, partial=partial)
 
 
 def load_meeting_meta() -> dict:
@@ -45,6 +54,28 @@ def load_meeting_meta() -> dict:
     return json.loads(LATEST_MEETING_JSON.read_text(encoding="utf-8"))
 
 
+def load_engagement_join() -> dict:
+    if not ENGAGEMENT_JOIN_JSON.exists():
+        return {}
+    return json.loads(ENGAGEMENT_JOIN_JSON.read_text(encoding="utf-8"))
+
+
+def speaker_rows(join_data: dict) -> list:
+    """Konuşmacı bazlı ilgi tablosu satırları (engagement_join.py çıktısından)."""
+    rows = []
+    for speaker, sp in (join_data.get("speakers") or {}).items():
+        eng = sp.get("engagement")
+        rows.append({
+            "speaker": escape_html(speaker_label(speaker)),
+            "duration_sec": round(sp.get("duration_sec") or 0),
+            "segments": sp.get("segments") or 0,
+            "engagement": eng,
+            "engagement_str": "—" if eng is None else f"{eng:.2f}",
+            "dominant": LABELS_TR.get(sp.get("dominant"), "—"),
+        })
+    return rows
+
+
 def engagement_series(frames: list) -> list:
     """Her frame için engagement skoru (0-1 benzeri)."""
     out = []
@@ -59,9 +90,11 @@ def engagement_series(frames: list) -> list:
     return out
 
 
-def ineffective_segments(frames: list) -> list:
+def ineffective_segments(frames: list, interval: float = FRAME_INTERVAL_SEC) -> list:
     """Etkisiz dönemler: başlangıç (sn), bitiş (sn), süre (sn)."""
     segments = []
+    # 1e-9: 2.0 / 0.1 gibi kayan nokta bölümleri bir frame fazla istemesin
+    min_count = max(MIN_INEFFECTIVE_FRAMES, math.ceil(MIN_INEFFECTIVE_SEC / interval - 1e-9))
     engagement = engagement_series(frames)
     i = 0
     while i < len(engagement):
@@ -72,10 +105,10 @@ def ineffective_segments(frames: list) -> list:
         while i < len(engagement) and engagement[i] < LOW_ENGAGEMENT_THRESHOLD:
             i += 1
         count = i - start_i
-        if count >= MIN_INEFFECTIVE_FRAMES:
-            start_sec = start_i * FRAME_INTERVAL_SEC
-            end_sec = i * FRAME_INTERVAL_SEC
-            segments.append({"start_sec": start_sec, "end_sec": end_sec, "duration_sec": round((i - start_i) * FRAME_INTERVAL_SEC, 1)})
+        if count >= min_count:
+            start_sec = start_i * interval
+            end_sec = i * interval
+            segments.append({"start_sec": start_sec, "end_sec": end_sec, "duration_sec": round(count * interval, 1)})
         i += 1
     return segments
 
@@ -84,25 +117,28 @@ def escape_html(s: str) -> str:
     return (s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;") if s else "")
 
 
-def build_report_data(eval_data: dict, meta: dict, txt_content: str) -> dict:
+def build_report_data(eval_data: dict, meta: dict, txt_content: str, join_data: dict | None = None) -> dict:
     videos = eval_data.get("videos") or {}
+    interval = eval_data.get("frameInterval") or FRAME_INTERVAL_SEC
     latest_folder = meta.get("latest_folder") or "—"
     participants = []
     time_labels = []
     max_frames = 0
-    for video_name, data in sorted(videos.items()):
+    # Video video: NDJSON'dan okunan frame listesi, seri çıkarıldıktan sonra bırakılır
+    for video_name in sorted(videos):
+        data = videos[video_name]
         frames = data.get("frames") or []
         eng = engagement_series(frames)
         max_frames = max(max_frames, len(frames))
         participants.append({
             "name": video_name,
             "engagement_series": eng,
-            "ineffective": ineffective_segments(frames),
+            "ineffective": ineffective_segments(frames, interval),
             "summary": data.get("summary") or {},
             "frameCount": len(frames),
         })
     if max_frames:
-        time_labels = [f"{i * FRAME_INTERVAL_SEC:.0f}s" for i in range(max_frames)]
+        time_labels = [f"{i * interval:.0f}s" for i in range(max_frames)]
         # Serileri aynı uzunluğa getir (kısa olanları null ile doldur)
         for p in participants:
             n = len(p["engagement_series"])
@@ -114,24 +150,52 @@ def build_report_data(eval_data: dict, meta: dict, txt_content: str) -> dict:
         "participants": participants,
         "time_labels": time_labels,
         "max_frames": max_frames,
-        "total_duration_sec": round(max_frames * FRAME_INTERVAL_SEC, 1),
+        "total_duration_sec": round(max_frames * interval, 1),
         "txt_content": escape_html(txt_content or "(Metin yok.)"),
         "labels_tr": LABELS_TR,
+        "speakers": speaker_rows(join_data or {}),
     }
 
 
+def provisional_badge(pending: bool) -> str:
+    return ' <span class="badge badge-warn">Ön sonuç</span>' if pending else ""
+
+
 def render_html(data: dict) -> str:
+    """
+    data["provisional"] varsa (progressive_report.py) ön rapor: başlıkta uyarı, eksik
+    katılımcılara / transkripte bağlı bölümlerde "Ön sonuç" işareti.
+    """
     r = data
     participants_json = json.dumps(r["participants"], ensure_ascii=False)
     time_labels_json = json.dumps(r["time_labels"], ensure_ascii=False)
     num = r["num_participants"]
     part_label = "Analiz edilen ekran kaydı yok." if num == 0 else f"{num} katılımcı" if num > 1 else "1 katılımcı"
+    prov = r.get("provisional")
+    pending_eval = bool(prov and prov["pending_participants"])
+    pending_transcript = bool(prov and prov["transcript_pending"])
+    no_speakers = "Transkript bekleniyor." if pending_transcript else \
+        "Transkript veya ekran kaydı analizi olmadığından hesaplanamadı."
+    speaker_rows_html = "".join(
+        f"<tr><td>{sp['speaker']}</td><td>{sp['duration_sec']} sn</td><td>{sp['segments']}</td>"
+        f"<td>{sp['engagement_str']}</td><td>{sp['dominant']}</td></tr>"
+        for sp in r["speakers"]
+    ) or f'<tr><td colspan="5">{no_speakers}</td></tr>'
+    banner = ""
+    if prov:
+        waiting = []
+        if pending_eval:
+            waiting.append("değerlendirmesi süren katılımcılar: " + ", ".join(escape_html(n) for n in prov["pending_participants"]))
+        if pending_transcript:
+            waiting.append("transkript ve konuşmacı bazlı ilgi")
+        banner = (f'<p class="provisional"><strong>Ön rapor</strong> ({prov["generated_at"]}). Bekleniyor: '
+                  f'{"; ".join(waiting) or "son adımlar"}. Pipeline bitince bu sayfa aynı adreste son raporla değiştirilir.</p>')
 
     return f"""<!DOCTYPE html>
 <html lang="tr">
 <head>
   <meta charset="utf-8">
-  <title>Toplantı analiz raporu — {r['latest_folder']}</title>
+  <title>{"Ön rapor" if prov else "Toplantı analiz raporu"} — {r['latest_folder']}</title>
   <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
   <style>
     :root {{ --bg: #0f1419; --card: #1a2332; --text: #e6edf3; --muted: #8b949e; --accent: #58a6ff; --success: #3fb950; --warning: #d29922; --danger: #f85149; }}
@@ -153,6 +217,7 @@ def render_html(data: dict) -> str:
     .badge {{ display: inline-block; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.8rem; }}
     .badge-ok {{ background: var(--success); color: #000; }}
     .badge-warn {{ background: var(--warning); color: #000; }}
+    .provisional {{ background: var(--warning); color: #000; border-radius: 8px; padding: 0.75rem 1rem; margin-bottom: 1.5rem; }}
     .txt-block {{ background: var(--card); border-radius: 8px; padding: 1rem; white-space: pre-wrap; font-size: 0.9rem; color: var(--muted); }}
   </style>
 </head>
@@ -160,6 +225,7 @@ def render_html(data: dict) -> str:
   <div class="container">
     <h1>Toplantı analiz raporu</h1>
     <p class="meta">Klasör: <code>{r['latest_folder']}</code> · Katılımcı sayısı: {part_label} · Süre: {r['total_duration_sec']} sn</p>
+    {banner}
 
     <div class="cards">
       <div class="card"><span class="value">{r['num_participants']}</span><div class="label">Katılımcı</div></div>
@@ -168,7 +234,7 @@ def render_html(data: dict) -> str:
     </div>
 
     <section>
-      <h2>İlgi / odak seviyesi — zaman içinde (tüm katılımcılar)</h2>
+      <h2>İlgi / odak seviyesi — zaman içinde (tüm katılımcılar){provisional_badge(pending_eval)}</h2>
       <div class="chart-wrap"><canvas id="chartCombined"></canvas></div>
     </section>
 
@@ -178,18 +244,26 @@ def render_html(data: dict) -> str:
     </section>
 
     <section>
-      <h2>Ortalama dağılım (tüm katılımcılar)</h2>
+      <h2>Ortalama dağılım (tüm katılımcılar){provisional_badge(pending_eval)}</h2>
       <div class="chart-wrap"><canvas id="chartDistribution"></canvas></div>
     </section>
 
     <section>
-      <h2>Etkisiz dönemler özeti (düşük ilgi/odak)</h2>
+      <h2>Etkisiz dönemler özeti (düşük ilgi/odak){provisional_badge(pending_eval)}</h2>
       <table>
         <thead><tr><th>Katılımcı</th><th>Başlangıç</th><th>Bitiş</th><th>Süre</th></tr></thead>
         <tbody id="ineffectiveTable"></tbody>
       </table>
     </section>
 
+    <section>
+      <h2>Konuşmacı bazlı ilgi (konuşurken katılımcıların ilgisi){provisional_badge(pending_transcript)}</h2>
+      <table>
+        <thead><tr><th>Konuşmacı</th><th>Konuşma süresi</th><th>Segment</th><th>Ort. ilgi skoru</th><th>Baskın durum</th></tr></thead>
+        <tbody>{speaker_rows_html}</tbody>
+      </table>
+    </section>
+
     <section>
       <h2>Toplantı metni / özet</h2>
       <div class="txt-block">{r['txt_content']}</div>
@@ -230,7 +304,8 @@ def render_html(data: dict) -> str:
     let allIneffectiveRows = '';
     DATA.forEach((p, idx) => {{
       const sec = document.createElement('section');
-      sec.innerHTML = `<h3 style="font-size:1.1rem;margin-bottom:0.5rem">${{p.name}}</h3><div class="chart-wrap" style="height:220px"><canvas id="chartP${{idx}}"></canvas></div>`;
+      const badge = p.provisional ? ' <span class="badge badge-warn">Değerlendirme sürüyor</span>' : '';
+      sec.innerHTML = `<h3 style="font-size:1.1rem;margin-bottom:0.5rem">${{p.name}}${{badge}}</h3><div class="chart-wrap" style="height:220px"><canvas id="chartP${{idx}}"></canvas></div>`;
       partContainer.appendChild(sec);
       new Chart(document.getElementById(`chartP${{idx}}`).getContext('2d'), {{
         type: 'line',
@@ -268,7 +343,7 @@ def main():
     meta = load_meeting_meta()
     txt = load_txt_content()
     eval_data = load_evaluation()
-    data = build_report_data(eval_data, meta, txt)
+    data = build_report_data(eval_data, meta, txt, load_engagement_join())
     html = render_html(data)
     REPORT_HTML_PATH.write_text(html, encoding="utf-8")
     print("HTML rapor yazıldı:", REPORT_HTML_PATH)
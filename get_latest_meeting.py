@@ -4,6 +4,8 @@ Hugging Face (Caner7/Sense-AI) üzerindeki 'Toplantı Kayıtları' altında
 en son eklenen toplantı klasörünün verilerini listeler ve bilgi döner.
 
 Token: Ortam değişkeni SENSEAI veya HF_TOKEN (GitHub secret adı SENSEAI).
+huggingface_hub sadece token kontrolünden sonra, listeleme gerçekten yapılacaksa
+yüklenir (parse_folder_name gibi yardımcıları içe aktaran betikler bedelini ödemez).
 """
 
 import argparse
@@ -11,8 +13,10 @@ import json
 import os
 import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from huggingface_hub import HfFileSystem
+if TYPE_CHECKING:
+    from huggingface_hub import HfFileSystem
 
 
 # Repo sabitleri
@@ -46,7 +50,7 @@ def parse_folder_name(name: str) -> tuple[str, str, str] | None:
     return None
 
 
-def get_latest_meeting_folder(hffs: HfFileSystem) -> str | None:
+def get_latest_meeting_folder(hffs: "HfFileSystem") -> str | None:
     """
     'Toplantı Kayıtları' altındaki alt klasörleri listeler.
     İsim formatı: (önek serbest)_YYYY-MM-DD veya (önek serbest)_YYYY-MM-DD_HH-MM.
@@ -93,6 +97,8 @@ def get_latest_meeting_data(token: str | None = None) -> dict:
             "base_path": None,
         }
 
+    from huggingface_hub import HfFileSystem
+
     hffs = HfFileSystem(token=t)
 
     latest = get_latest_meeting_folder(hffs)
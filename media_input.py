@@ -0,0 +1,131 @@
+"""
+ffmpeg girdileri: yerel dosya veya HF'de duran kayıt (HTTP, Range destekli).
+
+download_meeting.py --stream ekran/ses kayıtlarını indirmek yerine
+meeting_data/remote_sources.json dosyasına yazar; frame çıkarma (extract_frames,
+stream_pipeline) ve 16 kHz ses çıkarma (transcribe_meeting) ffmpeg'i doğrudan bu
+URL'lerden besler. Böylece decode, aktarım başladıktan birkaç saniye sonra başlar;
+indirme ve decode süreleri toplanmaz, üst üste biner.
+
+HF "resolve" URL'leri imzalı CDN adresine yönlendirir. Token sadece ilk istekte
+gönderilir: yönlendirme burada çözülür ve ffmpeg'e token'sız imzalı URL verilir
+(CDN ikinci bir Authorization başlığını reddedebilir). Yönlendirme yoksa token
+ffmpeg'e -headers ile verilir. URL her ffmpeg başlatılışında yeniden çözülür
+(imzalı adreslerin süresi sınırlıdır). Çözümleme (HEAD) geçici ağ hatasında bir kez
+tekrarlanır; yine olmazsa OSError (urllib.error.URLError, TimeoutError) fırlatır.
+"""
+import json
+import os
+import time
+from pathlib import Path
+
+MEETING_DATA = Path("meeting_data")
+REMOTE_SOURCES_JSON = MEETING_DATA / "remote_sources.json"
+# Bağlantı koparsa ffmpeg kaldığı bayttan (Range) yeniden bağlanır
+HTTP_INPUT_OPTIONS = [
+    "-reconnect", "1",
+    "-reconnect_streamed", "1",
+    "-reconnect_on_network_error", "1",
+    "-reconnect_delay_max", "10",
+]
+RESOLVE_TIMEOUT = 30
+RESOLVE_ATTEMPTS = 2  # ilk HEAD + bir tekrar
+RESOLVE_RETRY_DELAY = 2.0  # saniye
+
+
+class RemoteMedia:
+    """HTTP üzerinden okunan kayıt; Path gibi name/stem taşır."""
+
+    def __init__(self, name: str, url: str, size: int | None = None):
+        self.name = name
+        self.url = url
+        self.size = size
+
+    def __repr__(self) -> str:
+        return f"RemoteMedia({self.name!r}, {self.url!r})"
+
+    @property
+    def stem(self) -> str:
+        return Path(self.name).stem
+
+    @property
+    def suffix(self) -> str:
+        return Path(self.name).suffix
+
+
+def get_token() -> str | None:
+    return os.environ.get("SENSEAI") or os.environ.get("HF_TOKEN")
+
+
+def is_remote(source) -> bool:
+    return isinstance(source, RemoteMedia)
+
+
+def load_remote_sources(path: Path = REMOTE_SOURCES_JSON) -> list[RemoteMedia]:
+    if not path.exists():
+        return []
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return [RemoteMedia(s["name"], s["url"], s.get("size")) for s in data.get("sources") or []]
+
+
+def write_remote_sources(sources: list[RemoteMedia], path: Path = REMOTE_SOURCES_JSON) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"sources": [{"name": s.name, "url": s.url, "size": s.size} for s in sources]}
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def find_media(suffix: str = ".webm", root: Path = MEETING_DATA) -> list:
+    """root altındaki yerel kayıtlar + remote_sources.json (aynı adlı yerel dosya varsa o kullanılır)."""
+    local = sorted(root.rglob(f"*{suffix}")) if root.exists() else []
+    names = {p.name for p in local}
+    remote = [s for s in load_remote_sources(root / REMOTE_SOURCES_JSON.name)
+              if s.suffix == suffix and s.name not in names]
+    return sorted([*local, *remote], key=lambda s: (s.name, str(s) if isinstance(s, Path) else s.url))
+
+
+def resolve_url(url: str, token: str | None = None) -> tuple[str, bool]:
+    """
+    (ffmpeg'e verilecek URL, token başlığı gerekli mi). Yönlendirme varsa hedef adres token'sız kullanılır.
+    Bağlantı hatası, zaman aşımı veya 5xx bir kez tekrarlanır; sonra OSError (4xx hemen).
+    """
+    # urllib.request (http.client, ssl) sadece uzak kayıt varsa yüklenir
+    import urllib.error
+    import urllib.parse
+    import urllib.request
+
+    class NoRedirect(urllib.request.HTTPRedirectHandler):
+        def redirect_request(self, req, fp, code, msg, headers, newurl):
+            return None
+
+    req = urllib.request.Request(url, method="HEAD")
+    if token:
+        req.add_header("Authorization", f"Bearer {token}")
+    opener = urllib.request.build_opener(NoRedirect)
+    for attempt in range(1, RESOLVE_ATTEMPTS + 1):
+        try:
+            with opener.open(req, timeout=RESOLVE_TIMEOUT):
+                return url, bool(token)
+        except urllib.error.HTTPError as e:
+            location = e.headers.get("Location")
+            if 300 <= e.code < 400 and location:
+                return urllib.parse.urljoin(url, location), False
+            if e.code < 500 or attempt == RESOLVE_ATTEMPTS:
+                raise
+        except OSError:  # URLError, TimeoutError, bağlantı koptu
+            if attempt == RESOLVE_ATTEMPTS:
+                raise
+        time.sleep(RESOLVE_RETRY_DELAY)
+
+
+def input_args(source) -> list[str]:
+    """ffmpeg girdi argümanları (-i dahil). Yerel Path veya RemoteMedia; uzak adres çözülemezse OSError."""
+    if not is_remote(source):
+        return ["-i", str(source)]
+    url, needs_token = resolve_url(source.url, get_token())
+    headers = ["-headers", f"Authorization: Bearer {get_token()}\r\n"] if needs_token else []
+    return [*HTTP_INPUT_OPTIONS, *headers, "-i", url]
+
+
+def source_size(source) -> int | None:
+    """Kaydın bayt boyutu (yerel: dosya boyutu, uzak: listelemedeki boyut)."""
+    return source.size if is_remote(source) else source.stat().st_size
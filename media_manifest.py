@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Toplantı kayıtlarının medya manifesti: hangi .webm'de görüntü / ses akışı var,
+süre, çözünürlük, fps ve beklenen frame sayısı.
+
+Dosyalar adlarına göre değil konteyner başlığına göre sınıflanır (ffprobe; yoksa
+ffmpeg -i çıktısı). Sadece başlık okunur, decode yapılmaz. Sonuçlar toplantıya özel
+.pipeline_state/<latest_folder>/media_manifest.json dosyasında dosya adı + boyut + mtime
+(uzak kayıtta URL + boyut) anahtarıyla önbelleğe alınır; değişmeyen dosya tekrar
+yoklanmaz, başka bir toplantının kaydı önbelleği ezmez.
+
+- Frame çıkarma: görüntü akışı olan her kayıt, en uzundan kısaya (iş dağılımı için).
+- Transkripsiyon: sadece ses içeren kayıt; yoksa ses akışı olan en uzun kayıt.
+- Ad ipuçları (AUDIO_NAME_HINTS) sınıflamayı değiştirmez: sadece yoklanamayan dosyada
+  türü belirler ve birden fazla ses adayı arasında seçimde önceliklidir. İpucu adın tam
+  bir parçası olmalıdır (_ - . ile bölünür): "toplanti_sesi" ses kaydıdır,
+  "session_ali" / "sessiz" değildir.
+
+Tek başına: python media_manifest.py  -> manifesti yazar ve tablo olarak gösterir
+"""
+import json
+import re
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from checkpoint import STATE_ROOT, latest_folder, state_dir
+from media_input import MEETING_DATA, find_media, input_args, is_remote, source_size
+
+MANIFEST_NAME = "media_manifest.json"
+AUDIO_NAME_HINTS = ("ses", "sesi", "audio", "sound")
+PROBE_WORKERS = 8
+PROBE_TIMEOUT = 60
+
+
+class MediaInfo:
+    """Bir kaydın yoklama sonucu; source ffmpeg girdisi (Path veya RemoteMedia)."""
+
+    FIELDS = ("name", "size", "has_video", "has_audio", "duration", "width", "height", "fps", "probed_with")
+
+    def __init__(self, source, **fields):
+        self.source = source
+        for f in self.FIELDS:
+            setattr(self, f, fields.get(f))
+
+    @property
+    def name_hints_audio(self) -> bool:
+        return any(t in AUDIO_NAME_HINTS for t in re.split(r"[_\-.\s]+", self.name.lower()))
+
+    @property
+    def is_video(self) -> bool:
+        """Frame çıkarılacak kayıt mı? (görüntü akışı var mı; yoklanamadıysa ada bakılır)"""
+        if self.has_video is None:
+            return not self.name_hints_audio
+        return bool(self.has_video)
+
+    @property
+    def is_audio_only(self) -> bool:
+        if self.has_video is None:
+            return self.name_hints_audio
+        return bool(self.has_audio) and not self.has_video
+
+    @property
+    def expected_frames(self) -> int | None:
+        """extract_frames.FRAME_INTERVAL ızgarasında beklenen frame sayısı (süre başlıkta yoksa None)."""
+        from extract_frames import FRAME_INTERVAL  # döngüsel import: extract_frames bu modülü kullanır
+        return round(self.duration / FRAME_INTERVAL) if self.duration else None
+
+    @property
+    def cost(self) -> float:
+        """Sıralama anahtarı: beklenen frame sayısı; süre bilinmiyorsa dosya boyutu (bayt ≈ süre)."""
+        return self.expected_frames if self.expected_frames is not None else (self.size or 0) / 1e5
+
+    def to_json(self) -> dict:
+        return {**{f: getattr(self, f) for f in self.FIELDS}, "expected_frames": self.expected_frames}
+
+
+def cache_key(source) -> str:
+    if is_remote(source):
+        return f"remote:{source.url}:{source.size}"
+    st = source.stat()
+    return f"{source}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _rate(value: str | None) -> float | None:
+    """ffprobe "15/1" -> 15.0; "0/0" -> None."""
+    if not value:
+        return None
+    num, _, den = value.partition("/")
+    try:
+        r = float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return round(r, 3) if r > 0 else None
+
+
+def probe_ffprobe(source) -> dict | None:
+    try:
+        r = subprocess.run(
+            ["ffprobe", "-v", "error", "-of", "json",
+             "-show_entries", "stream=codec_type,width,height,avg_frame_rate,r_frame_rate:format=duration",
+             *input_args(source)],
+            capture_output=True, text=True, timeout=PROBE_TIMEOUT,
+        )
+    except FileNotFoundError:
+        return None
+    if r.returncode != 0:
+        return None
+    data = json.loads(r.stdout or "{}")
+    streams = data.get("streams") or []
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    duration = (data.get("format") or {}).get("duration")
+    return {
+        "has_video": video is not None,
+        "has_audio": any(s.get("codec_type") == "audio" for s in streams),
+        "duration": float(duration) if duration not in (None, "N/A") else None,
+        "width": (video or {}).get("width"),
+        "height": (video or {}).get("height"),
+        "fps": _rate((video or {}).get("avg_frame_rate")) or _rate((video or {}).get("r_frame_rate")),
+        "probed_with": "ffprobe",
+    }
+
+
+def probe_ffmpeg(source) -> dict | None:
+    """ffprobe yoksa: `ffmpeg -i` (çıktısız) sadece başlığı okuyup akışları yazdırır."""
+    try:
+        r = subprocess.run(["ffmpeg", "-hide_banner", *input_args(source)],
+                           capture_output=True, text=True, timeout=PROBE_TIMEOUT)
+    except FileNotFoundError:
+        return None
+    streams = re.findall(r"Stream #\d+:\d+\S*: (Video|Audio): (.*)", r.stderr)
+    if not streams:
+        return None
+    video = next((desc for kind, desc in streams if kind == "Video"), None)
+    size = re.search(r"\b(\d{2,5})x(\d{2,5})\b", video or "")
+    fps = re.search(r"([\d.]+) (?:fps|tbr)", video or "")
+    dur = re.search(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)", r.stderr)
+    return {
+        "has_video": video is not None,
+        "has_audio": any(kind == "Audio" for kind, _ in streams),
+        "duration": int(dur[1]) * 3600 + int(dur[2]) * 60 + float(dur[3]) if dur else None,
+        "width": int(size[1]) if size else None,
+        "height": int(size[2]) if size else None,
+        "fps": float(fps[1]) if fps else None,
+        "probed_with": "ffmpeg",
+    }
+
+
+def probe(source) -> MediaInfo:
+    try:
+        fields = probe_ffprobe(source) or probe_ffmpeg(source) or {}
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        fields = {}
+    return MediaInfo(source, name=source.name, size=source_size(source), **fields)
+
+
+def manifest_path() -> Path:
+    """Toplantıya özel önbellek: .pipeline_state/<latest_folder>/ (latest_meeting.json yoksa .pipeline_state/)."""
+    folder = latest_folder()
+    return (state_dir(folder) if folder else STATE_ROOT) / MANIFEST_NAME
+
+
+def load_manifest(root: Path = MEETING_DATA, path: Path | None = None) -> list[MediaInfo]:
+    """root altındaki (ve uzak) .webm kayıtlarının bilgileri; değişmeyenler önbellekten, diğerleri paralel yoklanır."""
+    path = path or manifest_path()
+    sources = find_media(".webm", root)
+    cached = {}
+    if path.exists():
+        try:
+            cached = json.loads(path.read_text(encoding="utf-8")).get("files") or {}
+        except (OSError, ValueError):
+            cached = {}
+    keys = [cache_key(s) for s in sources]
+    infos: dict[str, MediaInfo] = {}
+    missing = []
+    for s, k in zip(sources, keys):
+        if k in cached and cached[k].get("probed_with"):
+            infos[k] = MediaInfo(s, **cached[k])
+        else:
+            missing.append((s, k))
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(missing))) as pool:
+            for (s, k), info in zip(missing, pool.map(lambda sk: probe(sk[0]), missing)):
+                infos[k] = info
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "files": {k: infos[k].to_json() for k in keys},
+        }, ensure_ascii=False, indent=2), encoding="utf-8")
+    return [infos[k] for k in keys]
+
+
+def video_infos(root: Path = MEETING_DATA) -> list[MediaInfo]:
+    """Frame çıkarılacak kayıtlar, en uzundan kısaya."""
+    return sorted((i for i in load_manifest(root) if i.is_video), key=lambda i: (-i.cost, i.name))
+
+
+def audio_info(root: Path = MEETING_DATA) -> MediaInfo | None:
+    """Transkripsiyon kaynağı: sadece ses içeren kayıt (ad ipucu olan önce); yoksa ses akışı olan en uzun kayıt."""
+    infos = load_manifest(root)
+    for candidates in ([i for i in infos if i.is_audio_only], [i for i in infos if i.has_audio]):
+        if candidates:
+            return sorted(candidates, key=lambda i: (not i.name_hints_audio, -i.cost, i.name))[0]
+    return None
+
+
+def main():
+    infos = load_manifest()
+    if not infos:
+        print("meeting_data altında .webm bulunamadı.")
+        return 0
+    print(f"{'Dosya':<28} {'tür':<7} {'süre sn':>8} {'çözünürlük':>11} {'fps':>6} {'frame':>7}")
+    for i in sorted(infos, key=lambda i: -i.cost):
+        kind = "?" if not i.probed_with else "görüntü" if i.is_video else "ses" if i.is_audio_only else "-"
+        res = f"{i.width}x{i.height}" if i.width else "-"
+        dur = f"{i.duration:.1f}" if i.duration else "-"
+        print(f"{i.name:<28} {kind:<7} {dur:>8} {res:>11} {i.fps or '-':>6} {i.expected_frames or '-':>7}")
+    print("Yazıldı:", manifest_path())
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
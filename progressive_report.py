@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Ön (provisional) HTML rapor: transkript ve son adımlar beklenmeden, DAiSEE skorları
+hazır olan katılımcılarla toplanti_raporu.html üretip HF'e yükler.
+
+- stream_pipeline.py --progressive: her katılımcının skorları bitince (on_video_done)
+  rapor arka planda yeniden üretilir ve yüklenir; son katılımcıdan sonraki yayın tüm
+  katılımcıları içerir (değerlendirme sonunda ayrıca yayın yapılmaz).
+- run_pipeline.py --progressive --batch: değerlendirmeden sonra bu betik ayrı bir adım
+  olarak arka planda, transkripsiyonla aynı anda çalışır.
+
+Skorlar evaluation.ndjson'dan okunur (yarım kalan videolar o ana kadarki frame'leriyle).
+Değerlendirmesi süren katılımcılar ve transkripte bağlı bölümler raporda "Ön sonuç"
+olarak işaretlenir. Son rapor (upload_report_to_hf.py) aynı ada yüklenip bunun yerine geçer.
+İlk ön raporun süresi report_timing.json'a yazılır (checkpoint.record_report_time).
+
+Tek başına: python progressive_report.py [--no-upload]
+"""
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+from checkpoint import latest_folder, record_report_time
+from evaluation_log import EvaluationVideos
+from generate_report_html import (
+    build_report_data,
+    load_evaluation,
+    load_meeting_meta,
+    load_txt_content,
+    render_html,
+)
+from media_manifest import video_infos
+from upload_report_to_hf import get_token, upload_files
+
+PROVISIONAL_HTML = Path("meeting_report.provisional.html")
+HF_NAME = "toplanti_raporu.html"  # son raporla aynı ad: yerinde değiştirilir
+
+
+def render_provisional() -> tuple[str, int]:
+    """(ön rapor HTML'i, skorları tamamlanmış katılımcı sayısı)."""
+    eval_data = load_evaluation(partial=True)
+    videos = eval_data.get("videos") or {}
+    finished = set(videos.finished() if isinstance(videos, EvaluationVideos) else videos)
+    expected = {i.source.stem for i in video_infos()} | set(videos)
+    pending = sorted(expected - finished)
+    data = build_report_data(eval_data, load_meeting_meta(), load_txt_content(), None)
+    for p in data["participants"]:
+        p["provisional"] = p["name"] in pending
+    data["provisional"] = {
+        "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "pending_participants": pending,
+        "transcript_pending": True,
+    }
+    return render_html(data), len(finished)
+
+
+def publish(upload: bool = True) -> bool:
+    """Ön raporu yazar ve (token + latest_folder varsa) HF'e yükler. Yayınlandıysa True."""
+    html, done = render_provisional()
+    PROVISIONAL_HTML.write_text(html, encoding="utf-8")
+    folder, token = latest_folder(), get_token()
+    if upload and folder and token:
+        if upload_files([(PROVISIONAL_HTML, HF_NAME)], folder, token):
+            return False
+    elif upload:
+        print("Ön rapor sadece yerelde yazıldı (SENSEAI/HF_TOKEN veya latest_meeting.json yok):", PROVISIONAL_HTML)
+    timing = record_report_time("provisional", participants=done)
+    if timing and timing.get("provisional_reports") == 1:
+        print(f"İlk ön rapor: pipeline başlangıcından {timing['first_report_sec']:.0f} sn sonra ({done} katılımcı)")
+    return True
+
+
+class ProvisionalReporter:
+    """
+    stream_pipeline on_video_done kancası. Yayın arka plan thread'inde yapılır (değerlendirme
+    beklemez); yükleme sürerken biten katılımcılar bir sonraki tek yayında birleşir.
+    """
+
+    def __init__(self, upload: bool = True):
+        self.upload = upload
+        self.wake = threading.Event()
+        self.dirty = False  # son yayından sonra biten katılımcı var
+        self.closing = False
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def on_video_done(self, name: str, result: dict) -> None:
+        self.dirty = True
+        self.wake.set()
+
+    def _publish(self) -> None:
+        try:
+            publish(self.upload)
+        except Exception as e:
+            print("UYARI: ön rapor yayınlanamadı:", e, file=sys.stderr)
+
+    def _loop(self) -> None:
+        while True:
+            self.wake.wait()
+            self.wake.clear()
+            if self.dirty:
+                self.dirty = False
+                self._publish()
+            if self.closing and not self.dirty:
+                return
+
+    def close(self, final: bool = False) -> None:
+        """
+        Süren ve bekleyen yayını (son biten katılımcılar) tamamlar. final=True ise ayrıca bir ön rapor
+        daha yayınlanır; stream_pipeline buna ihtiyaç duymaz (son katılımcının yayını hepsini içerir).
+        """
+        self.closing = True
+        self.wake.set()
+        self.thread.join()
+        if final:
+            self._publish()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mevcut değerlendirme sonuçlarıyla ön HTML raporu üretip yükler.")
+    parser.add_argument("--no-upload", action="store_true", help="Sadece yerelde yaz")
+    args = parser.parse_args()
+    if not publish(upload=not args.no_upload):
+        # Ön rapor opsiyoneldir: yüklenemese de pipeline devam eder
+        print("UYARI: ön rapor yüklenemedi.", file=sys.stderr)
+    print("Ön rapor:", PROVISIONAL_HTML)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+DAiSEE graph modelinin (daisee/model.json + shard'lar) düşük hassasiyetli ağırlık
+varyantını üretir. Çıktı: daisee_<dtype>/model.json + group1-shardNofM.bin
+
+- float16: tüm float32 ağırlıklar yarım hassasiyette saklanır (boyut ~½).
+- uint8:   tensör başına afin niceleme v ≈ q * scale + min (boyut ~¼).
+           tfjs ağırlık formatı int8 değil uint8/uint16 afin niceleme destekler.
+
+Niceleme yalnızca ağırlık depolamasıdır: tfjs yüklerken float32'ye açar, çıkarım
+float32 çalışır (tfjs-converter --quantize_float16 / --quantize_uint8 ile aynı format).
+Küçük tensörler (bias, batchnorm sabitleri) --min-elements altındaysa float32 kalır.
+
+evaluate_frames.mjs varyantı DAISEE_VARIANT=float16|uint8 ile seçer.
+Doğruluk/hız karşılaştırması: node benchmarks/bench_model_variants.mjs
+"""
+import argparse
+import array
+import json
+import math
+import struct
+import sys
+from pathlib import Path
+
+MODEL_DIR = Path(__file__).resolve().parent / "daisee"
+DTYPES = ("float16", "uint8")
+SHARD_BYTES = 4 * 1024 * 1024  # tfjs-converter varsayılanı
+MIN_ELEMENTS = 1024
+FLOAT16_MAX = 65504.0
+
+
+def variant_dir(dtype: str) -> Path:
+    return MODEL_DIR.parent / f"daisee_{dtype}"
+
+
+def read_weights(model_dir: Path, manifest: list[dict]) -> list[tuple[dict, bytes]]:
+    """weightsManifest sırasıyla (spec, ham bytes) listesi. Shard'lar tek tampon gibi ardışık okunur."""
+    out = []
+    for group in manifest:
+        buf = b"".join((model_dir / p).read_bytes() for p in group["paths"])
+        offset = 0
+        for spec in group["weights"]:
+            if "quantization" in spec:
+                raise ValueError(f"Ağırlık zaten nicelenmiş: {spec['name']}")
+            size = math.prod(spec["shape"]) * 4  # float32 / int32
+            out.append((spec, buf[offset: offset + size]))
+            offset += size
+        if offset != len(buf):
+            raise ValueError(f"Shard boyutu manifest ile uyuşmuyor ({offset} != {len(buf)})")
+    return out
+
+
+def quantize(spec: dict, raw: bytes, dtype: str, min_elements: int) -> tuple[dict, bytes]:
+    """Tek ağırlığı nicelenmiş (spec, bytes) olarak döner; uygun değilse olduğu gibi."""
+    n = math.prod(spec["shape"])
+    if spec["dtype"] != "float32" or n < min_elements:
+        return spec, raw
+    values = array.array("f")
+    values.frombytes(raw)
+    if sys.byteorder != "little":
+        values.byteswap()
+    spec = dict(spec)
+    if dtype == "float16":
+        clamped = [max(-FLOAT16_MAX, min(FLOAT16_MAX, v)) for v in values]
+        spec["quantization"] = {"dtype": "float16", "original_dtype": "float32"}
+        return spec, struct.pack(f"<{n}e", *clamped)
+    lo, hi = min(values), max(values)
+    scale = (hi - lo) / 255 if hi > lo else 1.0
+    q = bytes(min(255, max(0, round((v - lo) / scale))) for v in values)
+    spec["quantization"] = {"dtype": "uint8", "min": lo, "scale": scale, "original_dtype": "float32"}
+    return spec, q
+
+
+def convert(dtype: str, min_elements: int = MIN_ELEMENTS, src: Path = MODEL_DIR, dst: Path | None = None) -> Path:
+    dst = dst or variant_dir(dtype)
+    model = json.loads((src / "model.json").read_text(encoding="utf-8"))
+    weights = read_weights(src, model["weightsManifest"])
+
+    specs, data = [], bytearray()
+    quantized = 0
+    for spec, raw in weights:
+        new_spec, new_raw = quantize(spec, raw, dtype, min_elements)
+        quantized += "quantization" in new_spec
+        specs.append(new_spec)
+        data += new_raw
+
+    dst.mkdir(parents=True, exist_ok=True)
+    for old in dst.glob("group1-shard*.bin"):
+        old.unlink()
+    n_shards = max(1, math.ceil(len(data) / SHARD_BYTES))
+    paths = []
+    for i in range(n_shards):
+        name = f"group1-shard{i + 1}of{n_shards}.bin"
+        (dst / name).write_bytes(data[i * SHARD_BYTES: (i + 1) * SHARD_BYTES])
+        paths.append(name)
+    model["weightsManifest"] = [{"paths": paths, "weights": specs}]
+    (dst / "model.json").write_text(json.dumps(model), encoding="utf-8")
+
+    src_bytes = sum(len(raw) for _, raw in weights)
+    print(f"{dtype}: {quantized}/{len(specs)} ağırlık nicelendi, {src_bytes / 1e6:.2f} MB -> {len(data) / 1e6:.2f} MB")
+    return dst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DAiSEE modelinin float16 / uint8 ağırlık varyantını üretir.")
+    parser.add_argument("--dtype", choices=DTYPES, default="float16")
+    parser.add_argument("--min-elements", type=int, default=MIN_ELEMENTS,
+                        help="Bu sayıdan az elemanlı ağırlıklar float32 kalır")
+    parser.add_argument("--output", "-o", help="Çıktı klasörü (varsayılan: daisee_<dtype>)")
+    args = parser.parse_args()
+
+    if not (MODEL_DIR / "model.json").exists():
+        print("HATA: model bulunamadı:", MODEL_DIR / "model.json", file=sys.stderr)
+        return 1
+    try:
+        dst = convert(args.dtype, args.min_elements, dst=Path(args.output) if args.output else None)
+    except (OSError, ValueError) as e:
+        print("HATA:", e, file=sys.stderr)
+        return 1
+    print("Varyant yazıldı:", dst)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Toplantı pipeline'ını uçtan uca, adım adım çalıştırır ve her adım bitince
+tamamlanma manifesti yazar (checkpoint.py, .pipeline_state/<latest_folder>/).
+
+--resume: aynı latest_folder için tamamlanmış adımlar atlanır; ilk eksik adımdan
+devam edilir. Bir adımın tamamlanmış sayılması için çıktıları kayıttaki özetlerle
+aynı durmalı, yerelde bulunan girdileri (kod dosyaları dahil) değişmemiş olmalıdır.
+Tekrar çalışması gereken bir adımın girdisi yerelde yoksa (ör. meeting_data
+önbellekte tutulmaz) onu üreten adım da çalıştırılır. Yarıda kalan değerlendirme
+evaluation.ndjson'a eklenerek son puanlanan frame'den devam eder (stream_pipeline.py /
+evaluate_frames.mjs --resume).
+
+Örnek:
+  python run_pipeline.py                 # baştan, manifest yazarak
+  python run_pipeline.py --resume        # ilk eksik adımdan devam
+  python run_pipeline.py --resume --skip-fetch --batch
+  python run_pipeline.py --stream        # kayıtlar indirilmeden HF'den okunur
+  python run_pipeline.py --progressive   # değerlendirme sürerken ön rapor yayınlanır
+  python run_pipeline.py --budget-min 120  # plan 2 saatlik bütçeye göre
+  python run_pipeline.py --frame-store   # frame'ler bellek eşlemeli depodan (frame_store.py)
+
+Değerlendirme transkripsiyondan önce çalışır: --progressive ile ilgi grafikleri, yavaş
+WhisperX adımı beklenmeden ön rapor olarak (toplanti_raporu.html) yayınlanır; son rapor
+aynı adla yerine geçer. Süreler report_timing.json'a yazılır. --batch ile tüm katılımcılı ön
+rapor ayrı bir "provisional" adımıdır: arka planda transkripsiyonla aynı anda çalışır, son rapor
+yüklenmeden (upload) önce beklenir.
+
+İndirmeden sonraki "plan" adımı (scheduler.py) süre bütçesine göre Whisper modelini, ASR
+batch boyutunu, frame aralığını ve işçi sayılarını seçip run_plan.json'a yazar. Değerlendirme
+ve transkripsiyon bitince ölçülen verim bir sonraki çalıştırmanın planı için kaydedilir.
+Yarıda kalan kayıttan devam eden veya frame'leri hazır depodan okuyan (decode etmeyen)
+değerlendirmenin süresi verime katılmaz. Adım kendi iş süresini bildirirse (checkpoint.record_work_time;
+stream_pipeline ön rapor yayınını beklemesini hariç tutar) verim duvar saati yerine onunla ölçülür.
+"""
+import argparse
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+
+from checkpoint import (
+    LATEST_MEETING_JSON,
+    PIPELINE_STARTED_ENV,
+    REPORT_TIMING_JSON,
+    RUN_PLAN_JSON,
+    STAGE_TIMING_ENV,
+    check_manifest,
+    inputs_missing,
+    latest_folder,
+    pop_work_time,
+    state_dir,
+    timing_path,
+    write_manifest,
+)
+from evaluation_log import NDJSON_PATH, scan
+from scheduler import budget_minutes, record_stage
+
+PY = sys.executable
+FRAME_STORE_FRAMES = "frames.npy"  # frame_store.FRAMES_NAME (numpy'siz import için kopya)
+REPORT_INPUTS = ["evaluation.json", "evaluation.ndjson", "meeting_engagement.json", "latest_meeting.json",
+                 "meeting_data/**/*.txt"]
+EVALUATION_OUTPUTS = ["evaluation.json", "evaluation.ndjson"]
+# Yerel kayıtlar veya (download_meeting.py --stream) uzak kaynak listesi
+MEDIA_INPUTS = ["meeting_data/**/*.webm", "meeting_data/remote_sources.json"]
+TRANSCRIPT_OUTPUTS = ["meeting_transcript.json", "meeting_transcript.txt", "meeting_transcript.html"]
+
+
+@dataclass
+class Stage:
+    name: str
+    commands: list[list[str]]
+    inputs: list[str]
+    outputs: list[str]
+    key: dict = field(default_factory=dict)
+    refetchable: bool = False  # çıktılar yerelde olmasa da tamam sayılır (gerekirse tekrar indirilir)
+    background: bool = False  # tek komut; arka planda başlar, "upload" adımından ve pipeline sonundan önce beklenir
+
+
+def download_key() -> dict:
+    """İndirme girdisi: latest_meeting.json'un tamamı değil, indirilecek dosyalar (yüklenen raporlar hariç)."""
+    data = json.loads(LATEST_MEETING_JSON.read_text(encoding="utf-8"))
+    files = [(f.get("name"), f.get("size")) for f in data.get("files") or []
+             if (f.get("name") or "").endswith((".webm", ".txt"))]
+    return {"folder": data.get("latest_folder"), "files": sorted(files)}
+
+
+def build_stages(folder: str, batch: bool = False, stream: bool = False, progressive: bool = False,
+                 budget_min: float | None = None, frame_store: str | None = None,
+                 resume: bool = False) -> list[Stage]:
+    variant = os.environ.get("DAISEE_VARIANT") or "float32"
+    budget_min = budget_minutes(budget_min)
+    if batch:
+        # evaluate_frames.mjs --resume: yarım kalan evaluation.ndjson'dan devam eder
+        evaluate = [[PY, "extract_frames.py"], ["node", "evaluate_frames.mjs", "--resume"]]
+        evaluate_code = ["extract_frames.py", "media_manifest.py", "evaluate_frames.mjs"]
+    else:
+        # --resume: yarım kalan evaluation.ndjson'a eklenerek devam (run_pipeline --resume ile)
+        # --progressive: her katılımcı bitince ve değerlendirme sonunda ön rapor
+        # --frame-store: frame'ler depodan okunur, depo yoksa decode edilirken yazılır
+        evaluate = [[PY, "stream_pipeline.py", *(["--resume"] if resume else []),
+                     *(["--progressive"] if progressive else []),
+                     *(["--frame-store", frame_store] if frame_store else [])]]
+        evaluate_code = ["stream_pipeline.py", "extract_frames.py", "media_manifest.py", "evaluation_log.py",
+                         "evaluate_frames.mjs", *(["frame_store.py"] if frame_store else [])]
+    # --progressive --batch: tüm katılımcılarla ön rapor, transkripsiyonla aynı anda (stream_pipeline
+    # kendi içinde her katılımcıdan sonra yayınlar)
+    provisional = [Stage("provisional", [[PY, "progressive_report.py"]],
+                         ["progressive_report.py", "generate_report_html.py", "evaluation_log.py", "speakers.py",
+                          *EVALUATION_OUTPUTS, "latest_meeting.json"], ["meeting_report.provisional.html"],
+                         background=True)] if batch and progressive else []
+    return [
+        Stage("download", [[PY, "download_meeting.py", *(["--stream"] if stream else [])]], ["download_meeting.py"],
+              ["meeting_data"], key={**download_key(), "stream": stream}, refetchable=True),
+        # Süre bütçesine göre model / frame aralığı / işçi sayıları (run_plan.json)
+        Stage("plan", [[PY, "scheduler.py", "--budget-min", f"{budget_min:g}"]],
+              ["scheduler.py", "media_manifest.py", *MEDIA_INPUTS], [str(RUN_PLAN_JSON)],
+              key={"budget_min": budget_min}),
+        # Değerlendirme transkripsiyondan önce: ilgi grafikleri (ön rapor) WhisperX'i beklemez
+        Stage("evaluate", evaluate, [*evaluate_code, str(RUN_PLAN_JSON), *MEDIA_INPUTS], EVALUATION_OUTPUTS,
+              key={"variant": variant, "batch": batch}),
+        *provisional,
+        Stage("transcribe", [[PY, "transcribe_meeting.py"]],
+              ["transcribe_meeting.py", "vad.py", "speakers.py", "media_manifest.py", str(RUN_PLAN_JSON), *MEDIA_INPUTS],
+              TRANSCRIPT_OUTPUTS),
+        Stage("join", [[PY, "engagement_join.py"]],
+              ["engagement_join.py", "evaluation.json", "meeting_transcript.json"], ["meeting_engagement.json"]),
+        Stage("report_md", [[PY, "generate_report.py"]], ["generate_report.py", "evaluation_log.py", "speakers.py", *REPORT_INPUTS],
+              ["meeting_report.md"]),
+        Stage("report_html", [[PY, "generate_report_html.py"]],
+              ["generate_report_html.py", "evaluation_log.py", "speakers.py", *REPORT_INPUTS],
+              ["meeting_report.html"]),
+        Stage("upload", [[PY, "upload_report_to_hf.py"]],
+              ["upload_report_to_hf.py", "meeting_report.md", "meeting_report.html", *TRANSCRIPT_OUTPUTS,
+               "meeting_engagement.json"], []),
+    ]
+
+
+def producers(stages: list[Stage]) -> dict[str, int]:
+    """Çıktı kalıbı -> onu üreten adımın sırası (girdisi eksik adımın bağımlılığını bulmak için)."""
+    out = {}
+    for i, st in enumerate(stages):
+        for o in st.outputs:
+            out[o] = i
+    return out
+
+
+def depends_on(pattern: str, output: str) -> bool:
+    return pattern == output or pattern.startswith(output.rstrip("/") + "/")
+
+
+def plan(folder: str, stages: list[Stage]) -> list[bool]:
+    """Hangi adımlar çalışmalı? Eksik/değişmiş adımlar + girdisi yerelde olmayan çalışacak adımların üreticileri."""
+    need = []
+    for st in stages:
+        ok, reason = check_manifest(folder, st.name, st.inputs, st.outputs, st.key, st.refetchable)
+        print(f"  {st.name:<12} {'tamam' if ok else 'çalışacak: ' + reason}")
+        need.append(not ok)
+    made_by = producers(stages)
+    for i in range(len(stages) - 1, -1, -1):
+        if not need[i] or not inputs_missing(folder, stages[i].name, stages[i].inputs):
+            continue
+        for pattern in stages[i].inputs:
+            for output, j in made_by.items():
+                if j < i and depends_on(pattern, output) and not need[j]:
+                    print(f"  {stages[j].name:<12} çalışacak: {stages[i].name} girdisi yerelde yok")
+                    need[j] = True
+    return need
+
+
+def resumes_partial(st: Stage, batch: bool, resume: bool) -> bool:
+    """Değerlendirme yarıda kalan bir kayıttan mı devam edecek? (süresi verim ölçümüne katılmaz)"""
+    if st.name != "evaluate" or not NDJSON_PATH.exists():
+        return False
+    # --batch: evaluate_frames.mjs --resume mevcut evaluation.ndjson'dan her zaman devam eder;
+    # stream_pipeline.py sadece run_pipeline --resume ile ve tamamlanmamış kayıttan
+    return batch or (resume and not scan(NDJSON_PATH)[2])
+
+
+def reads_frame_store(st: Stage, frame_store: str | None, batch: bool) -> bool:
+    """Değerlendirme frame'leri hazır depodan mı okuyacak? (decode yok: süresi verim ölçümüne katılmaz)"""
+    if st.name != "evaluate" or not frame_store or batch:
+        return False
+    # Eski / başka kayda ait depo da sayılır: en kötü ihtimalle bir ölçüm kaydedilmez
+    return bool(glob.glob(os.path.join(frame_store, "*", FRAME_STORE_FRAMES)))
+
+
+def run_stage(folder: str, st: Stage, measure: bool = True) -> bool:
+    """
+    Adımın komutlarını sırayla çalıştırır. Verim, adım kendi iş süresini yazdıysa (checkpoint.record_work_time;
+    ör. stream_pipeline ön rapor yayınını beklemesini hariç tutar) onunla, yoksa duvar saatiyle ölçülür.
+    """
+    print(f"\n=== {st.name} ===", flush=True)
+    timing = timing_path(folder, st.name)
+    timing.parent.mkdir(parents=True, exist_ok=True)
+    timing.unlink(missing_ok=True)
+    env = {**os.environ, STAGE_TIMING_ENV: str(timing)}
+    t0 = time.perf_counter()
+    for cmd in st.commands:
+        if subprocess.run(cmd, env=env).returncode != 0:
+            print(f"HATA: {st.name} adımı başarısız: {' '.join(cmd)}", file=sys.stderr)
+            timing.unlink(missing_ok=True)
+            return False
+    wall = time.perf_counter() - t0
+    work = pop_work_time(timing) or wall
+    write_manifest(folder, st.name, st.inputs, st.outputs, st.key, wall, st.refetchable)
+    if measure and record_stage(st.name, work):
+        print(f"Verim kaydedildi: {st.name} ({work:.0f} sn)")
+    return True
+
+
+def start_background(st: Stage) -> tuple[Stage, subprocess.Popen, float]:
+    print(f"\n=== {st.name} (arka planda) ===", flush=True)
+    return st, subprocess.Popen(st.commands[0]), time.perf_counter()
+
+
+def finish_background(folder: str, running: list[tuple[Stage, subprocess.Popen, float]]) -> bool:
+    """Arka plan adımlarını bekler; bitenlerin manifestini yazar (verim ölçülmez). Hepsi başarılıysa True."""
+    ok = True
+    while running:
+        st, proc, t0 = running.pop(0)
+        if proc.wait() != 0:
+            print(f"HATA: {st.name} adımı başarısız: {' '.join(st.commands[0])}", file=sys.stderr)
+            ok = False
+            continue
+        write_manifest(folder, st.name, st.inputs, st.outputs, st.key, time.perf_counter() - t0, st.refetchable)
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Toplantı pipeline'ını adım manifestleriyle çalıştırır.")
+    parser.add_argument("--resume", action="store_true", help="Tamamlanmış adımları atla, eksik adımdan devam et")
+    parser.add_argument("--skip-fetch", action="store_true", help="Mevcut latest_meeting.json'u kullan")
+    parser.add_argument("--stream", action="store_true",
+                        help="Kayıtları indirmeden HF'den akış halinde oku (download_meeting.py --stream)")
+    parser.add_argument("--progressive", action="store_true",
+                        help="Değerlendirme sürerken ön HTML raporu yayınla (progressive_report.py)")
+    parser.add_argument("--batch", action="store_true",
+                        help="Değerlendirme için extract_frames.py + evaluate_frames.mjs (varsayılan: stream_pipeline.py)")
+    parser.add_argument("--budget-min", type=float,
+                        help="Duvar saati bütçesi, dk (varsayılan: SENSE_TIME_BUDGET_MIN veya 300; bkz. scheduler.py)")
+    parser.add_argument("--frame-store", nargs="?", const="frame_store",
+                        help="stream_pipeline.py --frame-store: frame'leri bellek eşlemeli depodan oku / depoya yaz "
+                             "(varsayılan kök: frame_store; --batch ile kullanılmaz)")
+    args = parser.parse_args()
+
+    # İlk / son rapor süreleri bu andan ölçülür (alt süreçler ortamı devralır)
+    os.environ[PIPELINE_STARTED_ENV] = str(time.time())
+    if not args.skip_fetch and subprocess.run([PY, "get_latest_meeting.py", "--output", str(LATEST_MEETING_JSON)]).returncode != 0:
+        return 1
+    folder = latest_folder()
+    if not folder:
+        print("HATA: latest_meeting.json içinde latest_folder yok.", file=sys.stderr)
+        return 1
+
+    if not args.resume and state_dir(folder).exists():
+        shutil.rmtree(state_dir(folder))
+    stages = build_stages(folder, batch=args.batch, stream=args.stream, progressive=args.progressive,
+                          budget_min=args.budget_min, frame_store=args.frame_store, resume=args.resume)
+    print(f"Toplantı: {folder}  (durum: {state_dir(folder)})")
+    need = plan(folder, stages) if args.resume else [True] * len(stages)
+
+    running = []  # arka plan adımları (ön rapor): son rapor aynı adla yüklenmeden önce bitmeli
+    for st, run in zip(stages, need):
+        if st.name == "upload" and not finish_background(folder, running):
+            return 1
+        # Önceki bir adım tekrar çalıştıysa girdiler değişmiş olabilir: atlamadan önce yeniden kontrol
+        if not run and check_manifest(folder, st.name, st.inputs, st.outputs, st.key, st.refetchable)[0]:
+            print(f"Atlandı (tamamlanmış): {st.name}")
+            continue
+        if st.background:
+            running.append(start_background(st))
+            continue
+        measure = not resumes_partial(st, args.batch, args.resume) and not reads_frame_store(st, args.frame_store, args.batch)
+        if not run_stage(folder, st, measure=measure):
+            finish_background(folder, running)
+            return 1
+    if not finish_background(folder, running):
+        return 1
+    print("\nPipeline tamamlandı.")
+    if RUN_PLAN_JSON.exists():
+        run_plan = json.loads(RUN_PLAN_JSON.read_text(encoding="utf-8"))
+        print(f"Plan: Whisper {run_plan['whisper_model']}, frame aralığı {run_plan['frame_interval']:g} sn, "
+              f"tahmini {run_plan['estimate']['total_sec'] / 60:.1f} dk / bütçe {run_plan['budget_sec'] / 60:.0f} dk")
+    if REPORT_TIMING_JSON.exists():
+        timing = json.loads(REPORT_TIMING_JSON.read_text(encoding="utf-8"))
+        if timing.get("started_epoch") == float(os.environ[PIPELINE_STARTED_ENV]):
+            print(f"İlk rapor: {timing.get('first_report_sec')} sn, son rapor: {timing.get('final_report_sec')} sn "
+                  f"({timing.get('provisional_reports', 0)} ön rapor)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Süre bütçesine göre çalıştırma planı: Whisper model boyutu, ASR batch boyutu, frame
+aralığı ve değerlendirme işçi sayıları.
+
+Sabit ayarlarla (base model, batch 16, 0.5 sn) 3 saatlik bir atölye runner süre sınırını
+aşabiliyor, 10 dakikalık bir toplantı ise daha iyi bir modeli rahatça kaldırabiliyor.
+Maliyet medya süresinden (media_manifest.py), katılımcı sayısından ve önceki
+çalıştırmalarda ölçülen verimden (analytics/throughput.json) tahmin edilir:
+
+    değerlendirme  ≈ toplam video süresi / frame aralığı / (frame/sn)
+    transkripsiyon ≈ ses süresi / (ses sn / duvar sn; model boyutuna göre)
+
+PLAN_LADDER en kaliteli seçenekten en hızlıya sıralıdır; pipeline başlangıcından bu yana
+geçen süre düşüldükten sonra kalan bütçeye (SAFETY payıyla) sığan ilk seçenek alınır.
+Hiçbiri sığmıyorsa en hızlısı seçilir ve uyarılır. Plan run_plan.json'a yazılır; adımlar
+checkpoint.planned() ile okur, seçilen frame aralığı evaluation.json'a da geçer.
+
+run_pipeline.py bu betiği "plan" adımı olarak çalıştırır; değerlendirme ve transkripsiyon
+adımları bitince ölçülen verim record_stage() ile geçmişe eklenir (üstel ortalama).
+Ölçülmemiş bir Whisper modelinin verimi ölçülmüş olanınkinden MODEL_SPEED oranıyla çıkarılır.
+
+Bütçe: --budget-min, yoksa SENSE_TIME_BUDGET_MIN, yoksa DEFAULT_BUDGET_MIN.
+Tek başına: python scheduler.py [--budget-min N]  -> planı yazar, seçenekleri listeler
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from checkpoint import PIPELINE_STARTED_ENV, RUN_PLAN_JSON, latest_folder, write_json_atomic
+from extract_frames import probe_duration
+from media_input import MEETING_DATA, is_remote
+from media_manifest import audio_info, video_infos
+
+THROUGHPUT_JSON = Path(os.environ.get("SENSE_THROUGHPUT_JSON", "analytics/throughput.json"))
+BUDGET_ENV = "SENSE_TIME_BUDGET_MIN"
+DEFAULT_BUDGET_MIN = 300  # GitHub Actions iş sınırı 360 dk; kurulum ve önbellek adımlarına pay
+SAFETY = 0.85  # tahmin hatasına pay: kalan bütçenin bu kadarı planlanır
+TAIL_SEC = 180.0  # eşleştirme, raporlar ve yükleme
+
+# (Whisper modeli, frame aralığı sn): en kaliteliden en hızlıya. Önce model büyütülür;
+# bütçe yetmezse önce frame aralığı, sonra model küçülür.
+PLAN_LADDER = [("medium", 0.5), ("small", 0.5), ("base", 0.5), ("base", 1), ("tiny", 1), ("tiny", 2)]
+# CPU'da batch büyüdükçe bellek artar, hız pek değişmez: büyük modelde küçük batch
+ASR_BATCH_SIZE = {"tiny": 16, "base": 16, "small": 8, "medium": 4}
+# base'e göre göreli transkripsiyon hızı (diarizasyon modelden bağımsız, paralel çalışır)
+MODEL_SPEED = {"tiny": 1.6, "base": 1.0, "small": 0.5, "medium": 0.25}
+# Geçmiş yokken varsayılan verim (ubuntu-latest, 4 çekirdek CPU)
+DEFAULT_EVALUATE_FPS = 15.0
+DEFAULT_TRANSCRIBE_RATE = 5.0  # base: toplantı sesi sn / duvar sn (dönüşüm, VAD, hizalama dahil)
+HISTORY_ALPHA = 0.5  # yeni ölçümün ortalamadaki ağırlığı
+BYTES_PER_SEC = 125_000  # süresi bilinmeyen uzak kayıtta boyuttan tahmin (~1 Mbit/sn)
+
+
+def load_history(path: Path = THROUGHPUT_JSON) -> dict:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def record_throughput(key: str, units: float, wall_sec: float, path: Path = THROUGHPUT_JSON) -> dict | None:
+    """key ("evaluate", "transcribe:<model>") için units / wall_sec ölçümünü ortalamaya ekler."""
+    if units <= 0 or wall_sec <= 0:
+        return None
+    history = load_history(path)
+    rate = units / wall_sec
+    prev = history.get(key)
+    entry = {
+        "rate": round(rate if not prev else (1 - HISTORY_ALPHA) * prev["rate"] + HISTORY_ALPHA * rate, 3),
+        "last": round(rate, 3),
+        "samples": (prev or {}).get("samples", 0) + 1,
+        "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    history[key] = entry
+    write_json_atomic(path, history)
+    return entry
+
+
+def record_stage(stage: str, wall_sec: float) -> dict | None:
+    """run_pipeline: biten adımın süresini run_plan.json'daki iş miktarıyla verime çevirip kaydeder."""
+    if not RUN_PLAN_JSON.exists():
+        return None
+    plan = json.loads(RUN_PLAN_JSON.read_text(encoding="utf-8"))
+    work = plan.get("workload") or {}
+    if stage == "evaluate":
+        return record_throughput("evaluate", work.get("video_sec", 0) / plan["frame_interval"], wall_sec)
+    if stage == "transcribe":
+        return record_throughput(f"transcribe:{plan['whisper_model']}", work.get("audio_sec", 0), wall_sec)
+    return None
+
+
+def evaluate_rate(history: dict) -> tuple[float, str]:
+    """(frame/sn, kaynak)."""
+    if "evaluate" in history:
+        return history["evaluate"]["rate"], f"geçmiş ({history['evaluate']['samples']} ölçüm)"
+    return DEFAULT_EVALUATE_FPS, "varsayılan"
+
+
+def transcribe_rate(history: dict, model: str) -> tuple[float, str]:
+    """(ses sn / duvar sn, kaynak). Model ölçülmemişse en çok ölçülen modelden ölçeklenir."""
+    key = f"transcribe:{model}"
+    if key in history:
+        return history[key]["rate"], f"geçmiş ({history[key]['samples']} ölçüm)"
+    measured = [(v["samples"], k.split(":", 1)[1]) for k, v in history.items()
+                if k.startswith("transcribe:") and k.split(":", 1)[1] in MODEL_SPEED]
+    if measured:
+        _, ref = max(measured)
+        rate = history[f"transcribe:{ref}"]["rate"] * MODEL_SPEED[model] / MODEL_SPEED[ref]
+        return rate, f"{ref} ölçümünden"
+    return DEFAULT_TRANSCRIBE_RATE * MODEL_SPEED[model], "varsayılan"
+
+
+def media_seconds(info) -> float:
+    """Kaydın süresi: başlık, yoksa (yerel dosyada) paket taraması, yoksa dosya boyutundan tahmin."""
+    if info.duration:
+        return info.duration
+    if not is_remote(info.source):
+        duration = probe_duration(info.source)
+        if duration:
+            return duration
+    return (info.size or 0) / BYTES_PER_SEC
+
+
+def workload(root: Path = MEETING_DATA) -> dict:
+    """Katılımcı sayısı, toplam video süresi (frame çıkarılacak) ve transkripsiyon sesi süresi (sn)."""
+    videos = video_infos(root)
+    audio = audio_info(root)
+    return {
+        "participants": len(videos),
+        "video_sec": round(sum(media_seconds(i) for i in videos), 1),
+        "audio_sec": round(media_seconds(audio), 1) if audio else 0.0,
+    }
+
+
+def worker_counts(participants: int, cpu: int) -> tuple[int, int]:
+    """
+    (decoder, çıkarım işçisi). Decoder'lar ucuzdur, çekirdeklerin yarısına kadar. Her çıkarım
+    işçisi modeli ayrı yükler ve tfjs-node zaten çok çekirdek kullanır: ikinci işçi sadece
+    geniş makinede ve birden fazla katılımcı varken.
+    """
+    decode = max(1, min(4, cpu // 2))
+    infer = 2 if cpu >= 8 and participants > 1 else 1
+    return decode, infer
+
+
+def estimate(work: dict, history: dict, model: str, interval: float) -> dict:
+    fps, _ = evaluate_rate(history)
+    rate, _ = transcribe_rate(history, model)
+    evaluate_sec = work["video_sec"] / interval / fps
+    transcribe_sec = work["audio_sec"] / rate
+    return {
+        "evaluate_sec": round(evaluate_sec, 1),
+        "transcribe_sec": round(transcribe_sec, 1),
+        "tail_sec": TAIL_SEC,
+        "total_sec": round(evaluate_sec + transcribe_sec + TAIL_SEC, 1),
+    }
+
+
+def make_plan(work: dict, budget_sec: float, elapsed_sec: float = 0.0, history: dict | None = None,
+              cpu: int | None = None) -> dict:
+    """Kalan bütçeye sığan en kaliteli PLAN_LADDER seçeneği (sığan yoksa en hızlısı)."""
+    history = history if history is not None else load_history()
+    cpu = cpu or os.cpu_count() or 1
+    available = max(0.0, budget_sec - elapsed_sec) * SAFETY
+    options = [(model, interval, estimate(work, history, model, interval)) for model, interval in PLAN_LADDER]
+    fitting = [o for o in options if o[2]["total_sec"] <= available]
+    model, interval, est = fitting[0] if fitting else options[-1]
+    decode, infer = worker_counts(work["participants"], cpu)
+    fps, fps_source = evaluate_rate(history)
+    rate, rate_source = transcribe_rate(history, model)
+    return {
+        "folder": latest_folder(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "budget_sec": round(budget_sec, 1),
+        "elapsed_sec": round(elapsed_sec, 1),
+        "available_sec": round(available, 1),
+        "cpu_count": cpu,
+        "workload": work,
+        "whisper_model": model,
+        "asr_batch_size": ASR_BATCH_SIZE[model],
+        "frame_interval": interval,
+        "decode_workers": decode,
+        "infer_workers": infer,
+        "estimate": est,
+        "throughput": {
+            "evaluate_fps": {"rate": round(fps, 3), "source": fps_source},
+            "transcribe_rate": {"rate": round(rate, 3), "source": rate_source},
+        },
+        "fits": bool(fitting),
+        "options": [{"whisper_model": m, "frame_interval": i, "total_sec": e["total_sec"]} for m, i, e in options],
+    }
+
+
+def budget_minutes(value: float | None = None) -> float:
+    """--budget-min, yoksa SENSE_TIME_BUDGET_MIN, yoksa varsayılan."""
+    if value:
+        return value
+    return float(os.environ.get(BUDGET_ENV) or DEFAULT_BUDGET_MIN)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Süre bütçesine göre model / frame aralığı / işçi planı (run_plan.json).")
+    parser.add_argument("--budget-min", type=float,
+                        help=f"Pipeline duvar saati bütçesi, dk (varsayılan: {BUDGET_ENV} veya {DEFAULT_BUDGET_MIN})")
+    args = parser.parse_args()
+
+    started = os.environ.get(PIPELINE_STARTED_ENV)
+    elapsed = time.time() - float(started) if started else 0.0
+    work = workload()
+    plan = make_plan(work, budget_minutes(args.budget_min) * 60, elapsed)
+    write_json_atomic(RUN_PLAN_JSON, plan)
+
+    print(f"{work['participants']} katılımcı, video {work['video_sec'] / 60:.1f} dk, ses {work['audio_sec'] / 60:.1f} dk; "
+          f"bütçe {plan['budget_sec'] / 60:.0f} dk (geçen {elapsed / 60:.1f} dk, planlanan {plan['available_sec'] / 60:.1f} dk)")
+    print(f"Verim: değerlendirme {plan['throughput']['evaluate_fps']['rate']:g} frame/sn "
+          f"({plan['throughput']['evaluate_fps']['source']})")
+    for o in plan["options"]:
+        mark = "*" if (o["whisper_model"], o["frame_interval"]) == (plan["whisper_model"], plan["frame_interval"]) else " "
+        print(f" {mark} {o['whisper_model']:<7} {o['frame_interval']:>4g} sn  ~{o['total_sec'] / 60:.1f} dk")
+    print(f"Plan: Whisper {plan['whisper_model']} (batch {plan['asr_batch_size']}), frame aralığı "
+          f"{plan['frame_interval']:g} sn, {plan['decode_workers']} decoder / {plan['infer_workers']} çıkarım işçisi, "
+          f"tahmini {plan['estimate']['total_sec'] / 60:.1f} dk")
+    if not plan["fits"]:
+        print("UYARI: en hızlı plan da bütçeyi aşabilir.", file=sys.stderr)
+    print("Yazıldı:", RUN_PLAN_JSON)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,17 @@
+"""
+Konuşmacı etiketleri: diarizasyonun SPEAKER_NN kimlikleri -> raporlarda gösterilen ad.
+
+transcribe_meeting.py (transkript çıktıları) ve rapor betikleri (generate_report.py,
+generate_report_html.py) ortak kullanır; raporlar ASR modülünü import etmez.
+"""
+
+
+def speaker_label(speaker: str) -> str:
+    """SPEAKER_00 -> Konuşmacı 1, SPEAKER_01 -> Konuşmacı 2."""
+    if not speaker:
+        return "Bilinmeyen"
+    try:
+        num = int(speaker.replace("SPEAKER_", "")) + 1
+        return f"Konuşmacı {num}"
+    except Exception:
+        return speaker
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Frame çıkarma + DAiSEE değerlendirmeyi tek akışta birleştirir.
+
+extract_frames.py + evaluate_frames.mjs sırayla çalıştığında decoder ve model hiç
+aynı anda çalışmaz. Burada decoder thread'leri ffmpeg'den ham frame batch'lerini
+sınırlı bir kuyruğa iter, çıkarım işçileri (evaluate_frames.mjs --worker süreçleri)
+kuyruktan tüketir. Kuyruk doluysa decoder bekler (backpressure), bellek sınırlı kalır.
+
+Çıktı: evaluation.ndjson (her puanlanan batch geldiği anda bir satır, evaluation_log.py)
+ve bitince ondan akış halinde sıkıştırılan evaluation.json — extract_frames.py +
+evaluate_frames.mjs ile aynı içerik (frame adları, skorlar, dominant/level, summary).
+PNG frame yazılmaz. Puanlanan frame'ler NDJSON'a yazıldığı anda bellekten düşer; video
+başına sadece frame sayısı ve dominant etiket sayıları tutulur (toplantı uzunluğundan bağımsız).
+Her katılımcının skorları, o video bittiği anda hazırdır (on_video_done: frameCount + summary;
+frame skorları evaluation.ndjson'da).
+Uzun videolar extract_frames.plan_segments ile zaman aralıklarına bölünür; her aralık
+ayrı bir decode işi olarak kuyruğa girer. Videolar en uzundan kısaya kuyruğa girer;
+süreler media_manifest.py önbelleğinden gelir (video başına ayrıca yoklanmaz).
+
+--resume: yarıda kalan evaluation.ndjson aynı model varyantına ve frame aralığına aitse
+(evaluation_log.resume) kayda eklenerek devam edilir; kaynak dosya boyutu değişmemiş her
+video son ardışık puanlanan frame'den sürer, diğerleri baştan puanlanır. Ayrı bir kayıt
+dosyası yoktur: her batch zaten puanlandığı anda NDJSON'a eklenir.
+
+--progressive: her katılımcı bitince ön HTML rapor arka planda yayınlanır (progressive_report.py,
+sadece bu seçenekle yüklenir). Değerlendirme sonunda ayrıca rapor üretilmez: son katılımcının
+yayını hepsini içerir; çıkışta sadece süren yayın beklenir. run_pipeline.py altında adımın iş
+süresi (checkpoint.record_work_time) bu bekleme olmadan bildirilir: verim ölçümüne yayın girmez.
+
+--frame-store [DIR]: katılımcının bellek eşlemeli frame deposu (frame_store.py) varsa
+frame'ler decode edilmeden oradan kopyasız okunur; yoksa decode edilirken depo yazılır
+(sonraki analizler için). numpy sadece bu seçenekle yüklenir.
+
+Frame aralığı ve işçi sayılarının varsayılanları run_pipeline.py'nin süre bütçesine göre
+yazdığı run_plan.json'dan gelir (scheduler.py); komut satırı seçenekleri önceliklidir.
+"""
+import argparse
+import json
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from checkpoint import PIPELINE_STARTED_ENV, planned, record_work_time
+from evaluation_log import NDJSON_PATH, EvaluationLogWriter, compact, resume
+from extract_frames import FRAME_BYTES, FRAME_INTERVAL, iter_raw_frames, plan_segments, probe_duration
+from media_input import source_size
+from media_manifest import video_infos
+
+REPO_ROOT = Path(__file__).resolve().parent
+EVALUATOR = REPO_ROOT / "evaluate_frames.mjs"
+OUTPUT_JSON = Path("evaluation.json")
+
+BATCH_FRAMES = 32  # kuyruk elemanı başına frame (32 × 147 KB ≈ 4.7 MB)
+QUEUE_SIZE = 8  # en fazla bu kadar batch bellekte bekler
+DECODE_WORKERS = 2
+INFER_WORKERS = 1  # her işçi modeli ayrı yükler; tfjs-node zaten çok çekirdek kullanır
+
+_DONE = object()
+
+
+def video_summary(frames: list[dict]) -> dict:
+    """evaluate_frames.mjs ile aynı: dominant etiket sayıları (ilk görülme sırasıyla)."""
+    summary = {}
+    for f in frames:
+        summary[f["dominant"]] = summary.get(f["dominant"], 0) + 1
+    return summary
+
+
+def merge_summary(into: dict, summary: dict) -> None:
+    """Sonraki frame'lerin özetini ekler; ardışık batch'ler sırayla eklenince ilk görülme sırası korunur."""
+    for label, n in summary.items():
+        into[label] = into.get(label, 0) + n
+
+
+def resume_plan(plan: list[tuple[int, int | None]], done: int) -> list[tuple[int, int | None]]:
+    """İlk `done` frame'i zaten puanlanmış bir videonun kalan decode aralıkları."""
+    out = []
+    for start, count in plan:
+        if count is not None and start + count <= done:
+            continue
+        if start < done:
+            count = None if count is None else count - (done - start)
+            start = done
+        out.append((start, count))
+    return out
+
+
+class _VideoState:
+    def __init__(self):
+        self.decoded = 0
+        self.pending_jobs = 0
+        self.scored = 0
+        self.reported = False
+        # Baştan boşluksuz puanlanmış önek: frame sayısı + özet. Önekten sonra (sıra dışı) gelen
+        # batch'lerin sadece (frame sayısı, özet) çifti bekler; frame'ler NDJSON'da.
+        self.prefix = 0
+        self.summary: dict = {}
+        self.ahead: dict[int, tuple[int, dict]] = {}
+
+    def add_batch(self, start: int, count: int, summary: dict) -> None:
+        self.ahead[start] = (count, summary)
+        while self.prefix in self.ahead:
+            count, summary = self.ahead.pop(self.prefix)
+            merge_summary(self.summary, summary)
+            self.prefix += count
+
+
+class StreamPipeline:
+    """Sınırlı kuyruklu üretici/tüketici: decoder thread'leri -> kuyruk -> Node çıkarım işçileri."""
+
+    def __init__(self, videos: list, on_video_done=None, batch_frames: int = BATCH_FRAMES,
+                 queue_size: int = QUEUE_SIZE, decode_workers: int = DECODE_WORKERS,
+                 infer_workers: int = INFER_WORKERS, resumed: dict[str, tuple[int, dict]] | None = None,
+                 durations: dict[str, float] | None = None, log: EvaluationLogWriter | None = None,
+                 frame_store: Path | None = None):
+        self.videos = videos
+        self.frame_store = frame_store  # depo kökü (frame_store.py); None: her zaman decode
+        self.stores = {}  # video adı -> FrameStore (okunacak)
+        self.store_writers = {}  # video adı -> FrameStoreWriter (decode sırasında yazılacak)
+        self.log = log  # puanlanan batch'ler ve biten videolar buraya eklenir
+        self.durations = durations or {}  # video adı -> süre (media_manifest); yoksa probe_duration
+        self.resumed = resumed or {}  # video adı -> kayıtta puanlanmış önek (frame sayısı, özet; evaluation_log.resume)
+        self.on_video_done = on_video_done
+        self.batch_frames = batch_frames
+        self.decode_workers = max(1, decode_workers)
+        self.infer_workers = max(1, infer_workers)
+        self.frames_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.jobs_q: queue.Queue = queue.Queue()
+        self.state = {v.stem: _VideoState() for v in videos}
+        self.lock = threading.Lock()
+        self.errors: list[BaseException] = []
+        self.started = 0.0
+
+    # --- üretici ---
+    def _decoder(self) -> None:
+        while True:
+            try:
+                video, seg_start, seg_count = self.jobs_q.get_nowait()
+            except queue.Empty:
+                return
+            name = video.stem
+            store, writer = self.stores.get(name), self.store_writers.get(name)
+            try:
+                if store:
+                    batches = store.batches(self.batch_frames, seg_start, seg_count)
+                else:
+                    batches = iter_raw_frames(video, self.batch_frames, seg_start, seg_count)
+                for start, count, data in batches:
+                    if self.errors:
+                        return
+                    if writer:
+                        writer.write(start, data)
+                    with self.lock:
+                        self.state[name].decoded += count
+                    if not self._put((name, start, count, data)):
+                        return
+            except BaseException as e:
+                self.errors.append(e)
+                return
+            finally:
+                with self.lock:
+                    self.state[name].pending_jobs -= 1
+                    decoded = self.state[name].pending_jobs == 0
+                if decoded:
+                    self._close_store(name)
+                self._check_done(name)
+
+    def _close_store(self, name: str) -> None:
+        """Videonun tüm aralıkları decode edildi: yazılan depo tamamlanır (hata varsa silinir)."""
+        writer = self.store_writers.pop(name, None)
+        if not writer:
+            return
+        if self.errors:
+            writer.abort()
+        elif writer.close():
+            print(f"Frame deposu yazıldı: {writer.directory} ({writer.end} frame)")
+
+    def _put(self, item) -> bool:
+        """Kuyruk doluysa bekler (backpressure); işçiler hata ile durduysa False döner."""
+        while not self.errors:
+            try:
+                self.frames_q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    # --- tüketici ---
+    def _get(self):
+        """Kuyruktan batch alır; başka bir thread hata verdiyse _DONE döner."""
+        while not self.errors:
+            try:
+                return self.frames_q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _infer_worker(self) -> None:
+        proc = subprocess.Popen(
+            ["node", str(EVALUATOR), "--worker"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        )  # stderr devralınır: okunmayan bir boruyu tfjs uyarıları doldurup işçiyi kilitleyemez
+        try:
+            while True:
+                item = self._get()
+                if item is _DONE:
+                    return
+                name, start, count, data = item
+                header = json.dumps({"video": name, "start": start, "count": count}, ensure_ascii=False)
+                proc.stdin.write(header.encode("utf-8") + b"\n")
+                proc.stdin.write(data)
+                proc.stdin.flush()
+                line = proc.stdout.readline()
+                if not line:
+                    raise RuntimeError(f"Çıkarım işçisi beklenmedik şekilde kapandı (kod {proc.poll()}).")
+                frames = json.loads(line)["frames"]
+                if self.log:
+                    self.log.batch(name, start, frames)
+                with self.lock:
+                    st = self.state[name]
+                    st.add_batch(start, len(frames), video_summary(frames))
+                    st.scored += len(frames)
+                self._check_done(name)
+        except BaseException as e:
+            self.errors.append(e)
+        finally:
+            proc.stdin.close()
+            proc.wait()
+
+    def _check_done(self, name: str) -> None:
+        with self.lock:
+            st = self.state[name]
+            if st.reported or st.pending_jobs > 0 or st.scored < st.decoded:
+                return
+            st.reported = True
+            result = self._result(name)
+        if self.log:
+            self.log.video_done(name, result["frameCount"], result["summary"])
+        print(f"Skorlar hazır: {name} ({result['frameCount']} frame, {time.perf_counter() - self.started:.1f} sn)")
+        if self.on_video_done:
+            self.on_video_done(name, result)
+
+    def _result(self, name: str) -> dict:
+        """Videonun frameCount + summary'si (evaluate_frames.mjs şeması, frames hariç: skorlar NDJSON'da)."""
+        st = self.state[name]
+        return {"frameCount": st.prefix, "summary": dict(st.summary)}
+
+    def run(self) -> dict:
+        """
+        Tüm videoları işler. {"videos": {ad: {frameCount, summary}}, "frameInterval"} döner; frame skorları
+        bellekte toplanmaz, log'a (evaluation.ndjson) yazılır ve compact() ile evaluation.json'a geçer.
+        """
+        self.started = time.perf_counter()
+        if self.frame_store:
+            from frame_store import FrameStoreWriter, open_store
+        for v in self.videos:
+            st = self.state[v.stem]
+            done, done_summary = self.resumed.get(v.stem) or (0, {})
+            store = open_store(v, self.frame_store) if self.frame_store else None
+            if store:
+                self.stores[v.stem] = store
+                plan = [(0, None)]  # depodan okuma ucuz: aralıklara bölmeye gerek yok
+                print(f"Frame deposundan: {v.stem} ({len(store)} frame)")
+            else:
+                plan = plan_segments(self.durations.get(v.stem) or probe_duration(v))
+                if self.frame_store and not done:  # devam eden videonun deposu baştan eksik kalırdı
+                    self.store_writers[v.stem] = FrameStoreWriter(v, self.frame_store)
+            if done:  # önek kayıtta zaten var: tekrar yazılmaz
+                st.add_batch(0, done, done_summary)
+                st.decoded = st.scored = done
+                plan = resume_plan(plan, done)
+                print(f"Devam: {v.stem} ({done} frame önceden puanlanmış)")
+            st.pending_jobs = len(plan)
+            for start_index, count in plan:
+                self.jobs_q.put((v, start_index, count))
+        infer = [threading.Thread(target=self._infer_worker, daemon=True) for _ in range(self.infer_workers)]
+        decoders = [threading.Thread(target=self._decoder, daemon=True) for _ in range(self.decode_workers)]
+        for t in infer + decoders:
+            t.start()
+        for name, st in self.state.items():
+            if not st.pending_jobs:
+                self._check_done(name)
+        for t in decoders:
+            t.join()
+        for _ in infer:
+            self._put(_DONE)
+        for t in infer:
+            t.join()
+        for name in list(self.store_writers):
+            self._close_store(name)
+        if self.errors:
+            raise self.errors[0]
+
+        # evaluate_frames.mjs frames/ alt klasörlerini isim sırasıyla gezer (boş klasörler dahil)
+        return {"videos": {name: self._result(name) for name in sorted(self.state)}, "frameInterval": FRAME_INTERVAL}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frame çıkarma + DAiSEE değerlendirmeyi akış halinde çalıştırır.")
+    parser.add_argument("--decode-workers", type=int, default=planned("decode_workers", DECODE_WORKERS))
+    parser.add_argument("--infer-workers", type=int, default=planned("infer_workers", INFER_WORKERS))
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE, help="Kuyruktaki en fazla batch sayısı")
+    parser.add_argument("--batch-frames", type=int, default=BATCH_FRAMES)
+    parser.add_argument("--model-variant", choices=("float32", "float16", "uint8"),
+                        help="DAiSEE ağırlık varyantı (varsayılan: DAISEE_VARIANT veya float32)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Yarıda kalan evaluation.ndjson varsa kaldığı yerden devam et")
+    parser.add_argument("--progressive", action="store_true",
+                        help="Her katılımcı bitince ön HTML raporu üret ve HF'e yükle")
+    parser.add_argument("--no-upload", action="store_true", help="--progressive: ön raporu sadece yerelde yaz")
+    parser.add_argument("--frame-store", nargs="?", const="frame_store",
+                        help="Frame'leri bellek eşlemeli depodan oku / decode ederken depoya yaz (varsayılan kök: frame_store)")
+    args = parser.parse_args()
+    t0 = time.perf_counter()
+    if args.model_variant:
+        os.environ["DAISEE_VARIANT"] = args.model_variant  # çıkarım işçileri ortamı devralır
+    # Tek başına çalışırken ilk rapor süresi bu sürecin başından ölçülür
+    os.environ.setdefault(PIPELINE_STARTED_ENV, str(time.time()))
+
+    variant = os.environ.get("DAISEE_VARIANT") or "float32"
+    infos = video_infos()  # en uzun önce
+    if not infos:
+        EvaluationLogWriter(NDJSON_PATH, variant, FRAME_INTERVAL).close()
+        compact(NDJSON_PATH, OUTPUT_JSON)
+        print("meeting_data altında görüntü içeren .webm bulunamadı, boş evaluation yazıldı.")
+        return 0
+    videos = [i.source for i in infos]
+    expected = sum(i.expected_frames or 0 for i in infos)
+    sizes = {v.stem: source_size(v) for v in videos}
+    resumed = resume(NDJSON_PATH, variant, FRAME_INTERVAL, sizes) if args.resume else None
+    log = EvaluationLogWriter(NDJSON_PATH, variant, FRAME_INTERVAL, sources=sizes, append=resumed is not None)
+    if resumed is not None:
+        print(f"Devam: {NDJSON_PATH} ({len(resumed)} video kaldığı yerden)")
+        for name in sorted(sizes.keys() - resumed.keys()):
+            log.reset(name, sizes[name])  # kayıttaki önceki satırları (başka boyutta kaynak) geçersiz
+
+    print(f"{len(videos)} video (~{expected} frame, {FRAME_INTERVAL:g} sn aralık), {args.decode_workers} decoder, {args.infer_workers} çıkarım işçisi, "
+          f"kuyruk {args.queue_size} × {args.batch_frames} frame (~{args.queue_size * args.batch_frames * FRAME_BYTES / 1e6:.0f} MB)")
+    reporter = None
+    if args.progressive:
+        # rapor + HF yükleme modülleri sadece ön rapor istendiğinde yüklenir
+        from progressive_report import ProvisionalReporter
+        reporter = ProvisionalReporter(upload=not args.no_upload)
+    pipeline = StreamPipeline(
+        videos,
+        on_video_done=reporter.on_video_done if reporter else None,
+        batch_frames=args.batch_frames,
+        queue_size=args.queue_size,
+        decode_workers=args.decode_workers,
+        infer_workers=args.infer_workers,
+        resumed=resumed,
+        durations={i.source.stem: i.duration for i in infos if i.duration},
+        log=log,
+        frame_store=Path(args.frame_store) if args.frame_store else None,
+    )
+    # Runner zaman aşımı / iptal (SIGTERM): kayıt yazılabilsin diye KeyboardInterrupt'a çevrilir
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        pipeline.run()
+    except KeyboardInterrupt:
+        pipeline.log.close(complete=False)
+        if reporter:
+            reporter.close()
+        raise
+    except Exception as e:
+        pipeline.log.close(complete=False)
+        if reporter:
+            reporter.close()
+        print("HATA:", e, file=sys.stderr)
+        return 1
+    pipeline.log.close()
+    compact(NDJSON_PATH, OUTPUT_JSON)
+    print("Değerlendirme yazıldı:", NDJSON_PATH, "->", OUTPUT_JSON)
+    record_work_time(time.perf_counter() - t0)  # ön rapor yayınını beklemeden önce
+    if reporter:
+        reporter.close()  # son katılımcının yayını (tüm katılımcılar) bitene kadar
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
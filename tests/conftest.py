@@ -0,0 +1,58 @@
+"""
+Testler repo kökündeki betikleri gerçek bir çalışma dizininde (tmp_path) çalıştırır:
+meeting_data/ sentetik fixture'a (benchmarks/fixtures.py) bağlanır, latest_meeting.json yazılır.
+ffmpeg / node gerektiren testler bunlar yoksa atlanır.
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "benchmarks"))
+
+from fixtures import latest_meeting_meta, make_meeting  # noqa: E402
+
+STUB_TFJS = Path(__file__).resolve().parent / "stub_tfjs" / "register.mjs"
+
+needs_ffmpeg = pytest.mark.skipif(not shutil.which("ffmpeg"), reason="ffmpeg yok")
+needs_node = pytest.mark.skipif(not shutil.which("node"), reason="node yok")
+
+
+def run_script(cwd: Path, *cmd: str, env: dict | None = None) -> subprocess.CompletedProcess:
+    """Repo betiğini (ör. "extract_frames.py" veya "node", "evaluate_frames.mjs") cwd'de çalıştırır; hata varsa test düşer."""
+    if cmd[0].endswith(".py"):
+        cmd = (sys.executable, str(REPO_ROOT / cmd[0]), *cmd[1:])
+    elif cmd[0] == "node":
+        cmd = ("node", str(REPO_ROOT / cmd[1]), *cmd[2:])
+    r = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, env={**os.environ, **(env or {})})
+    assert r.returncode == 0, f"{' '.join(cmd)} başarısız ({r.returncode}):\n{r.stdout[-2000:]}\n{r.stderr[-2000:]}"
+    return r
+
+
+def stub_tfjs_env() -> dict:
+    """Node süreçlerinde tfjs-node yerine deterministik stub model (tests/stub_tfjs)."""
+    return {"NODE_OPTIONS": f"--import {STUB_TFJS.as_uri()}"}
+
+
+@pytest.fixture(scope="session")
+def meeting_data(tmp_path_factory) -> Path:
+    """2 katılımcı × 20 sn sentetik toplantı (oturum boyunca bir kez üretilir)."""
+    if not shutil.which("ffmpeg"):
+        pytest.skip("ffmpeg yok")
+    root = tmp_path_factory.mktemp("fixture") / "meeting_data"
+    make_meeting(root, participants=2, duration=20)
+    return root
+
+
+@pytest.fixture
+def workdir(tmp_path, meeting_data) -> Path:
+    (tmp_path / "meeting_data").symlink_to(meeting_data, target_is_directory=True)
+    (tmp_path / "latest_meeting.json").write_text(json.dumps(latest_meeting_meta(), ensure_ascii=False),
+                                                  encoding="utf-8")
+    return tmp_path
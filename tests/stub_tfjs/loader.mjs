@@ -0,0 +1,6 @@
+const STUB = new URL("./tfjs.mjs", import.meta.url).href;
+
+export async function resolve(specifier, context, next) {
+  if (specifier === "@tensorflow/tfjs-node") return { url: STUB, shortCircuit: true };
+  return next(specifier, context);
+}
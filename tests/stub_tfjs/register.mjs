@@ -0,0 +1,7 @@
+/**
+ * NODE_OPTIONS="--import <bu dosya>": "@tensorflow/tfjs-node" importunu stub'a (tfjs.mjs) yönlendirir.
+ * Hem evaluate_frames.mjs hem stream_pipeline.py'nin başlattığı --worker süreçleri ortamı devralır.
+ */
+import { register } from "node:module";
+
+register("./loader.mjs", import.meta.url);
@@ -0,0 +1,111 @@
+/**
+ * Testler için @tensorflow/tfjs-node yerine geçen küçük stub: evaluate_frames.mjs'in kullandığı
+ * tensor işlemleri ve PNG (8 bit RGB/RGBA) decode. "Model" pikselleri 4 deterministik skora
+ * çevirir; aynı piksellerden (PNG veya ham rgb24) bayt bayt aynı skorlar çıkar.
+ */
+import zlib from "zlib";
+
+class Tensor {
+  constructor(values, shape) {
+    this.values = values;
+    this.shape = shape;
+  }
+
+  dispose() {}
+
+  div(x) {
+    return new Tensor(Float32Array.from(this.values, (v) => v / x), this.shape);
+  }
+
+  expandDims(axis) {
+    const shape = [...this.shape];
+    shape.splice(axis, 0, 1);
+    return new Tensor(this.values, shape);
+  }
+
+  dataSync() {
+    return this.values;
+  }
+}
+
+export function tensor3d(values, shape) {
+  return new Tensor(values, shape);
+}
+
+export const image = {
+  resizeBilinear(t, [h, w]) {
+    if (t.shape[0] !== h || t.shape[1] !== w) throw new Error(`stub: yeniden boyutlandırma yok (${t.shape})`);
+    return new Tensor(Float32Array.from(t.values), t.shape);
+  },
+};
+
+function paeth(a, b, c) {
+  const p = a + b - c, pa = Math.abs(p - a), pb = Math.abs(p - b), pc = Math.abs(p - c);
+  return pa <= pb && pa <= pc ? a : pb <= pc ? b : c;
+}
+
+function decodePng(buf) {
+  let pos = 8, width = 0, height = 0, colorType = 0;
+  const idat = [];
+  while (pos < buf.length) {
+    const len = buf.readUInt32BE(pos);
+    const type = buf.toString("latin1", pos + 4, pos + 8);
+    const data = buf.subarray(pos + 8, pos + 8 + len);
+    if (type === "IHDR") {
+      width = data.readUInt32BE(0);
+      height = data.readUInt32BE(4);
+      colorType = data[9];
+      if (data[8] !== 8 || (colorType !== 2 && colorType !== 6)) throw new Error("stub: sadece 8 bit RGB/RGBA PNG");
+    } else if (type === "IDAT") {
+      idat.push(data);
+    }
+    pos += 12 + len;
+  }
+  const bpp = colorType === 6 ? 4 : 3, stride = width * bpp;
+  const raw = zlib.inflateSync(Buffer.concat(idat));
+  const rows = Buffer.alloc(stride * height);
+  for (let y = 0; y < height; y++) {
+    const filter = raw[y * (stride + 1)];
+    const src = raw.subarray(y * (stride + 1) + 1, (y + 1) * (stride + 1));
+    for (let x = 0; x < stride; x++) {
+      const a = x >= bpp ? rows[y * stride + x - bpp] : 0;
+      const b = y ? rows[(y - 1) * stride + x] : 0;
+      const c = x >= bpp && y ? rows[(y - 1) * stride + x - bpp] : 0;
+      const pred = [0, a, b, (a + b) >> 1, paeth(a, b, c)][filter];
+      rows[y * stride + x] = (src[x] + pred) & 0xff;
+    }
+  }
+  const out = new Int32Array(width * height * 3);
+  for (let i = 0; i < width * height; i++) {
+    for (let ch = 0; ch < 3; ch++) out[i * 3 + ch] = rows[i * bpp + ch];
+  }
+  return new Tensor(out, [height, width, 3]);
+}
+
+export const node = {
+  decodeImage(buf, channels) {
+    if (channels !== 3) throw new Error("stub: sadece 3 kanal");
+    return decodePng(buf);
+  },
+};
+
+export async function loadGraphModel() {
+  return {
+    predict(input) {
+      // Kanal ortalamaları + parlaklık değişimi -> softmax; sahneden sahneye farklı baskın etiket
+      const v = input.values, sums = [0, 0, 0, 0];
+      for (let i = 0; i < v.length; i += 3) {
+        sums[0] += v[i];
+        sums[1] += v[i + 1];
+        sums[2] += v[i + 2];
+        if (i >= 3) sums[3] += Math.abs(v[i] - v[i - 3]);
+      }
+      const n = v.length / 3;
+      const logits = sums.map((s, k) => (k === 3 ? 8 : 4) * s / n);
+      const max = Math.max(...logits);
+      const exp = logits.map((l) => Math.exp(l - max));
+      const total = exp.reduce((a, b) => a + b, 0);
+      return new Tensor(Float32Array.from(exp, (e) => e / total), [1, 4]);
+    },
+  };
+}
@@ -0,0 +1,39 @@
+"""
+evaluation_log.read_evaluation: tamamlanmamış evaluation.ndjson sessizce tam sonuç gibi okunmaz.
+"""
+import json
+import os
+
+from evaluation_log import EvaluationLogWriter, read_evaluation
+
+
+def write_log(path, complete: bool) -> None:
+    log = EvaluationLogWriter(path, "float32", 0.5)
+    log.batch("ali", 0, [{"frame": "frame_0001.png", "dominant": "engagement"}])
+    log.close(complete=complete)
+
+
+def test_incomplete_log_warns(tmp_path, capsys):
+    ndjson, js = tmp_path / "evaluation.ndjson", tmp_path / "evaluation.json"
+    write_log(ndjson, complete=False)
+    data = read_evaluation(frames=False, path=ndjson, json_path=js)
+    assert data["complete"] is False and data["videos"]["ali"]["frameCount"] == 1
+    assert "tamamlanmamış" in capsys.readouterr().err
+
+
+def test_incomplete_log_prefers_newer_json(tmp_path, capsys):
+    ndjson, js = tmp_path / "evaluation.ndjson", tmp_path / "evaluation.json"
+    write_log(ndjson, complete=False)
+    js.write_text(json.dumps({"videos": {"ali": {"frameCount": 2}}, "frameInterval": 0.5}), encoding="utf-8")
+    os.utime(ndjson, (0, 0))
+    assert read_evaluation(frames=False, path=ndjson, json_path=js)["videos"]["ali"]["frameCount"] == 2
+    assert "tamamlanmamış" in capsys.readouterr().err
+
+
+def test_partial_and_complete_logs_read_silently(tmp_path, capsys):
+    ndjson, js = tmp_path / "evaluation.ndjson", tmp_path / "evaluation.json"
+    write_log(ndjson, complete=False)
+    assert read_evaluation(frames=False, path=ndjson, json_path=js, partial=True)["complete"] is False
+    write_log(ndjson, complete=True)
+    assert read_evaluation(frames=False, path=ndjson, json_path=js)["complete"] is True
+    assert capsys.readouterr().err == ""
@@ -0,0 +1,71 @@
+"""
+Uzak kayıt adresinin çözümlenmesi (media_input.resolve_url): geçici hata bir kez tekrarlanır,
+çözülemeyen adres çağıranlarda (frame çıkarma, WAV dönüşümü) istisna değil başarısızlık değeri olur.
+"""
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+import extract_frames
+import media_input
+import transcribe_meeting
+from media_input import RemoteMedia, resolve_url
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """İlk HEAD 503, sonrakiler imzalı adrese 302."""
+
+    heads = 0
+
+    def do_HEAD(self):
+        type(self).heads += 1
+        if self.heads == 1:
+            self.send_response(503)
+        else:
+            self.send_response(302)
+            self.send_header("Location", "/signed/kayit.webm")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _FlakyHandler.heads = 0
+    httpd = HTTPServer(("127.0.0.1", 0), _FlakyHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(media_input, "RESOLVE_RETRY_DELAY", 0)
+
+
+def closed_port_url() -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}/kayit.webm"
+
+
+def test_resolve_retries_transient_error(server):
+    url, needs_token = resolve_url(server + "/resolve/kayit.webm", token="t")
+    assert url == server + "/signed/kayit.webm"
+    assert not needs_token
+    assert _FlakyHandler.heads == 2
+
+
+def test_resolve_raises_oserror_after_retry():
+    with pytest.raises(OSError):
+        resolve_url(closed_port_url())
+
+
+def test_unreachable_source_is_a_failure_value(tmp_path):
+    source = RemoteMedia("kayit.webm", closed_port_url())
+    assert extract_frames.probe_duration(source) is None
+    assert transcribe_meeting.webm_to_wav_16k(source, tmp_path / "a.wav") is False
@@ -0,0 +1,33 @@
+"""
+ProvisionalReporter: yayın arka planda; kapanışta süren ve bekleyen yayın tamamlanır, fazladan yayın yapılmaz.
+"""
+import threading
+import time
+
+import progressive_report
+from progressive_report import ProvisionalReporter
+
+
+def test_close_flushes_pending_publish_without_extra(monkeypatch):
+    calls, started = [], threading.Event()
+
+    def slow_publish(upload=True):
+        calls.append(time.perf_counter())
+        started.set()
+        time.sleep(0.2)  # yükleme sürüyor
+        return True
+
+    monkeypatch.setattr(progressive_report, "publish", slow_publish)
+    reporter = ProvisionalReporter(upload=False)
+    reporter.on_video_done("ali", {})
+    started.wait(1)
+    reporter.on_video_done("ayse", {})  # yayın sürerken biten son katılımcı
+    reporter.close()
+    assert len(calls) == 2
+
+
+def test_close_without_finished_participants_publishes_nothing(monkeypatch):
+    calls = []
+    monkeypatch.setattr(progressive_report, "publish", lambda upload=True: calls.append(1))
+    ProvisionalReporter(upload=False).close()
+    assert calls == []
@@ -0,0 +1,26 @@
+"""
+generate_report_html.ineffective_segments: etkisiz dönem en az MIN_INEFFECTIVE_SEC ve en az 2 ardışık frame sürer.
+"""
+import pytest
+
+from generate_report_html import ineffective_segments
+
+LOW = {"scores": [0.4, 0.2, 0.1, 0.3]}
+HIGH = {"scores": [0.1, 0.0, 0.9, 0.0]}
+
+
+@pytest.mark.parametrize("interval, low_frames, expected", [
+    (0.5, 4, 1),  # 2 sn
+    (0.5, 3, 0),  # 1.5 sn
+    (2.0, 1, 0),  # tek frame: 2 sn'lik aralıkta da dönem değil
+    (2.0, 2, 1),
+    (0.1, 20, 1),  # 2.0 / 0.1 kayan nokta bölümü 21 frame istememeli
+    (0.1, 19, 0),
+])
+def test_min_ineffective_length(interval, low_frames, expected):
+    frames = [HIGH, *[LOW] * low_frames, HIGH]
+    segments = ineffective_segments(frames, interval)
+    assert len(segments) == expected
+    if segments:
+        assert segments[0]["start_sec"] == pytest.approx(interval)
+        assert segments[0]["duration_sec"] == pytest.approx(round(low_frames * interval, 1))
@@ -0,0 +1,30 @@
+"""
+Zaman aralıklarına bölünmüş paralel decode (extract_frames.plan_segments) tek geçişli decode
+ile aynı frame'leri üretmeli: aynı sayı, boşluksuz indeksler (indeks × FRAME_INTERVAL = zaman
+damgası) ve frame başına aynı içerik. Sabit (CFR) ve seyrek (VFR) ekran kaydı denenir;
+karşılaştırma benchmarks/bench_split_decode.py ile aynıdır.
+"""
+import pytest
+
+import extract_frames
+from bench_split_decode import compare, decode
+from conftest import needs_ffmpeg
+from fixtures import make_participant_video
+
+DURATION = 60.0
+SEGMENTS = 4
+
+
+@needs_ffmpeg
+@pytest.mark.parametrize("sparse", [False, True], ids=["cfr", "vfr"])
+def test_split_decode_matches_single_pass(tmp_path, monkeypatch, sparse):
+    monkeypatch.setattr(extract_frames, "SPLIT_MIN_DURATION", 0.0)  # kısa kayıt da bölünsün
+    monkeypatch.setattr(extract_frames, "OUTPUT_DIR", extract_frames.OUTPUT_DIR)  # decode() değiştirir
+    video = tmp_path / "kayit.webm"
+    make_participant_video(video, DURATION, seed=1, sparse=sparse)
+    assert len(extract_frames.plan_segments(extract_frames.probe_duration(video), SEGMENTS)) == SEGMENTS
+
+    _, single = decode(video, tmp_path / "single", segments=1)
+    _, split = decode(video, tmp_path / "split", segments=SEGMENTS)
+    assert single, "tek geçişli decode frame üretmedi"
+    assert compare("vfr" if sparse else "cfr", single, split) == []
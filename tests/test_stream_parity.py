@@ -0,0 +1,77 @@
+"""
+stream_pipeline.py'nin evaluation.json'u, extract_frames.py + evaluate_frames.mjs sonucuyla aynı
+olmalıdır: frame adları, sırası, skorlar, baskın etiket ve video özeti. Model stub'dır
+(tests/stub_tfjs); iki yol aynı 224×224 pikselleri (PNG veya ham rgb24) puanlar.
+"""
+import json
+import shutil
+
+from conftest import needs_node, run_script, stub_tfjs_env
+
+
+def load(path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def assert_same_evaluation(batch: dict, stream: dict) -> None:
+    assert list(stream["videos"]) == list(batch["videos"]), "video listesi / sırası farklı"
+    for name, b in batch["videos"].items():
+        s = stream["videos"][name]
+        assert s["frameCount"] == b["frameCount"], f"{name}: frame sayısı {s['frameCount']} != {b['frameCount']}"
+        for i, (fs, fb) in enumerate(zip(s["frames"], b["frames"])):
+            assert fs == fb, f"{name}: {i}. frame farklı\n stream: {fs}\n batch:  {fb}"
+        assert list(s["summary"].items()) == list(b["summary"].items()), f"{name}: özet farklı"
+    assert stream.get("frameInterval") == batch.get("frameInterval")
+
+
+@needs_node
+def test_stream_matches_batch(workdir):
+    env = stub_tfjs_env()
+    run_script(workdir, "extract_frames.py")
+    run_script(workdir, "node", "evaluate_frames.mjs", env=env)
+    batch = load(workdir / "evaluation.json")
+    assert batch["videos"] and all(v["frameCount"] for v in batch["videos"].values())
+
+    shutil.rmtree(workdir / "frames")
+    for name in ("evaluation.json", "evaluation.ndjson"):
+        (workdir / name).unlink()
+    # Küçük batch + 2 decoder: batch'ler sıra dışı puanlanır, birleştirme sırası da sınanır
+    timing = workdir / "evaluate.timing.json"
+    run_script(workdir, "stream_pipeline.py", "--batch-frames", "8", "--decode-workers", "2",
+               "--infer-workers", "2", env={**env, "SENSE_STAGE_TIMING": str(timing)})
+    assert_same_evaluation(batch, load(workdir / "evaluation.json"))
+    assert load(timing)["work_sec"] > 0  # run_pipeline verimi bu süreyle ölçer
+
+
+@needs_node
+def test_stream_resume_from_partial_log(workdir):
+    """Yarıda kesilmiş evaluation.ndjson'a --resume ile devam edilince sonuç kesintisiz çalıştırmayla aynıdır."""
+    env = stub_tfjs_env()
+    args = ("stream_pipeline.py", "--batch-frames", "8", "--decode-workers", "2", "--infer-workers", "2")
+    run_script(workdir, *args, env=env)
+    full = load(workdir / "evaluation.json")
+
+    # Çökme: ilk birkaç batch satırı + yarım kalmış bir satır; "video" / "end" satırları yok
+    log = workdir / "evaluation.ndjson"
+    lines = log.read_text(encoding="utf-8").splitlines(keepends=True)
+    kept = [ln for ln in lines if json.loads(ln)["type"] in ("header", "batch")][:4]
+    log.write_text("".join(kept) + lines[-2][:20], encoding="utf-8")
+    (workdir / "evaluation.json").unlink()
+
+    r = run_script(workdir, *args, "--resume", env=env)
+    assert "önceden puanlanmış" in r.stdout
+    assert_same_evaluation(full, load(workdir / "evaluation.json"))
+    assert log.read_text(encoding="utf-8").startswith("".join(kept))  # önceki satırlar korunup sonuna eklendi
+
+
+def test_out_of_order_batches_keep_summary_order():
+    """Sıra dışı gelen batch'lerin özeti, frame'ler bellekte tutulmadan tek geçişteki ilk görülme sırasını korur."""
+    from stream_pipeline import _VideoState, video_summary
+
+    frames = [{"dominant": d} for d in "aabcbbdca"]
+    st = _VideoState()
+    for start in (6, 3, 0):
+        batch = frames[start:start + 3]
+        st.add_batch(start, len(batch), video_summary(batch))
+    assert st.prefix == len(frames) and not st.ahead
+    assert list(st.summary.items()) == list(video_summary(frames).items())
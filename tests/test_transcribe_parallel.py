@@ -0,0 +1,118 @@
+"""
+transcribe_meeting.run_transcription: paralel dallar ([transcribe -> align] ∥ [diarize]) sıralı
+çalıştırmayla aynı transkripti üretmeli; torch thread havuzu bir kez, toplam bütçeyle ayarlanmalı.
+WhisperX / pyannote yerine girdiye bağlı deterministik sahte backend kullanılır (rastgele
+gecikmelerle dalların bitiş sırası değişir).
+"""
+import random
+import time
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import transcribe_meeting
+from vad import SAMPLE_RATE, read_wav_16k
+
+CHUNK_SEC = 2.0
+TURN_SEC = 5.0
+
+
+def write_wav(path, audio: np.ndarray) -> None:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(SAMPLE_RATE)
+        w.writeframes((np.clip(audio, -1, 1) * 32767).astype(np.int16).tobytes())
+
+
+def meeting_audio(seed: int = 0) -> np.ndarray:
+    """30 sn: 6 sn konuşma (ton) + 4 sn sessizlik, üç kez; hafif gürültü."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(6 * SAMPLE_RATE) / SAMPLE_RATE
+    speech = 0.2 * np.sin(2 * np.pi * 220 * t)
+    block = np.concatenate([speech, np.zeros(4 * SAMPLE_RATE)])
+    audio = np.tile(block, 3)
+    return (audio + rng.standard_normal(len(audio)) * 3e-4).astype(np.float32)
+
+
+def jitter():
+    time.sleep(random.uniform(0, 0.02))
+
+
+def fake_backend(thread_calls: list) -> SimpleNamespace:
+    def transcribe(audio, batch_size):
+        jitter()
+        n = int(np.ceil(len(audio) / SAMPLE_RATE / CHUNK_SEC))
+        segments = []
+        for i in range(n):
+            chunk = audio[int(i * CHUNK_SEC * SAMPLE_RATE): int((i + 1) * CHUNK_SEC * SAMPLE_RATE)]
+            end = min((i + 1) * CHUNK_SEC, len(audio) / SAMPLE_RATE)
+            segments.append({"start": i * CHUNK_SEC, "end": end, "text": f"parça {i} {float(np.abs(chunk).sum()):.3f}"})
+        return {"segments": segments, "language": "tr"}
+
+    def align(segments, model, metadata, audio, device, return_char_alignments=False):
+        jitter()
+        out = []
+        for seg in segments:
+            mid = (seg["start"] + seg["end"]) / 2
+            words = [{"word": w, "start": seg["start"] if k == 0 else mid, "end": mid if k == 0 else seg["end"]}
+                     for k, w in enumerate(seg["text"].split()[:2])]
+            out.append({**seg, "words": words})
+        return {"segments": out}
+
+    class DiarizationPipeline:
+        def __init__(self, use_auth_token=None, device=None):
+            pass
+
+        def __call__(self, audio):
+            jitter()
+            if isinstance(audio, str):
+                audio = read_wav_16k(audio)
+            total = len(audio) / SAMPLE_RATE
+            return [(t, min(total, t + TURN_SEC), f"SPEAKER_{int(t // TURN_SEC) % 2:02d}")
+                    for t in np.arange(0, total, TURN_SEC)]
+
+    def assign_word_speakers(turns, result):
+        for seg in result["segments"]:
+            for item in [seg, *seg["words"]]:
+                mid = (item["start"] + item["end"]) / 2
+                item["speaker"] = next((sp for s, e, sp in turns if s <= mid < e), turns[-1][2])
+        return result
+
+    whisperx = SimpleNamespace(
+        load_audio=lambda path: read_wav_16k(path),
+        load_model=lambda *a, **k: SimpleNamespace(transcribe=transcribe),
+        load_align_model=lambda language_code, device: (object(), {}),
+        align=align,
+    )
+    torch = SimpleNamespace(cuda=SimpleNamespace(is_available=lambda: False),
+                            set_num_threads=thread_calls.append)
+    return SimpleNamespace(torch=torch, whisperx=whisperx, DiarizationPipeline=DiarizationPipeline,
+                           assign_word_speakers=assign_word_speakers)
+
+
+def transcript(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k != "timings"}
+
+
+@pytest.mark.parametrize("use_vad", [True, False], ids=["vad", "no_vad"])
+def test_parallel_matches_sequential(tmp_path, use_vad):
+    wav = tmp_path / "meeting_audio.wav"
+    write_wav(wav, meeting_audio())
+    calls = []
+    kwargs = dict(use_vad=use_vad, asr_threads=3, diarize_threads=2, backend=fake_backend(calls))
+    sequential = transcribe_meeting.run_transcription(wav, "token", parallel=False, **kwargs)
+    assert sequential["segments"]
+    for _ in range(5):
+        parallel = transcribe_meeting.run_transcription(wav, "token", parallel=True, **kwargs)
+        assert transcript(parallel) == transcript(sequential)
+    # Süreç geneli torch havuzu her çalıştırmada bir kez, toplam bütçeyle
+    assert calls == [5] * 6
+    if use_vad:
+        assert sequential["vad"]["regions"] == 3
+        # VAD'den sonra zamanlar orijinal toplantı zamanında: her uç bir konuşma bloğunda (0-6, 10-16, 20-26 sn)
+        for seg in sequential["segments"]:
+            for t in (seg["start"], seg["end"]):
+                assert any(b - 0.3 <= t <= b + 6.3 for b in (0, 10, 20)), seg
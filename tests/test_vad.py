@@ -0,0 +1,67 @@
+"""
+vad.speech_regions: kesintisiz konuşma atlanmamalı, sessizlik konuşma sayılmamalı, duraklamalı
+konuşmada bölgeler konuşma bloklarına denk gelmeli. Sesler numpy ile üretilir (16 kHz float32).
+"""
+import numpy as np
+import pytest
+
+from vad import MIN_SPEECH_RATIO, SAMPLE_RATE, SpeechTimeline, speech_regions
+
+DURATION = 120.0
+
+
+def tone(db: float, seconds: float = DURATION, syllables: bool = False, seed: int = 0) -> np.ndarray:
+    """db dBFS civarında konuşma benzeri ses (220 Hz + harmonik); syllables: 4 Hz hece modülasyonu."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    x = np.sin(2 * np.pi * 220 * t) + 0.5 * np.sin(2 * np.pi * 440 * t)
+    if syllables:
+        x *= 0.15 + 0.85 * np.abs(np.sin(2 * np.pi * 2 * t))  # ~-16 dB çukurlar
+    x *= 10 ** (db / 20) * np.sqrt(2) / np.sqrt(np.mean(x * x) * 2)
+    return (x + noise(-65, seconds, seed)).astype(np.float32)
+
+
+def noise(db: float, seconds: float = DURATION, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * 10 ** (db / 20)).astype(np.float32)
+
+
+def timeline(audio: np.ndarray) -> SpeechTimeline:
+    return SpeechTimeline(speech_regions(audio), len(audio) / SAMPLE_RATE)
+
+
+@pytest.mark.parametrize("syllables", [False, True], ids=["steady", "syllables"])
+def test_continuous_speech_is_kept(syllables):
+    tl = timeline(tone(-20, syllables=syllables))
+    assert tl.plausible
+    assert tl.skipped_ratio < 0.05, tl.stats()
+
+
+@pytest.mark.parametrize("audio", [np.zeros(int(DURATION * SAMPLE_RATE), np.float32), noise(-70)],
+                         ids=["digital_silence", "low_noise"])
+def test_silence_has_no_speech(audio):
+    tl = timeline(audio)
+    assert tl.regions == []
+    assert not tl.plausible  # transcribe_meeting tüm sese döner
+
+
+def test_speech_with_pauses():
+    # Her 20 sn: 12 sn konuşma + 8 sn sessizlik (benchmarks/fixtures.py AUDIO_EXPR deseni)
+    speech, pause = tone(-20, 12, syllables=True), noise(-65, 8, seed=1)
+    audio = np.concatenate([np.concatenate([speech, pause]) for _ in range(int(DURATION // 20))])
+    regions = speech_regions(audio)
+    assert len(regions) == DURATION // 20
+    for i, (start, end) in enumerate(regions):
+        assert start == pytest.approx(20 * i, abs=0.3)
+        assert end == pytest.approx(20 * i + 12, abs=0.3)
+    tl = timeline(audio)
+    assert tl.plausible
+    assert tl.skipped_ratio == pytest.approx(8 / 20, abs=0.03)
+
+
+def test_implausibly_little_speech_falls_back():
+    audio = noise(-65)
+    burst = int(0.5 * SAMPLE_RATE)
+    audio[:burst] += tone(-20, 0.5)
+    tl = timeline(audio)
+    assert tl.regions and tl.speech_sec < MIN_SPEECH_RATIO * tl.total_sec
+    assert not tl.plausible
@@ -4,52 +4,78 @@ meeting_data/ içindeki toplantı ses kaydını bulur, WhisperX + pyannote ile
 konuşmacı diarizasyonu yapıp "kim ne dedi" formatında transkript üretir.
 Çıktı: meeting_transcript.json, meeting_transcript.txt
 
+Sessizlik, ekran paylaşımı boşlukları ve aralar ASR'den önce VAD (vad.py) ile atlanır;
+sadece konuşma bölgeleri transkripsiyon / hizalama / diarizasyona girer, zamanlar
+orijinal toplantı zamanına geri çevrilir. Kapatmak için: --no-vad
+
+Whisper model boyutu ve ASR batch boyutu run_plan.json'dan (scheduler.py, süre bütçesi)
+gelir; plan yoksa "base" / 16. --model ve --batch-size önceliklidir.
+
+Ağır bağımlılıklar (torch, whisperx, omegaconf) modül seviyesinde değil, sadece
+transkripsiyon gerçekten yapılacaksa yüklenir: ".webm yok" ve "token yok" kontrolleri
+bunlardan önce biter; yükleme WebM -> WAV dönüşümüyle paralel başlatılır.
+
 Gereksinimler: whisperx, torch, ffmpeg, Hugging Face token (pyannote modelleri için).
 Token: SENSEAI veya HF_TOKEN. Pyannote kullanımı için HF'de pyannote/speaker-diarization-3.1
 ve ilgili modellerin lisansını kabul etmeniz gerekir.
 """
+import argparse
+import importlib.util
 import json
 import os
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
+
+from checkpoint import planned
+from media_input import input_args, is_remote
+from media_manifest import audio_info
+from speakers import speaker_label
 
 MEETING_DATA = Path("meeting_data")
 TRANSCRIPT_JSON = Path("meeting_transcript.json")
 TRANSCRIPT_TXT = Path("meeting_transcript.txt")
 TRANSCRIPT_HTML = Path("meeting_transcript.html")
 AUDIO_WAV = Path("meeting_audio.wav")  # geçici 16kHz mono
-
-# Ses dosyası adında aranacak anahtar kelimeler (öncelik)
-AUDIO_NAME_HINTS = ("ses", "audio", "sound", "toplanti_sesi", "meeting_audio")
+WHISPER_MODEL = "base"  # CPU için hızlı; daha iyi kalite için "small" veya "medium"
+ASR_BATCH_SIZE = 16
+WHISPER_MODELS = ("tiny", "base", "small", "medium")
+WAV_TIMEOUT = 300  # yerel dosya; uzak kayıtta süre aktarım hızına bağlı, sınır yok (ffmpeg yeniden bağlanır)
 
 
 def get_token() -> str | None:
     return os.environ.get("SENSEAI") or os.environ.get("HF_TOKEN")
 
 
-def find_audio_webm() -> Path | None:
-    """Önce 'ses' içeren .webm, yoksa ilk .webm dosyasını döndürür. Alt klasörler dahil (rglob)."""
-    if not MEETING_DATA.exists():
-        return None
-    webms = sorted(MEETING_DATA.rglob("*.webm"))  # alt klasörler dahil (download altına indiriyor)
-    if not webms:
-        return None
-    for w in webms:
-        name_lower = w.name.lower()
-        if any(hint in name_lower for hint in AUDIO_NAME_HINTS):
-            return w
-    return webms[0]
-
-
-def webm_to_wav_16k(webm_path: Path, wav_path: Path) -> bool:
-    """WebM'den 16kHz mono WAV çıkarır (ffmpeg)."""
-    cmd = [
-        "ffmpeg", "-y", "-i", str(webm_path),
-        "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
-        str(wav_path),
-    ]
-    r = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+def find_audio_webm():
+    """
+    Konteyner başlığına göre sadece ses içeren .webm; yoksa ses akışı olan en uzun kayıt
+    (media_manifest.audio_info; ad ipuçları yalnızca eşitlik bozucu). Alt klasörler ve
+    download_meeting.py --stream ile yazılan uzak kayıtlar (remote_sources.json) dahil.
+    """
+    info = audio_info(MEETING_DATA)
+    return info.source if info else None
+
+
+def webm_to_wav_16k(webm_path, wav_path: Path) -> bool:
+    """WebM'den (yerel veya uzak) 16kHz mono WAV çıkarır (ffmpeg). Uzak kayıt açılamaz veya süre aşılırsa False."""
+    try:
+        cmd = [
+            "ffmpeg", "-y", *input_args(webm_path),
+            "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
+            str(wav_path),
+        ]
+        r = subprocess.run(cmd, capture_output=True, text=True,
+                           timeout=None if is_remote(webm_path) else WAV_TIMEOUT)
+    except OSError as e:
+        print(f"Ses kaydı açılamadı ({webm_path.name}):", e, file=sys.stderr)
+        return False
+    except subprocess.TimeoutExpired:
+        print(f"WAV dönüşümü {WAV_TIMEOUT} sn içinde bitmedi: {webm_path.name}", file=sys.stderr)
+        return False
     if r.returncode != 0 or not wav_path.exists():
         if r.stderr:
             print(r.stderr[-800:], file=sys.stderr)
@@ -57,59 +83,163 @@ def webm_to_wav_16k(webm_path: Path, wav_path: Path) -> bool:
     return True
 
 
-def run_transcription(wav_path: Path, hf_token: str) -> dict | None:
-    """WhisperX: transcribe -> align -> diarize -> assign_word_speakers. Dönen sonuç segments içerir."""
-    try:
-        import torch
-        # PyTorch 2.6+ weights_only=True: pyannote VAD checkpoint yüklenebilsin
-        if hasattr(torch.serialization, "add_safe_globals"):
-            import typing
-            _safe = [typing.Any]
-            try:
-                from omegaconf.listconfig import ListConfig  # type: ignore[reportMissingImports]
-                from omegaconf.dictconfig import DictConfig  # type: ignore[reportMissingImports]
-                from omegaconf.base import ContainerMetadata  # type: ignore[reportMissingImports]
-                _safe.extend([ListConfig, DictConfig, ContainerMetadata])
-            except Exception:
-                pass
-            torch.serialization.add_safe_globals(_safe)
-        import whisperx  # type: ignore[reportMissingImports]
-        from whisperx.diarize import DiarizationPipeline, assign_word_speakers  # type: ignore[reportMissingImports]
-    except ImportError as e:
-        print("HATA: whisperx veya bağımlılıkları yüklü değil:", e, file=sys.stderr)
-        print("Kurulum: pip install whisperx torch", file=sys.stderr)
-        return None
+def thread_budget(asr_threads: int | None = None, diarize_threads: int | None = None) -> tuple[int, int]:
+    """
+    CPU çekirdeklerini Whisper ve diarizasyon arasında böler (varsayılan ~⅔ / ⅓). Sadece Whisper'ın
+    payı ayrıdır (CTranslate2 threads=); torch'un intra-op havuzu süreç geneli tektir ve hizalama ile
+    pyannote bu havuzu toplam bütçeyle (asr + diarize) paylaşır.
+    """
+    cpu = os.cpu_count() or 1
+    if asr_threads is None:
+        asr_threads = max(1, cpu - (diarize_threads or max(1, cpu // 3)))
+    if diarize_threads is None:
+        diarize_threads = max(1, cpu - asr_threads)
+    return asr_threads, diarize_threads
+
+
+def backend_available() -> bool:
+    """whisperx ve torch kurulu mu? (import etmeden, sadece modül araması)"""
+    return all(importlib.util.find_spec(name) is not None for name in ("torch", "whisperx"))
+
+
+def load_backend() -> SimpleNamespace:
+    """torch + whisperx (+ omegaconf güvenli global kaydı). Birkaç saniye sürer; ImportError fırlatabilir."""
+    import torch
+    # PyTorch 2.6+ weights_only=True: pyannote VAD checkpoint yüklenebilsin
+    if hasattr(torch.serialization, "add_safe_globals"):
+        import typing
+        _safe = [typing.Any]
+        try:
+            from omegaconf.listconfig import ListConfig  # type: ignore[reportMissingImports]
+            from omegaconf.dictconfig import DictConfig  # type: ignore[reportMissingImports]
+            from omegaconf.base import ContainerMetadata  # type: ignore[reportMissingImports]
+            _safe.extend([ListConfig, DictConfig, ContainerMetadata])
+        except Exception:
+            pass
+        torch.serialization.add_safe_globals(_safe)
+    import whisperx  # type: ignore[reportMissingImports]
+    from whisperx.diarize import DiarizationPipeline, assign_word_speakers  # type: ignore[reportMissingImports]
+    return SimpleNamespace(torch=torch, whisperx=whisperx, DiarizationPipeline=DiarizationPipeline,
+                           assign_word_speakers=assign_word_speakers)
+
+
+def run_transcription(wav_path: Path, hf_token: str, use_vad: bool = True,
+                      asr_threads: int | None = None, diarize_threads: int | None = None,
+                      backend: SimpleNamespace | None = None, model_size: str = WHISPER_MODEL,
+                      batch_size: int = ASR_BATCH_SIZE, parallel: bool = True) -> dict | None:
+    """
+    WhisperX: (VAD) -> [transcribe -> align] ∥ [diarize] -> assign_word_speakers.
+    ASR+hizalama dalı ile diarizasyon dalı paralel çalışır (parallel=False: sırayla; sonuç aynıdır).
+    Whisper asr_threads ile sınırlanır; torch havuzu (hizalama + pyannote) bir kez toplam bütçeye ayarlanır.
+    backend: önceden yüklenmiş load_backend() sonucu (yoksa burada yüklenir).
+    Dönen sonuç segments ve dal süreleri ("timings") içerir; VAD açıksa "vad" istatistiklerini de.
+    """
+    if backend is None:
+        try:
+            backend = load_backend()
+        except ImportError as e:
+            print("HATA: whisperx veya bağımlılıkları yüklü değil:", e, file=sys.stderr)
+            print("Kurulum: pip install whisperx torch", file=sys.stderr)
+            return None
+    torch, whisperx = backend.torch, backend.whisperx
+    DiarizationPipeline, assign_word_speakers = backend.DiarizationPipeline, backend.assign_word_speakers
 
     device = "cuda" if torch.cuda.is_available() else "cpu"
     compute_type = "float16" if device == "cuda" else "int8"
-    model_size = "base"  # CPU için hızlı; daha iyi kalite için "small" veya "medium"
+    asr_threads, diarize_threads = thread_budget(asr_threads, diarize_threads)
 
     print("Ses yükleniyor...")
     audio = whisperx.load_audio(str(wav_path))
 
-    print("Whisper modeli yükleniyor ve transkripsiyon yapılıyor...")
-    model = whisperx.load_model(model_size, device, compute_type=compute_type)
-    result = model.transcribe(audio, batch_size=16)
-    del model
-    if getattr(torch, "cuda", None) and torch.cuda.is_available():
-        torch.cuda.empty_cache()
-
-    language = result.get("language", "tr")
-    print("Dil:", language, "- Hizalama yapılıyor...")
-
-    model_a, metadata = whisperx.load_align_model(language_code=language, device=device)
-    result = whisperx.align(
-        result["segments"], model_a, metadata, audio, device, return_char_alignments=False
-    )
-    del model_a
-    if getattr(torch, "cuda", None) and torch.cuda.is_available():
-        torch.cuda.empty_cache()
-
-    print("Konuşmacı diarizasyonu yapılıyor (pyannote)...")
-    diarize_model = DiarizationPipeline(use_auth_token=hf_token, device=device)
-    diarize_df = diarize_model(str(wav_path))
+    timeline = None
+    vad_fallback = None
+    if use_vad:
+        from vad import SAMPLE_RATE, SpeechTimeline, speech_regions
+
+        timeline = SpeechTimeline(speech_regions(audio), len(audio) / SAMPLE_RATE)
+        st = timeline.stats()
+        print(f"VAD: {st['regions']} konuşma bölgesi, {st['speech_sec']} / {st['total_sec']} sn işlenecek "
+              f"(atlanan oran: %{100 * st['skipped_ratio']:.1f})")
+        if timeline.plausible:
+            audio = timeline.compact(audio)
+        else:
+            # Duraklamasız / eşiği şaşırtan kayıtta boş transkript yerine tüm ses işlenir
+            print("UYARI: VAD konuşma bulamadı veya çok az buldu; tüm ses işlenecek.")
+            vad_fallback = {**st, "speech_sec": st["total_sec"], "skipped_sec": 0.0, "skipped_ratio": 0.0,
+                            "detected_speech_sec": st["speech_sec"], "fallback": "full_audio"}
+            timeline = None
+
+    timings: dict[str, float] = {}
+
+    def empty_cache():
+        if getattr(torch, "cuda", None) and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def asr_branch() -> dict:
+        # Whisper (CTranslate2) kendi thread sayısıyla; hizalama paylaşılan torch havuzunda
+        t0 = time.perf_counter()
+        print(f"Whisper modeli ({model_size}) yükleniyor ve transkripsiyon yapılıyor "
+              f"({asr_threads} thread, batch {batch_size})...")
+        model = whisperx.load_model(model_size, device, compute_type=compute_type, threads=asr_threads)
+        result = model.transcribe(audio, batch_size=batch_size)
+        del model
+        empty_cache()
+        timings["asr_sec"] = time.perf_counter() - t0
+
+        language = result.get("language", "tr")
+        print("Dil:", language, "- Hizalama yapılıyor...")
+        t0 = time.perf_counter()
+        model_a, metadata = whisperx.load_align_model(language_code=language, device=device)
+        result = whisperx.align(
+            result["segments"], model_a, metadata, audio, device, return_char_alignments=False
+        )
+        del model_a
+        empty_cache()
+        timings["align_sec"] = time.perf_counter() - t0
+        return result
+
+    def diarize_branch():
+        # Diarizasyon transkripte değil sadece sese ihtiyaç duyar: ASR ile paralel çalışır
+        t0 = time.perf_counter()
+        print("Konuşmacı diarizasyonu yapılıyor (pyannote)...")
+        diarize_model = DiarizationPipeline(use_auth_token=hf_token, device=device)
+        # VAD açıksa diarizasyon da sıkıştırılmış ses üzerinde (ASR ile aynı zaman çizelgesi)
+        diarize_df = diarize_model(audio if timeline else str(wav_path))
+        timings["diarize_sec"] = time.perf_counter() - t0
+        return diarize_df
+
+    # set_num_threads süreç geneldir: dallarda ayrı ayrı çağrılırsa son çağrı ikisini birden belirler
+    torch.set_num_threads(asr_threads + diarize_threads)
+    t0 = time.perf_counter()
+    if parallel:
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="transcribe") as pool:
+            diarize_future = pool.submit(diarize_branch)
+            asr_future = pool.submit(asr_branch)
+            result = asr_future.result()
+            diarize_df = diarize_future.result()
+    else:
+        result = asr_branch()
+        diarize_df = diarize_branch()
     result = assign_word_speakers(diarize_df, result)
-
+    timings["wall_sec"] = time.perf_counter() - t0
+
+    branch_sum = timings["asr_sec"] + timings["align_sec"] + timings["diarize_sec"]
+    print(f"Süreler: ASR {timings['asr_sec']:.1f} sn + hizalama {timings['align_sec']:.1f} sn | "
+          f"diarizasyon {timings['diarize_sec']:.1f} sn | duvar {timings['wall_sec']:.1f} sn "
+          f"(sıralı toplam {branch_sum:.1f} sn)")
+    result["timings"] = {
+        **{k: round(v, 2) for k, v in timings.items()},
+        "asr_threads": asr_threads,
+        "diarize_threads": diarize_threads,
+        "model": model_size,
+        "batch_size": batch_size,
+    }
+
+    if timeline:
+        timeline.remap_result(result)
+        result["vad"] = timeline.stats()
+    elif vad_fallback:
+        result["vad"] = vad_fallback
     return result
 
 
@@ -135,24 +265,16 @@ def format_time(sec: float) -> str:
     return f"{m:02d}:{s:02d}"
 
 
-def speaker_label(speaker: str) -> str:
-    """SPEAKER_00 -> Konuşmacı 1, SPEAKER_01 -> Konuşmacı 2."""
-    if not speaker:
-        return "Bilinmeyen"
-    try:
-        num = int(speaker.replace("SPEAKER_", "")) + 1
-        return f"Konuşmacı {num}"
-    except Exception:
-        return speaker
-
-
 def escape_html(s: str) -> str:
     return (s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;") if s else "")
 
 
-def write_outputs(segments: list[dict]) -> None:
-    """meeting_transcript.json, meeting_transcript.txt ve meeting_transcript.html yazar."""
-    data = {"segments": segments, "format": "kim ne dedi"}
+def write_outputs(segments: list[dict], stats: dict | None = None) -> None:
+    """
+    meeting_transcript.json, meeting_transcript.txt ve meeting_transcript.html yazar.
+    stats: JSON'a eklenecek çalışma istatistikleri (vad, timings).
+    """
+    data = {"segments": segments, "format": "kim ne dedi", **(stats or {})}
     TRANSCRIPT_JSON.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
     print("Yazıldı:", TRANSCRIPT_JSON)
 
@@ -196,9 +318,22 @@ def write_outputs(segments: list[dict]) -> None:
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Toplantı sesinden 'kim ne dedi' transkripti üretir.")
+    parser.add_argument("--no-vad", action="store_true", help="Sessizlik ön filtresini kapat (tüm ses ASR'e gider)")
+    parser.add_argument("--asr-threads", type=int, help="Whisper (CTranslate2) thread sayısı")
+    parser.add_argument("--diarize-threads", type=int,
+                        help="Diarizasyon payı; torch havuzu (hizalama + pyannote) asr + diarize thread'iyle çalışır")
+    parser.add_argument("--sequential", action="store_true",
+                        help="ASR ve diarizasyon dallarını sırayla çalıştır (karşılaştırma için; çıktı aynıdır)")
+    parser.add_argument("--model", choices=WHISPER_MODELS, default=planned("whisper_model", WHISPER_MODEL),
+                        help="Whisper model boyutu (varsayılan: run_plan.json veya base)")
+    parser.add_argument("--batch-size", type=int, default=planned("asr_batch_size", ASR_BATCH_SIZE),
+                        help="Whisper batch boyutu (varsayılan: run_plan.json veya 16)")
+    args = parser.parse_args()
+
     webm = find_audio_webm()
     if not webm:
-        print("meeting_data/ içinde .webm dosyası bulunamadı. Transkripsiyon atlanıyor.")
+        print("meeting_data/ içinde ses akışı olan .webm bulunamadı. Transkripsiyon atlanıyor.")
         return 0
 
     token = get_token()
@@ -206,13 +341,32 @@ def main() -> int:
         print("HATA: SENSEAI veya HF_TOKEN ortam değişkeni gerekli (pyannote için).", file=sys.stderr)
         return 1
 
+    if not backend_available():
+        print("HATA: whisperx veya torch yüklü değil. Kurulum: pip install whisperx torch", file=sys.stderr)
+        return 1
+
     print("Ses kaynağı:", webm.name)
-    if not webm_to_wav_16k(webm, AUDIO_WAV):
+    # torch/whisperx importu (birkaç sn) ffmpeg dönüşümüyle üst üste biner
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="backend") as pool:
+        backend_future = pool.submit(load_backend)
+        converted = webm_to_wav_16k(webm, AUDIO_WAV)
+        try:
+            backend = backend_future.result()
+        except ImportError as e:
+            print("HATA: whisperx veya bağımlılıkları yüklü değil:", e, file=sys.stderr)
+            backend = None
+    if not converted:
         print("HATA: WebM -> WAV dönüşümü başarısız.", file=sys.stderr)
         return 1
+    if backend is None:
+        AUDIO_WAV.unlink(missing_ok=True)
+        return 1
 
     try:
-        result = run_transcription(AUDIO_WAV, token)
+        result = run_transcription(AUDIO_WAV, token, use_vad=not args.no_vad,
+                                   asr_threads=args.asr_threads, diarize_threads=args.diarize_threads,
+                                   backend=backend, model_size=args.model, batch_size=args.batch_size,
+                                   parallel=not args.sequential)
     finally:
         if AUDIO_WAV.exists():
             AUDIO_WAV.unlink()
@@ -225,7 +379,7 @@ def main() -> int:
         print("Transkript boş (segment yok).")
         return 0
 
-    write_outputs(segments)
+    write_outputs(segments, {k: result[k] for k in ("vad", "timings") if k in result})
     return 0
 
 
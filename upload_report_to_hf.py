@@ -2,13 +2,16 @@
 """
 Üretilen toplantı raporlarını (meeting_report.md, meeting_report.html) HF'deki
 analiz edilen toplantı klasörüne yükler: toplanti_raporu.md, toplanti_raporu.html
+
+progressive_report.py'nin yüklediği ön toplanti_raporu.html aynı adla üzerine yazılır;
+HTML rapor yüklenince son rapor süresi report_timing.json'a kaydedilir.
 """
 import json
 import os
 import sys
 from pathlib import Path
 
-from huggingface_hub import HfApi
+from checkpoint import record_report_time
 
 REPO_ID = "Caner7/Sense-AI"
 MEETINGS_FOLDER = "Toplantı Kayıtları"
@@ -19,6 +22,7 @@ UPLOADS = [
     (Path("meeting_transcript.json"), "toplanti_transkripti.json"),
     (Path("meeting_transcript.txt"), "toplanti_transkripti.txt"),
     (Path("meeting_transcript.html"), "toplanti_transkripti.html"),
+    (Path("meeting_engagement.json"), "toplanti_konusma_ilgi.json"),
 ]
 
 
@@ -26,6 +30,28 @@ def get_token():
     return os.environ.get("SENSEAI") or os.environ.get("HF_TOKEN")
 
 
+def upload_files(pending: list[tuple[Path, str]], latest_folder: str, token: str) -> list[str]:
+    """(yerel dosya, HF'deki ad) çiftlerini toplantı klasörüne yükler; başarısız olanların adlarını döner."""
+    from huggingface_hub import HfApi
+
+    api = HfApi(token=token)
+    failed = []
+    for local_path, filename in pending:
+        path_in_repo = f"{MEETINGS_FOLDER}/{latest_folder}/{filename}"
+        try:
+            api.upload_file(
+                path_or_fileobj=str(local_path),
+                path_in_repo=path_in_repo,
+                repo_id=REPO_ID,
+                repo_type="dataset",
+            )
+            print("Yüklendi:", path_in_repo)
+        except Exception as e:
+            print(f"HATA yükleme {path_in_repo}: {e}", file=sys.stderr)
+            failed.append(filename)
+    return failed
+
+
 def main():
     if not LATEST_MEETING_JSON.exists():
         print("HATA: latest_meeting.json bulunamadı.", file=sys.stderr)
@@ -41,28 +67,23 @@ def main():
         print("HATA: SENSEAI veya HF_TOKEN ortam değişkeni gerekli.", file=sys.stderr)
         return 1
 
-    print(f"Hedef: {REPO_ID} (dataset) -> {MEETINGS_FOLDER}/{latest_folder}/")
-    api = HfApi(token=token)
-    uploaded = 0
-    failed = 0
+    pending = []
     for local_path, filename in UPLOADS:
-        path_in_repo = f"{MEETINGS_FOLDER}/{latest_folder}/{filename}"
-        if not local_path.exists():
+        if local_path.exists():
+            pending.append((local_path, filename))
+        else:
             print(f"Atlandı (dosya yok): {local_path.name}")
-            continue
-        try:
-            api.upload_file(
-                path_or_fileobj=str(local_path),
-                path_in_repo=path_in_repo,
-                repo_id=REPO_ID,
-                repo_type="dataset",
-            )
-            print("Yüklendi:", path_in_repo)
-            uploaded += 1
-        except Exception as e:
-            print(f"HATA yükleme {path_in_repo}: {e}", file=sys.stderr)
-            failed += 1
-    print(f"Özet: {uploaded} yüklendi, {failed} hata.")
+    if not pending:
+        print("Yüklenecek dosya yok.")
+        return 0
+
+    print(f"Hedef: {REPO_ID} (dataset) -> {MEETINGS_FOLDER}/{latest_folder}/")
+    failed = upload_files(pending, latest_folder, token)
+    if any(f == "toplanti_raporu.html" for _, f in pending) and "toplanti_raporu.html" not in failed:
+        timing = record_report_time("final")
+        if timing:
+            print(f"Son rapor: pipeline başlangıcından {timing['final_report_sec']:.0f} sn sonra")
+    print(f"Özet: {len(pending) - len(failed)} yüklendi, {len(failed)} hata.")
     return 1 if failed else 0
 
 
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Hafif, CPU üzerinde çalışan enerji tabanlı ses aktivitesi tespiti (VAD).
+
+transcribe_meeting.py, 16 kHz mono ses tamponundaki konuşma bölgelerini bulur;
+sadece bu bölgeler birleştirilip Whisper / hizalama / diarizasyona gönderilir.
+SpeechTimeline, birleştirilmiş (sıkıştırılmış) zaman çizelgesindeki zamanları
+orijinal toplantı zamanına geri çevirir.
+
+Eşik enerji dağılımının alt (gürültü) ve üst (konuşma) yüzdelikleri arasından seçilir.
+İkisi arasında belirgin fark yoksa kayıtta duraklama yoktur: kesintisiz konuşma tümüyle,
+mutlak sessizlik seviyesinin altındaki kayıt hiç konuşma sayılmaz. VAD hiç bölge veya
+makul olmayacak kadar az konuşma bulursa (SpeechTimeline.plausible) transcribe_meeting.py
+tüm sesi ASR'e gönderir.
+
+Tek başına: python vad.py meeting_audio.wav  -> konuşma bölgeleri ve atlanan oran
+"""
+import bisect
+import sys
+import wave
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+FRAME_SEC = 0.03  # 30 ms analiz penceresi
+# Eşik: gürültü tabanının (enerji dağılımının alt yüzdeliği) MARGIN_DB üstü konuşma sayılır; gürültü
+# ile konuşma seviyesi (üst yüzdelik) arası daha darsa eşik bu aralığın ortasına iner
+NOISE_PERCENTILE = 10
+SPEECH_PERCENTILE = 90
+MARGIN_DB = 12.0
+MIN_DYNAMIC_DB = 6.0  # alt-üst yüzdelik farkı bundan azsa duraklama yok: sadece mutlak eşik uygulanır
+ABS_MIN_DB = -55.0  # dBFS; bunun altı her zaman sessizlik
+MIN_SPEECH_RATIO = 0.02  # bulunan konuşma bundan azsa VAD sonucu güvenilmez (tüm ses işlenir)
+MIN_SPEECH_SEC = 0.25  # daha kısa patlamalar (tık, çarpma) atılır
+MIN_SILENCE_SEC = 0.8  # daha kısa duraklamalar konuşmanın parçası sayılır
+PAD_SEC = 0.2  # bölge kenarlarına eklenen pay (kelime başı/sonu kırpılmasın)
+
+
+def frame_db(audio: np.ndarray, sr: int = SAMPLE_RATE) -> np.ndarray:
+    """30 ms pencerelerin RMS enerjisi (dBFS)."""
+    hop = int(sr * FRAME_SEC)
+    n = len(audio) // hop
+    if n == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = audio[: n * hop].astype(np.float32).reshape(n, hop)
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    return 20 * np.log10(np.maximum(rms, 1e-10))
+
+
+def speech_regions(audio: np.ndarray, sr: int = SAMPLE_RATE) -> list[tuple[float, float]]:
+    """Konuşma bölgeleri [(başlangıç_sn, bitiş_sn), ...], sıralı ve örtüşmesiz."""
+    db = frame_db(audio, sr)
+    if not len(db):
+        return []
+    noise, level = (float(v) for v in np.percentile(db, [NOISE_PERCENTILE, SPEECH_PERCENTILE]))
+    if level - noise < MIN_DYNAMIC_DB:
+        threshold = ABS_MIN_DB  # kesintisiz konuşma / gürültü ya da tamamen sessiz kayıt
+    else:
+        threshold = max(noise + min(MARGIN_DB, (level - noise) / 2), ABS_MIN_DB)
+    active = db > threshold
+    if not active.any():
+        return []
+    # Aktif pencere dizilerinin sınırları
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], active.astype(np.int8), [0]))))
+    runs = [(edges[i] * FRAME_SEC, edges[i + 1] * FRAME_SEC) for i in range(0, len(edges), 2)]
+
+    merged: list[list[float]] = []
+    for start, end in runs:
+        if merged and start - merged[-1][1] < MIN_SILENCE_SEC:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end])
+
+    duration = len(audio) / sr
+    out: list[tuple[float, float]] = []
+    for start, end in merged:
+        if end - start < MIN_SPEECH_SEC:
+            continue
+        start, end = max(0.0, start - PAD_SEC), min(duration, end + PAD_SEC)
+        if out and start <= out[-1][1]:
+            out[-1] = (out[-1][0], end)
+        else:
+            out.append((start, end))
+    return out
+
+
+class SpeechTimeline:
+    """Konuşma bölgelerini art arda ekleyen sıkıştırılmış zaman çizelgesi ve orijinale dönüşüm."""
+
+    def __init__(self, regions: list[tuple[float, float]], total_sec: float, sr: int = SAMPLE_RATE):
+        self.sr = sr
+        self.total_sec = total_sec
+        # Örnek sınırına yuvarlanmış bölgeler: compact() ile to_original() aynı ofsetleri kullanır
+        self.regions = [(round(s * sr), round(e * sr)) for s, e in regions]
+        self.compact_starts = []
+        pos = 0
+        for s, e in self.regions:
+            self.compact_starts.append(pos)
+            pos += e - s
+        self.speech_samples = pos
+
+    @property
+    def speech_sec(self) -> float:
+        return self.speech_samples / self.sr
+
+    @property
+    def plausible(self) -> bool:
+        """VAD sonucu kullanılabilir mi? Hiç bölge yoksa veya konuşma oranı MIN_SPEECH_RATIO altındaysa hayır."""
+        return bool(self.regions) and self.speech_sec >= MIN_SPEECH_RATIO * self.total_sec
+
+    @property
+    def skipped_ratio(self) -> float:
+        return 1 - self.speech_sec / self.total_sec if self.total_sec else 0.0
+
+    def compact(self, audio: np.ndarray) -> np.ndarray:
+        """Sadece konuşma bölgelerini art arda birleştirir."""
+        if not self.regions:
+            return audio[:0]
+        return np.concatenate([audio[s:e] for s, e in self.regions])
+
+    def to_original(self, t: float, is_end: bool = False) -> float:
+        """
+        Sıkıştırılmış zaman çizelgesindeki t (sn) -> orijinal toplantı zamanı (sn).
+        İki bölgenin birleşim noktası, bitiş zamanı için önceki bölgenin sonuna,
+        başlangıç zamanı için sonraki bölgenin başına eşlenir.
+        """
+        if not self.regions:
+            return t
+        sample = t * self.sr
+        find = bisect.bisect_left if is_end else bisect.bisect_right
+        i = max(0, find(self.compact_starts, sample) - 1)
+        s, e = self.regions[i]
+        return min(e, s + sample - self.compact_starts[i]) / self.sr
+
+    def remap_result(self, result: dict) -> dict:
+        """WhisperX sonucundaki segment ve kelime zamanlarını orijinal zamana çevirir (yerinde)."""
+        for seg in result.get("segments") or []:
+            for item in [seg, *(seg.get("words") or [])]:
+                for key in ("start", "end"):
+                    if isinstance(item.get(key), (int, float)):
+                        item[key] = self.to_original(item[key], is_end=key == "end")
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "total_sec": round(self.total_sec, 2),
+            "speech_sec": round(self.speech_sec, 2),
+            "skipped_sec": round(self.total_sec - self.speech_sec, 2),
+            "skipped_ratio": round(self.skipped_ratio, 4),
+            "regions": len(self.regions),
+        }
+
+
+def read_wav_16k(path: str) -> np.ndarray:
+    """16 kHz mono PCM16 WAV -> float32 [-1, 1] (whisperx.load_audio ile aynı ölçek)."""
+    with wave.open(path, "rb") as w:
+        if w.getframerate() != SAMPLE_RATE or w.getnchannels() != 1 or w.getsampwidth() != 2:
+            raise ValueError("16 kHz mono PCM16 WAV bekleniyor")
+        raw = w.readframes(w.getnframes())
+    return np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def main() -> int:
+    if len(sys.argv) != 2:
+        print("Kullanım: python vad.py <16kHz_mono.wav>", file=sys.stderr)
+        return 1
+    audio = read_wav_16k(sys.argv[1])
+    timeline = SpeechTimeline(speech_regions(audio), len(audio) / SAMPLE_RATE)
+    for (s, e) in timeline.regions:
+        print(f"{s / SAMPLE_RATE:9.2f} - {e / SAMPLE_RATE:9.2f} sn")
+    st = timeline.stats()
+    print(f"Konuşma: {st['speech_sec']} / {st['total_sec']} sn, atlanan oran: %{100 * st['skipped_ratio']:.1f}")
+    if not timeline.plausible:
+        print("UYARI: konuşma bulunamadı veya çok az; transcribe_meeting.py tüm sesi işler.")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())